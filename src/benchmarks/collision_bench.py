@@ -0,0 +1,86 @@
+"""
+Per-object collision loop vs the vectorized CollisionBatch kernel.
+
+Run from the /src/ directory:
+    python -m benchmarks.collision_bench
+"""
+import random
+import time
+
+import pygame
+
+from core import PhysicsEngine, CollisionBatch
+from entities import RectObstacle, Coin
+
+
+SIZES = [10, 100, 1_000, 10_000]
+REPEATS = 200
+
+
+def _build(n: int, screen: pygame.Surface):
+    rng = random.Random(n)
+    lethal = []
+    solid = []
+    coins = []
+    for _ in range(n):
+        x = rng.randint(0, 1280)
+        y = rng.randint(0, 720)
+        obs = RectObstacle(
+            pygame.Rect(x, y, rng.randint(20, 180), rng.randint(20, 300)),
+            lethal=rng.random() < 0.5,
+        )
+        (lethal if obs.lethal else solid).append(obs)
+        coins.append(Coin(pygame.Vector2(x, y), radius=13))
+    return lethal, solid, coins
+
+
+def _loop(engine: PhysicsEngine, center, radius, lethal, solid, coins):
+    hit_lethal = [o for o in lethal if engine._circToRectCol(center, radius, o.getHitbox())]
+    hit_solid = [o for o in solid if engine._circToRectCol(center, radius, o.getHitbox())]
+    got = []
+    for coin in coins:
+        c, r = coin.getHitbox()
+        dx = center.x - c.x
+        dy = center.y - c.y
+        if dx * dx + dy * dy < (radius + r) * (radius + r):
+            got.append(coin)
+    return hit_lethal, hit_solid, got
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - t0) / REPEATS * 1e6
+
+
+def main() -> None:
+    if not CollisionBatch.available():
+        print("NumPy is not installed - nothing to compare against")
+        return
+
+    screen = pygame.Surface((1, 1))
+    engine = PhysicsEngine(screen=screen)
+    center = pygame.Vector2(640, 360)
+    radius = 35.0
+
+    print(f"{'entities':>9} | {'loop (us)':>10} | {'load+test (us)':>14} | {'test only (us)':>14}")
+    print("-" * 58)
+
+    for n in SIZES:
+        lethal, solid, coins = _build(n, screen)
+        batch = CollisionBatch()
+
+        def batched():
+            batch.load(lethal, solid, coins)
+            batch.test(center, radius)
+
+        loop_us = _time(lambda: _loop(engine, center, radius, lethal, solid, coins))
+        full_us = _time(batched)
+        test_us = _time(lambda: batch.test(center, radius))
+
+        print(f"{2 * n:>9} | {loop_us:>10.1f} | {full_us:>14.1f} | {test_us:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
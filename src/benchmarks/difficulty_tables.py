@@ -0,0 +1,19 @@
+"""
+Every spawner's compiled difficulty table (one row per tier), for tuning review.
+
+Run from the /src/ directory:
+    python -m benchmarks.difficulty_tables
+"""
+from gameplay.spawners.spikes_spawner import spikesDifficulty
+from gameplay.spawners.tunnel_spawner import tunnelDifficulty
+from gameplay.spawners.beams_spawner import beamsDifficulty
+
+
+def main() -> None:
+    for table in (spikesDifficulty(), tunnelDifficulty(), beamsDifficulty()):
+        print(table.dump())
+        print()
+
+
+if __name__ == "__main__":
+    main()
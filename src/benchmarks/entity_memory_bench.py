@@ -0,0 +1,136 @@
+"""
+Memory per entity and attribute-read speed: the slotted entity classes vs
+the same classes with a per-instance __dict__ (the old layout, including
+a per-instance screen reference and RectObstacle's own edge set).
+
+Run from the /src/ directory:
+    python -m benchmarks.entity_memory_bench
+"""
+import time
+import tracemalloc
+
+import pygame
+
+from entities import RectObstacle, HazardPatch, Coin, Pipe, MineCart
+from gameplay.spawners.spikes_spawner import Fireball
+
+
+COUNT = 5_000
+READS = 200
+# Read timings are the best of this many runs (they're noisy)
+ROUNDS = 7
+
+
+def _unslotted(cls):
+    """
+    Copy of 'cls' without __slots__ - instances get a __dict__ again and
+    carry their own screen / edge set like before.
+    """
+    slots = set(cls.__slots__)
+    namespace = {
+        k: v for k, v in vars(cls).items()
+        if k not in slots and k not in ("__slots__", "__dict__", "__weakref__")
+    }
+
+    init = cls.__init__
+
+    def __init__(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        self.screen = cls.screen
+        edges = getattr(self, "lethal_edges", None)
+        if edges is not None:
+            self.lethal_edges = set(edges)
+
+    namespace["__init__"] = __init__
+    return type(f"Dict{cls.__name__}", (), namespace)
+
+
+def _factories(sprite: pygame.Surface):
+    # name -> (class, kwargs builder, attributes read in the hot loop)
+    return {
+        "RectObstacle": (
+            RectObstacle,
+            lambda i: dict(rect=pygame.Rect(i, 300, 40, 60)),
+            ("rect", "lethal"),
+        ),
+        "HazardPatch": (
+            HazardPatch,
+            lambda i: dict(rect=pygame.Rect(i, 690, 400, 30)),
+            ("rect", "color"),
+        ),
+        "Coin": (
+            Coin,
+            lambda i: dict(pos=pygame.Vector2(i, 300), radius=13),
+            ("pos", "collected"),
+        ),
+        "Pipe": (
+            Pipe,
+            lambda i: dict(
+                orientation="bottom",
+                sprite=sprite,
+                curr_pos=pygame.Vector2(i, 500),
+            ),
+            ("curr_pos", "width"),
+        ),
+        "MineCart": (
+            MineCart,
+            lambda i: dict(rect=pygame.Rect(i, 600, 70, 36), velocity=150.0),
+            ("x", "rect"),
+        ),
+        "Fireball": (
+            Fireball,
+            lambda i: dict(x=float(i), lava_top_y=690.0),
+            ("x", "y"),
+        ),
+    }
+
+
+def _bytesPerEntity(cls, build) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entities = [cls(**build(i)) for i in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    del entities
+    return allocated / COUNT
+
+
+def _readNs(entities: list, attrs: tuple[str, str]) -> float:
+    a, b = attrs
+    # Plain attribute syntax, as the game does it
+    reader = eval(f"lambda es: [(e.{a}, e.{b}) for e in es]")
+
+    best = float("inf")
+    for _ in range(ROUNDS):
+        t0 = time.perf_counter()
+        for _ in range(READS // ROUNDS):
+            reader(entities)
+        best = min(best, time.perf_counter() - t0)
+    return best / ((READS // ROUNDS) * len(entities) * 2) * 1e9
+
+
+def main() -> None:
+    screen = pygame.Surface((1280, 720))
+    sprite = pygame.Surface((110, 125))
+    for cls in (RectObstacle, HazardPatch, Coin, Pipe, MineCart, Fireball):
+        cls.bind(screen)
+
+    print(f"{'entity':>12} | {'dict (B)':>9} | {'slots (B)':>9} | {'dict read (ns)':>14} | {'slots read (ns)':>15}")
+    print("-" * 72)
+
+    for name, (cls, build, attrs) in _factories(sprite).items():
+        legacy = _unslotted(cls)
+
+        dict_bytes = _bytesPerEntity(legacy, build)
+        slot_bytes = _bytesPerEntity(cls, build)
+
+        dict_ns = _readNs([legacy(**build(i)) for i in range(COUNT)], attrs)
+        slot_ns = _readNs([cls(**build(i)) for i in range(COUNT)], attrs)
+
+        print(f"{name:>12} | {dict_bytes:>9.0f} | {slot_bytes:>9.0f} | {dict_ns:>14.1f} | {slot_ns:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
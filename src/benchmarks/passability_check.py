@@ -0,0 +1,70 @@
+"""
+Batch passability check: generates sections of every type across the
+difficulty tiers and runs each through the PassabilityVerifier. Prints the
+blocked ones and exits with status 1 if there were any.
+
+Run from the /src/ directory:
+    python -m benchmarks.passability_check
+"""
+import sys
+import time
+
+import pygame
+
+from gameplay.section_manager import SectionManager
+from gameplay.passability import PassabilityVerifier
+from gameplay.run_random import RUN_RANDOM
+
+
+TIERS = [0, 3, 6, 10, 15, 20, 30, 40]
+SECTIONS_PER_TIER = 10
+DURATION = 10.0
+WORLD_SPEED = 520.0
+SEED = 1
+
+
+def main() -> None:
+    pygame.init()
+    # Spawners load their sprites with convert_alpha() => needs a display
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    screen = pygame.Surface((1280, 720))
+
+    RUN_RANDOM.fixSeed(SEED)
+    manager = SectionManager(screen)
+    verifier = PassabilityVerifier(screen)
+
+    blocked = 0
+    for section_type in SectionManager.SECTION_TYPES:
+        print(f"{section_type}")
+        for tier in TIERS:
+            passed = 0
+            gen_s = check_s = 0.0
+            for n in range(SECTIONS_PER_TIER):
+                t0 = time.perf_counter()
+                bp = manager._runSpawner(section_type, tier, DURATION, WORLD_SPEED, 0.0)
+                t1 = time.perf_counter()
+                result = verifier.verify(bp, WORLD_SPEED)
+                gen_s += t1 - t0
+                check_s += time.perf_counter() - t1
+
+                if result:
+                    passed += 1
+                else:
+                    print(f"    tier {tier:>2} #{n}: {result!r}")
+
+            blocked += SECTIONS_PER_TIER - passed
+            print(
+                f"  tier {tier:>2}: {passed:>2}/{SECTIONS_PER_TIER} passable"
+                f" | generate {gen_s / SECTIONS_PER_TIER * 1000:6.1f} ms"
+                f" | verify {check_s / SECTIONS_PER_TIER * 1000:6.1f} ms"
+            )
+
+    manager.close()
+
+    print()
+    print(f"blocked sections: {blocked}")
+    sys.exit(1 if blocked else 0)
+
+
+if __name__ == "__main__":
+    main()
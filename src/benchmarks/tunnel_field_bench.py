@@ -0,0 +1,135 @@
+"""
+List-shifting tunnel field (pop(0) + append per sample) vs TunnelField in
+both of its layouts (shifted list / ring buffer - it picks one by sample
+count), plus per-x floor lookups vs one vectorized floor_y_at() call.
+
+Run from the /src/ directory:
+    python -m benchmarks.tunnel_field_bench
+"""
+import math
+import random
+import time
+
+from gameplay.tunnel_field import TunnelField, np
+
+
+SCREEN_W = 1280
+SCREEN_H = 720
+
+# Sample spacing in px (the game uses 4; 1 = a finer field, 4x the samples)
+STEPS = [4, 1]
+
+# Pixels scrolled per simulation step (120 Hz: ~500 px/s up to ~4000 px/s)
+SHIFTS_PX = [4, 16, 32]
+QUERY_SIZES = [2, 4, 8, 16, 64, 512]
+REPEATS = 2000
+
+
+class _ListField:
+    """
+    The old layout: plain lists, new samples appended one at a time.
+    """
+
+    def __init__(self, step: int):
+        self.step = step
+        self.sample_count = int(math.ceil((SCREEN_W + TunnelField.LOOKAHEAD_PX) / step))
+        self._heights = [float(SCREEN_H)] * self.sample_count
+        self._ceilings = [0.0] * self.sample_count
+        self._last_height = float(SCREEN_H)
+        self._last_ceiling = 0.0
+        self._painted_to = -math.inf
+        self._origin_x = 0.0
+
+    def scroll_to(self, scroll_x: float) -> None:
+        shift = int((scroll_x - self._origin_x) // self.step)
+        if shift <= 0:
+            return
+        shift = min(shift, self.sample_count)
+        self._origin_x += shift * self.step
+
+        del self._heights[:shift]
+        del self._ceilings[:shift]
+        for j in range(self.sample_count - shift, self.sample_count):
+            if self._origin_x + j * self.step < self._painted_to:
+                self._heights.append(self._last_height)
+                self._ceilings.append(self._last_ceiling)
+            else:
+                self._heights.append(float(SCREEN_H))
+                self._ceilings.append(0.0)
+
+    def floor_y_at(self, x: float) -> float:
+        idx = int((x - self._origin_x) / self.step)
+        idx = min(max(idx, 0), self.sample_count - 1)
+        return self._heights[idx]
+
+
+def _field(step: int, ring: bool) -> TunnelField:
+    field = TunnelField(SCREEN_W, SCREEN_H, step)
+    if field.ring != ring:
+        # Force the other layout (sets up the buffers again)
+        field.ring = ring
+        field._arrays = ring and np is not None
+        field.reset()
+    return field
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - t0) / REPEATS * 1e6
+
+
+def _scroller(field, shift_px: int):
+    state = {"x": 0.0}
+
+    def step():
+        state["x"] += shift_px
+        field.scroll_to(state["x"])
+
+    return step
+
+
+def main() -> None:
+    print(f"numpy: {'yes' if np is not None else 'no (list ring buffer)'}")
+    print()
+
+    print(
+        f"{'samples':>7} | {'px / step':>9} | {'old (us)':>11} | {'shifted (us)':>12}"
+        f" | {'ring (us)':>9} | {'picked':>7}"
+    )
+    print("-" * 72)
+    for step in STEPS:
+        for shift in SHIFTS_PX:
+            legacy = _ListField(step)
+            list_us = _time(_scroller(legacy, shift))
+            shifted_us = _time(_scroller(_field(step, ring=False), shift))
+            ring_us = _time(_scroller(_field(step, ring=True), shift))
+            picked = "ring" if TunnelField(SCREEN_W, SCREEN_H, step).ring else "shifted"
+            print(
+                f"{legacy.sample_count:>7} | {shift:>9} | {list_us:>11.2f} | {shifted_us:>12.2f}"
+                f" | {ring_us:>9.2f} | {picked:>7}"
+            )
+    print()
+
+    # One call over a list of x: the game's field (shifted list) answers it
+    # point by point, the ring layout with one NumPy lookup
+    field = _field(STEPS[0], ring=True)
+    game_field = TunnelField(SCREEN_W, SCREEN_H, STEPS[0])
+    for f in (field, game_field):
+        f.paint_span(0, SCREEN_W + TunnelField.LOOKAHEAD_PX, 500, 120)
+    rng = random.Random(0)
+
+    print(f"{'queries':>9} | {'per x (us)':>11} | {'list call (us)':>14} | {'array call (us)':>15}")
+    print("-" * 60)
+    for n in QUERY_SIZES:
+        xs = [rng.uniform(0, SCREEN_W) for _ in range(n)]
+
+        per_x_us = _time(lambda: [field.floor_y_at(x) for x in xs])
+        list_us = _time(lambda: game_field.floor_y_at(xs))
+        array_us = _time(lambda: field.floor_y_at(xs))
+        print(f"{n:>9} | {per_x_us:>11.2f} | {list_us:>14.2f} | {array_us:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
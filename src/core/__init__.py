@@ -1,8 +1,10 @@
 from .engine import PhysicsEngine
+from .pacer import FramePacer
+from .collision_batch import CollisionBatch
 from .states.game_in_progress import GameInProgressState
 from .states.main_menu import MainMenuState
 from .states.pause_menu import PauseMenuState
 from .states.slots import SlotsState
 from .states.game_over import GameOverState
 from .states.help import HelpState
-__all__ = ["PhysicsEngine", "GameInProgressState", "MainMenuState"]
+__all__ = ["PhysicsEngine", "FramePacer", "CollisionBatch", "GameInProgressState", "MainMenuState"]
@@ -0,0 +1,123 @@
+import pygame
+
+# NumPy is optional - without it the game keeps using per-object tests
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# 'CollisionBatch' class declaration and definition
+class CollisionBatch:
+    """
+    Player circle vs many entities in one vectorized call.
+
+    Obstacle AABBs are stored as contiguous left/top/right/bottom arrays
+    (plus a lethal flag), coins as centre/radius arrays. Buffers only grow,
+    so reloading every step does not allocate once the run has warmed up.
+
+    The game doesn't use it: after the x-band broad phase a step has at
+    most a couple of candidates (0-2 over a 6000-frame run), far below
+    MIN_BATCH. It stays as the kernel for many-body checks and
+    benchmarks/collision_bench.py.
+    """
+
+    # Below this many candidates the plain Python loop is faster
+    # (numbers from benchmarks/collision_bench.py)
+    MIN_BATCH = 96
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    def __init__(self, capacity: int = 64):
+        self._obstacles = []
+        self._coins = []
+        self._n_obs = 0
+        self._n_coins = 0
+        self._alloc_obstacles(capacity)
+        self._alloc_coins(capacity)
+
+    def _alloc_obstacles(self, capacity: int) -> None:
+        self._left = np.empty(capacity)
+        self._top = np.empty(capacity)
+        self._right = np.empty(capacity)
+        self._bottom = np.empty(capacity)
+        self._lethal = np.empty(capacity, dtype=bool)
+
+    def _alloc_coins(self, capacity: int) -> None:
+        self._coin_x = np.empty(capacity)
+        self._coin_y = np.empty(capacity)
+        self._coin_r = np.empty(capacity)
+
+    def load(self, lethal: list, solid: list, coins: list) -> None:
+        """
+        Copy current hitboxes into the arrays (obstacles need getHitbox() -> Rect,
+        coins getHitbox() -> (center, radius)).
+        """
+        obstacles = lethal + solid
+        n = len(obstacles)
+        if n > len(self._left):
+            self._alloc_obstacles(max(n, 2 * len(self._left)))
+
+        for i, obs in enumerate(obstacles):
+            hb = obs.getHitbox()
+            self._left[i] = hb.left
+            self._top[i] = hb.top
+            self._right[i] = hb.right
+            self._bottom[i] = hb.bottom
+
+        self._lethal[: len(lethal)] = True
+        self._lethal[len(lethal) : n] = False
+
+        m = len(coins)
+        if m > len(self._coin_x):
+            self._alloc_coins(max(m, 2 * len(self._coin_x)))
+
+        for i, coin in enumerate(coins):
+            center, radius = coin.getHitbox()
+            self._coin_x[i] = center.x
+            self._coin_y[i] = center.y
+            self._coin_r[i] = radius
+
+        self._obstacles = obstacles
+        self._coins = coins
+        self._n_obs = n
+        self._n_coins = m
+
+    def test(self, center: pygame.Vector2, radius: float):
+        """
+        Indices of the lethal obstacles, solid obstacles (both into
+        lethal + solid, as loaded) and coins the circle overlaps.
+        """
+        cx, cy = center.x, center.y
+        n = self._n_obs
+        m = self._n_coins
+
+        # Circle vs AABB: distance to the closest point of each rect
+        dx = cx - np.clip(cx, self._left[:n], self._right[:n])
+        dy = cy - np.clip(cy, self._top[:n], self._bottom[:n])
+        hit = (dx * dx + dy * dy) < (radius * radius)
+
+        lethal = self._lethal[:n]
+        lethal_idx = np.flatnonzero(hit & lethal)
+        solid_idx = np.flatnonzero(hit & ~lethal)
+
+        # Circle vs circle
+        dx = cx - self._coin_x[:m]
+        dy = cy - self._coin_y[:m]
+        reach = radius + self._coin_r[:m]
+        coin_idx = np.flatnonzero((dx * dx + dy * dy) < reach * reach)
+
+        return lethal_idx, solid_idx, coin_idx
+
+    def collide(self, center: pygame.Vector2, radius: float):
+        """
+        Same as test(), but returns the entities instead of indices.
+        """
+        lethal_idx, solid_idx, coin_idx = self.test(center, radius)
+        return (
+            [self._obstacles[i] for i in lethal_idx],
+            [self._obstacles[i] for i in solid_idx],
+            [self._coins[i] for i in coin_idx],
+        )
@@ -20,17 +20,88 @@ class PhysicsEngine:
     _dt: float = 0
     _clock = pygame.time.Clock()
 
-    def __init__(self, screen=pygame.Surface, dt: float = 0):
+    # Fixed-step simulation rate (steps per second)
+    SIM_HZ = 120
+    # Longest frame we try to catch up on - anything above is dropped
+    MAX_FRAME_DT = 0.25
+    # Spiral-of-death guard: never run more steps than this per rendered frame
+    MAX_STEPS_PER_FRAME = 8
+
+    # Flight: downward acceleration (px/s^2), velocity set by a jump (px/s)
+    # and how many px a step moves the player per px/s of velocity and second
+    GRAVITY = 9.81 * 95
+    JUMP_VELOCITY = -355
+    VELOCITY_SCALE = 2
+
+    def __init__(
+        self,
+        screen=pygame.Surface,
+        dt: float = 0,
+        fixedStep: bool = True,
+        simHz: int = SIM_HZ,
+        sweptCollision: bool = False,
+        maskCollision: bool = False,
+    ):
         self.screen = screen
         self._dt = dt
 
-    # Game is capped at 60 fps
+        # Fixed-step mode: the simulation always advances by '_stepDt',
+        # real frame time is banked in '_accumulator' and consumed in steps
+        self.fixedStep = fixedStep
+        self._stepDt = 1.0 / simHz
+        self._accumulator = 0.0
+        self._stepsThisFrame = 0
+
+        # Test lethal obstacles against the player's whole motion over the
+        # step (turn on when running a low 'simHz' - thin hazards can
+        # otherwise slip between two steps)
+        self.sweptCollision = sweptCollision
+
+        # Sprite-backed entities (getMask / getSpriteRect) are tested
+        # pixel by pixel, once their usual hitbox test has passed
+        self.maskCollision = maskCollision
+
+    # Measure the last frame (clamped so a window drag / GC pause can't
+    # move the whole world at once)
     def updateDt(self) -> None:
-        self._dt = self._clock.tick() / 1000
+        frameDt = min(self._clock.tick() / 1000, self.MAX_FRAME_DT)
+        self._stepsThisFrame = 0
+
+        if self.fixedStep:
+            self._accumulator += frameDt
+            self._dt = self._stepDt
+        else:
+            self._dt = frameDt
+
+    # True while another simulation step should run during this frame
+    def nextStep(self) -> bool:
+        if not self.fixedStep:
+            self._stepsThisFrame += 1
+            return self._stepsThisFrame == 1
+
+        if self._accumulator < self._stepDt:
+            return False
+
+        if self._stepsThisFrame >= self.MAX_STEPS_PER_FRAME:
+            # Too far behind - drop the backlog instead of spiralling
+            self._accumulator %= self._stepDt
+            return False
+
+        self._accumulator -= self._stepDt
+        self._stepsThisFrame += 1
+        return True
+
+    # How far rendering is between the previous and the current step [0, 1]
+    def getAlpha(self) -> float:
+        if not self.fixedStep:
+            return 1.0
+        return min(1.0, self._accumulator / self._stepDt)
 
     def resetClock(self) -> None:
         self._clock.tick()
         self._dt = 0
+        self._accumulator = 0.0
+        self._stepsThisFrame = 0
 
     # Private method for out of bounds resets
     def _clampPlayer(self, player: Player) -> None:
@@ -50,13 +121,13 @@ class PhysicsEngine:
     # Public* method for gravity simulation
     def applyGravity(self, player: Player) -> None:
         if player.currPos.y != self.screen.get_height() + player._radius:
-            player.velocity.y += 9.81 * self._dt * 95
-            player.currPos.y += player.velocity.y * self._dt * 2
+            player.velocity.y += self.GRAVITY * self._dt
+            player.currPos.y += player.velocity.y * self._dt * self.VELOCITY_SCALE
         self._clampPlayer(player)
 
     # Flight simulation
     def jump(self, player: Player) -> None:
-        player.velocity.y = -355
+        player.velocity.y = self.JUMP_VELOCITY
         self._clampPlayer(player)
 
     # Define a collision method for circle - to - rectangle
@@ -67,7 +138,86 @@ class PhysicsEngine:
         dy = circleCenter.y - max(rect.top, min(circleCenter.y, rect.bottom))
 
         return (dx * dx + dy * dy) < (circleRadius * circleRadius)
-    
+
+    # Circle - to - circle
+    def _circToCircCol(
+        self, c1: pygame.Vector2, r1: float, c2: pygame.Vector2, r2: float
+    ) -> bool:
+        dx = c1.x - c2.x
+        dy = c1.y - c2.y
+        return (dx * dx + dy * dy) < (r1 + r2) * (r1 + r2)
+
+    # Does the segment p0 -> p1 cross the rectangle? (Liang-Barsky clip)
+    def _segToRectCol(
+        self, p0: pygame.Vector2, p1: pygame.Vector2, rect: pygame.Rect
+    ) -> bool:
+        tEnter, tExit = 0.0, 1.0
+
+        for start, delta, lo, hi in (
+            (p0.x, p1.x - p0.x, rect.left, rect.right),
+            (p0.y, p1.y - p0.y, rect.top, rect.bottom),
+        ):
+            if delta == 0:
+                if start < lo or start > hi:
+                    return False
+                continue
+
+            ta = (lo - start) / delta
+            tb = (hi - start) / delta
+            if ta > tb:
+                ta, tb = tb, ta
+
+            tEnter = max(tEnter, ta)
+            tExit = min(tExit, tb)
+            if tEnter > tExit:
+                return False
+
+        return True
+
+    # Squared distance from point (px, py) to the segment p0 -> p1
+    def _pointSegDist2(
+        self, px: float, py: float, p0: pygame.Vector2, p1: pygame.Vector2
+    ) -> float:
+        sx = p1.x - p0.x
+        sy = p1.y - p0.y
+        len2 = sx * sx + sy * sy
+
+        t = 0.0
+        if len2 > 0:
+            t = max(0.0, min(1.0, ((px - p0.x) * sx + (py - p0.y) * sy) / len2))
+
+        dx = p0.x + sx * t - px
+        dy = p0.y + sy * t - py
+        return dx * dx + dy * dy
+
+    # Swept circle - to - rectangle: does the circle touch the rect anywhere
+    # on its way from p0 to p1?
+    def _sweptCircToRectCol(
+        self,
+        p0: pygame.Vector2,
+        p1: pygame.Vector2,
+        circleRadius: float,
+        rect: pygame.Rect,
+    ) -> bool:
+        # Common case: touching at the end of the step
+        if self._circToRectCol(p1, circleRadius, rect):
+            return True
+
+        if self._segToRectCol(p0, p1, rect):
+            return True
+
+        # Segment and rect are disjoint => the closest pair is a segment
+        # endpoint vs the rect, or a rect corner vs the segment
+        if self._circToRectCol(p0, circleRadius, rect):
+            return True
+
+        r2 = circleRadius * circleRadius
+        for cx, cy in (rect.topleft, rect.topright, rect.bottomleft, rect.bottomright):
+            if self._pointSegDist2(cx, cy, p0, p1) < r2:
+                return True
+
+        return False
+
     def resolveSolidCircleRectVerticalOnly(self, player: Player, rect: pygame.Rect) -> None:
         """
         Resolve circle-rect overlap by moving player only in Y.
@@ -95,58 +245,134 @@ class PhysicsEngine:
             if player.velocity.y < 0:
                 player.velocity.y = 0
 
-    def resolveSolidCircleRect(self, player: Player, rect: pygame.Rect) -> None:
+    def _rectPush(
+        self, center: pygame.Vector2, radius: float, rect: pygame.Rect
+    ) -> tuple[float, float] | None:
         """
-        Resolve collision between player's circle and a solid rectangle.
-        Used for walkable tunnel surfaces (non-lethal walls).
-        We push the player out along the shallow axis.
+        Correction (dx, dy) that takes the circle out of a solid rectangle,
+        or None if they don't overlap. Pushes along the shallow axis, and a
+        vertical push goes all the way to the top / bottom (auto-climb).
         """
-        center, radius = player.getHitbox()
-
         # Find closest point on rect to circle center
         closest_x = max(rect.left, min(center.x, rect.right))
         closest_y = max(rect.top, min(center.y, rect.bottom))
 
         dx = center.x - closest_x
         dy = center.y - closest_y
-        dist2 = dx * dx + dy * dy
 
-        if dist2 >= radius * radius:
-            return  # no overlap
+        if dx * dx + dy * dy >= radius * radius:
+            return None  # no overlap
 
         # If exactly inside edge (dx=dy=0), choose a direction based on proximity
         if dx == 0 and dy == 0:
             # push vertically by default (tunnel surfaces are vertical blocks)
-            if center.y < rect.centery:
-                dy = -1
-            else:
-                dy = 1
+            dy = -1 if center.y < rect.centery else 1
 
-        # Determine whether to resolve vertically or horizontally
         # Prefer vertical resolution (feels like "standing" on surfaces)
         # but still handle side impacts.
         overlap_x = radius - abs(dx) if dx != 0 else radius
         overlap_y = radius - abs(dy) if dy != 0 else radius
 
         if overlap_y <= overlap_x:
-            # Resolve vertically
             if center.y < rect.centery:
-                # player above rect -> push up
-                player.currPos.y = rect.top - radius
-                if player.velocity.y > 0:
-                    player.velocity.y = 0
-            else:
-                # player below rect -> push down
-                player.currPos.y = rect.bottom + radius
-                if player.velocity.y < 0:
-                    player.velocity.y = 0
-        else:
-            # Resolve horizontally
-            if center.x < rect.centerx:
-                player.currPos.x = rect.left - radius
-            else:
-                player.currPos.x = rect.right + radius
-            # (we don't track player x-velocity in your game; keep as positional correction)
+                return 0.0, rect.top - radius - center.y
+            return 0.0, rect.bottom + radius - center.y
+
+        if center.x < rect.centerx:
+            return rect.left - radius - center.x, 0.0
+        return rect.right + radius - center.x, 0.0
+
+    def _heightfieldPush(
+        self, center: pygame.Vector2, radius: float, field
+    ) -> tuple[float, float]:
+        """
+        Deepest penetration of the circle into the floor and the ceiling of
+        a heightfield (TunnelField) - negative means a gap. Only the samples
+        under the circle's footprint are read, so the cost doesn't depend on
+        how many wall panels are alive.
+        """
+        r2 = radius * radius
+        floorPush = -float("inf")
+        ceilPush = -float("inf")
+
+        for left, right, floorY, ceilY in field.samples_under(
+            center.x - radius, center.x + radius
+        ):
+            # Closest point of the sample to the circle center (in x)
+            dx = max(left - center.x, 0.0, center.x - right)
+            if dx >= radius:
+                continue
+            half = (r2 - dx * dx) ** 0.5
+
+            floorPush = max(floorPush, center.y + half - floorY)
+            ceilPush = max(ceilPush, ceilY - (center.y - half))
+
+        return floorPush, ceilPush
+
+    def solveContacts(
+        self, player: Player, rects: list[pygame.Rect], field=None
+    ) -> bool:
+        """
+        Resolve the player against every solid contact of the step at once:
+        walkable rects plus, optionally, a floor/ceiling heightfield.
+
+        All contacts are measured from the same unresolved position and
+        merged into one correction (deepest push per direction, floor wins
+        over ceiling when squeezed), so the result doesn't depend on the
+        order of 'rects' and overlapping panels aren't resolved twice.
+        Only y is corrected: the player's x is fixed on screen (the game
+        state locks it after every step), so side pushes are skipped.
+        Returns True if the player is standing on something.
+        """
+        center, radius = player.getHitbox()
+
+        up = down = 0.0
+        standing = False
+
+        if field is not None:
+            floorPush, ceilPush = self._heightfieldPush(center, radius, field)
+            up = max(up, floorPush)
+            down = max(down, ceilPush)
+            # Standing on top => within 2px of the floor
+            standing = floorPush >= -2
+
+        for rect in rects:
+            push = self._rectPush(center, radius, rect)
+            if push is None:
+                continue
+            dy = push[1]
+            if dy < 0:
+                up = max(up, -dy)
+                standing = True
+            elif dy > 0:
+                down = max(down, dy)
+
+        if up > 0:
+            player.currPos.y -= up
+            if player.velocity.y > 0:
+                player.velocity.y = 0
+        elif down > 0:
+            player.currPos.y += down
+            if player.velocity.y < 0:
+                player.velocity.y = 0
+
+        return standing
+
+    def resolveSolidCircleRect(self, player: Player, rect: pygame.Rect) -> None:
+        """
+        Resolve collision between player's circle and a solid rectangle.
+        Used for walkable tunnel surfaces (non-lethal walls).
+        We push the player out along the shallow axis.
+        """
+        push = self._rectPush(*player.getHitbox(), rect)
+        if push is None:
+            return
+
+        dx, dy = push
+        player.currPos.x += dx
+        player.currPos.y += dy
+        if (dy < 0 and player.velocity.y > 0) or (dy > 0 and player.velocity.y < 0):
+            player.velocity.y = 0
 
     # Handle collisions - should we store hitboxes in the class?
     def checkCollision(self, player: Player, enemy: Pipe) -> bool:
@@ -157,3 +383,70 @@ class PhysicsEngine:
         enemyHitbox = enemy.getHitbox()
 
         return self._circToRectCol(playerCenter, playerRadius, enemyHitbox)
+
+    # Same as 'checkCollision', but over the whole last step (continuous)
+    def checkCollisionSwept(self, player: Player, enemy: Pipe) -> bool:
+        playerCenter, playerRadius = player.getHitbox()
+        enemyHitbox = enemy.getHitbox()
+
+        # Motion relative to the enemy, in the frame where it sits at its
+        # current position: the step starts where the player was relative to
+        # the enemy's previous position (movers keep it; static entities
+        # have none and don't move in world space)
+        enemyX = getattr(enemy, "x", 0.0)
+        enemyY = getattr(enemy, "y", 0.0)
+        start = player.prevPos + pygame.Vector2(
+            enemyX - getattr(enemy, "prev_x", enemyX),
+            enemyY - getattr(enemy, "prev_y", enemyY),
+        )
+
+        return self._sweptCircToRectCol(start, playerCenter, playerRadius, enemyHitbox)
+
+    # Enemies whose hitbox is a circle (center, radius), e.g. fireballs
+    def checkCircleCollision(self, player: Player, enemy) -> bool:
+        playerCenter, playerRadius = player.getHitbox()
+        enemyCenter, enemyRadius = enemy.getHitbox()
+
+        return self._circToCircCol(playerCenter, playerRadius, enemyCenter, enemyRadius)
+
+    # Swept version: closest approach of the relative motion over the step
+    def checkCircleCollisionSwept(self, player: Player, enemy) -> bool:
+        playerCenter, playerRadius = player.getHitbox()
+        enemyCenter, enemyRadius = enemy.getHitbox()
+
+        enemyX = getattr(enemy, "x", enemyCenter.x)
+        enemyY = getattr(enemy, "y", enemyCenter.y)
+        start = player.prevPos + pygame.Vector2(
+            enemyX - getattr(enemy, "prev_x", enemyX),
+            enemyY - getattr(enemy, "prev_y", enemyY),
+        )
+
+        reach = playerRadius + enemyRadius
+        return (
+            self._pointSegDist2(enemyCenter.x, enemyCenter.y, start, playerCenter)
+            < reach * reach
+        )
+
+    # Pixel-exact test of two masks placed at their rects' top-left corners
+    def _maskCol(
+        self,
+        mask1: pygame.mask.Mask,
+        rect1: pygame.Rect,
+        mask2: pygame.mask.Mask,
+        rect2: pygame.Rect,
+    ) -> bool:
+        # AABB early-out - the common no-overlap case never reaches the masks
+        if not rect1.colliderect(rect2):
+            return False
+        return mask1.overlap(mask2, (rect2.x - rect1.x, rect2.y - rect1.y)) is not None
+
+    # Sprite vs sprite; an entity without a mask (no sprite) can't be refined
+    # => counts as a hit (its circle / rect test already passed)
+    def checkMaskCollision(self, player: Player, enemy) -> bool:
+        enemyMask = enemy.getMask()
+        if enemyMask is None:
+            return True
+
+        return self._maskCol(
+            player.getMask(), player.getSpriteRect(), enemyMask, enemy.getSpriteRect()
+        )
@@ -0,0 +1,134 @@
+import ctypes
+import glob
+import os
+import time
+import pygame
+from collections import deque
+
+
+# Mirrors SDL2's SDL_DisplayMode
+class _SDLDisplayMode(ctypes.Structure):
+    _fields_ = [
+        ("format", ctypes.c_uint32),
+        ("w", ctypes.c_int),
+        ("h", ctypes.c_int),
+        ("refresh_rate", ctypes.c_int),
+        ("driverdata", ctypes.c_void_p),
+    ]
+
+
+def _sdlDesktopHz(display: int = 0) -> int:
+    """
+    Desktop refresh rate straight from the SDL2 library pygame ships with
+    (SDL_GetDesktopDisplayMode) - opening it again by path hands back the
+    copy pygame already loaded. 0 if it can't be found or doesn't know.
+    """
+    base = os.path.dirname(pygame.__file__)
+    patterns = ("SDL2.dll", "libSDL2*.so*", ".dylibs/libSDL2*.dylib")
+    for folder in (base, base + ".libs", os.path.join(base, os.pardir, "pygame.libs")):
+        for pattern in patterns:
+            for path in glob.glob(os.path.join(folder, pattern)):
+                # Skip SDL2_image / SDL2_mixer / SDL2_ttf
+                if "SDL2_" in os.path.basename(path):
+                    continue
+                try:
+                    sdl = ctypes.CDLL(path)
+                    mode = _SDLDisplayMode()
+                    if sdl.SDL_GetDesktopDisplayMode(display, ctypes.byref(mode)) == 0:
+                        return max(0, int(mode.refresh_rate))
+                except (OSError, AttributeError):
+                    pass
+    return 0
+
+
+def getDisplayHz() -> int:
+    """
+    Refresh rate of the monitor.
+
+    pygame 2.6 has no refresh-rate API (get_current_refresh_rate /
+    get_desktop_refresh_rates are pygame-ce / 2.7+), so unless one of those
+    exists the rate is read from SDL directly. Falls back to 60 Hz when it
+    can't be read (headless / dummy video driver, SDL reports 0).
+    """
+    for name in ("get_current_refresh_rate", "get_desktop_refresh_rates"):
+        getter = getattr(pygame.display, name, None)
+        if getter is None:
+            continue
+        try:
+            rate = getter()
+        except pygame.error:
+            continue
+        if isinstance(rate, (list, tuple)):
+            rate = rate[0] if rate else 0
+        if rate and rate > 0:
+            return int(rate)
+
+    return _sdlDesktopHz() or 60
+
+
+# 'FramePacer' class declaration and definition
+class FramePacer:
+    """
+    Keeps each frame on a fixed deadline for the requested frame rate.
+
+    Most of the wait is spent sleeping (no CPU use); the last couple of
+    milliseconds are busy-waited, because sleep() wakes up late by an
+    OS-dependent amount and that is exactly what shows up as jitter.
+    """
+
+    # Rate used while the window is not focused (static states only - see
+    # absState.THROTTLE_UNFOCUSED)
+    UNFOCUSED_FPS = 5
+
+    # How long before the deadline we stop sleeping and start spinning
+    SPIN_MARGIN = 0.002
+
+    # Number of frames used for the achieved rate / jitter report
+    WINDOW = 120
+
+    def __init__(self, displayHz: int | None = None):
+        self.displayHz = displayHz if displayHz else getDisplayHz()
+
+        self._deadline = None
+        self._lastFrame = time.perf_counter()
+        self._frameTimes = deque(maxlen=self.WINDOW)
+
+    # Block until the next frame is due ('None' => display rate)
+    def wait(self, targetFps: int | None = None) -> None:
+        period = 1.0 / (targetFps or self.displayHz)
+        now = time.perf_counter()
+
+        # First frame, or we fell more than a frame behind: resync
+        # instead of rushing through the missed deadlines
+        if self._deadline is None or now - self._deadline > period:
+            self._deadline = now
+        self._deadline += period
+
+        remaining = self._deadline - now
+        if remaining > self.SPIN_MARGIN:
+            time.sleep(remaining - self.SPIN_MARGIN)
+        while time.perf_counter() < self._deadline:
+            pass
+
+        now = time.perf_counter()
+        self._frameTimes.append(now - self._lastFrame)
+        self._lastFrame = now
+
+    # Duration of the last paced frame (seconds)
+    def getFrameDt(self) -> float:
+        return self._frameTimes[-1] if self._frameTimes else 0.0
+
+    # Average achieved frame rate over the report window
+    def getFps(self) -> float:
+        if not self._frameTimes:
+            return 0.0
+        return len(self._frameTimes) / sum(self._frameTimes)
+
+    # Standard deviation of the frame time over the report window (ms)
+    def getJitter(self) -> float:
+        n = len(self._frameTimes)
+        if n < 2:
+            return 0.0
+        mean = sum(self._frameTimes) / n
+        var = sum((t - mean) * (t - mean) for t in self._frameTimes) / (n - 1)
+        return (var ** 0.5) * 1000
@@ -4,6 +4,14 @@ from abc import ABC, abstractmethod
 
 # 'absState' abstract class declaration and definition
 class absState(ABC):
+    # Frame rate the state is paced at ('None' => display rate)
+    # Static screens don't need more than this
+    TARGET_FPS: int | None = 30
+
+    # Drop to FramePacer.UNFOCUSED_FPS without focus - states that simulate
+    # turn it off (a 0.2 s frame is more steps than one frame may run)
+    THROTTLE_UNFOCUSED = True
+
     # All states interact with the master
     # but not with eachother
     def __init__(self, master):
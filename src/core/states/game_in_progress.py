@@ -1,8 +1,13 @@
 import pygame
 from ._abs_state import absState
+from entities import RectObstacle
 
 
 class GameInProgressState(absState):
+    # Gameplay renders at display rate
+    TARGET_FPS = None
+    THROTTLE_UNFOCUSED = False
+
     def onEnter(self) -> None:
         self.master.sound.playMusic("gameLoop")
 
@@ -23,23 +28,64 @@ class GameInProgressState(absState):
             if event.type == pygame.KEYUP and event.key == pygame.K_SPACE:
                 self.master.player.jumpPressed = False
 
-    def _circle_circle_col(
-        self, c1: pygame.Vector2, r1: float, c2: pygame.Vector2, r2: float
-    ) -> bool:
-        dx = c1.x - c2.x
-        dy = c1.y - c2.y
-        return (dx * dx + dy * dy) < (r1 + r2) * (r1 + r2)
+    # Keep the lethal / solid / coin candidates the player actually touches
+    def _narrowPhase(
+        self, lethal: list, solid: list, coins: list, lethal_circles: list = ()
+    ) -> tuple[list, list, list]:
+        player = self.master.player
+        engine = self.master.engine
+        center, radius = player.getHitbox()
+
+        # Round hazards (fireballs) have circle hitboxes
+        if engine.sweptCollision:
+            circle_hits = [e for e in lethal_circles if engine.checkCircleCollisionSwept(player, e)]
+        else:
+            circle_hits = [e for e in lethal_circles if engine.checkCircleCollision(player, e)]
+
+        # Deaths may use the whole step's motion (continuous)
+        if engine.sweptCollision:
+            lethal_hits = [obs for obs in lethal if engine.checkCollisionSwept(player, obs)]
+        else:
+            lethal_hits = [obs for obs in lethal if engine.checkCollision(player, obs)]
+        lethal_hits.extend(circle_hits)
+
+        solid_hits = [obs for obs in solid if engine.checkCollision(player, obs)]
+
+        coin_hits = []
+        for coin in coins:
+            coinCenter, coinRadius = coin.getHitbox()
+            if engine._circToCircCol(center, radius, coinCenter, coinRadius):
+                coin_hits.append(coin)
+
+        return self._refineMasks(lethal_hits), solid_hits, self._refineMasks(coin_hits)
+
+    def _refineMasks(self, hits: list) -> list:
+        # Hitbox overlap passed => in pixel-exact mode sprite-backed entities
+        # (getMask) must also overlap pixel by pixel
+        engine = self.master.engine
+        if not engine.maskCollision or not hits:
+            return hits
+        player = self.master.player
+        return [
+            e for e in hits
+            if not hasattr(e, "getMask") or engine.checkMaskCollision(player, e)
+        ]
 
     def draw(self) -> None:
         self.master.screen.fill("white")
 
-        self.master.player.draw()
+        # Render between the previous and the current simulation step
+        alpha = self.master.engine.getAlpha()
+        cam_x = self.master.camera.getRenderX(alpha)
+
+        self.master.player.draw(cam_x, alpha)
 
-        for obs in self.master.pipes:
-            obs.draw()
+        # Lava under everything else (spikes stand in it)
+        lava = self.master.section_manager.getLavaBand()
+        if lava is not None:
+            lava.draw(cam_x)
 
-        for coin in self.master.coins:
-            coin.draw()
+        self.master.world.draw(cam_x, alpha)
 
         font = pygame.font.Font(None, 42)
         s = font.render(f"Score: {self.master.score}", True, "black")
@@ -51,10 +97,15 @@ class GameInProgressState(absState):
 
     def _updateEnv(self) -> None:
         self.master.engine.updateDt()
-        dt = self.master.engine._dt
 
-        # Keep player centered in X (prevents being shoved back by solids)
-        fixed_x = self.master.screen.get_width() / 2
+        # Fixed-step mode may run zero, one or several steps per frame
+        while self.master.engine.nextStep():
+            if not self._stepEnv(self.master.engine._dt):
+                return
+
+    # One simulation step - returns False if the run ended during it
+    def _stepEnv(self, dt: float) -> bool:
+        self.master.player.prevPos.update(self.master.player.currPos)
 
         # Apply gravity
         self.master.engine.applyGravity(self.master.player)
@@ -62,94 +113,105 @@ class GameInProgressState(absState):
         # Reset surface contact each frame
         self.master.player.on_surface = False
 
-        # Lock x early
-        self.master.player.currPos.x = fixed_x
-
         # Systems
         self.master.progression.update(dt)
         self.master.section_manager.update(dt)
 
+        # Scroll the world (one offset instead of moving every entity)
+        camera = self.master.camera
+        camera.update(dt, self.master.progression.world_speed)
+
+        # Keep player centered on screen (prevents being shoved back by solids)
+        fixed_x = camera.x + self.master.screen.get_width() / 2
+
+        # Lock x early
+        self.master.player.currPos.x = fixed_x
+
         # Spawn
         new_obs, new_coins = self.master.section_manager.maybe_spawn(
             hazard_intensity=self.master.progression.hazard_intensity,
-            world_speed=self.master.progression.world_speed
+            world_speed=self.master.progression.world_speed,
+            scroll_x=camera.x,
         )
 
-        if new_obs:
-            self.master.pipes.extend(new_obs)
-        if new_coins:
-            self.master.coins.extend(new_coins)
+        # Each entity goes to its archetype's group
+        self.master.world.extend(new_obs)
+        self.master.world.extend(new_coins)
 
         # --------------------------
         # Obstacles update + collision
         # --------------------------
-        alive_obs = []
-        for obs in self.master.pipes:
-            obs.update(dt)
-            if not obs.shouldKill():
-                alive_obs.append(obs)
+        # (whatever scrolled out goes back to the pool for the next spawns)
+        self.master.world.update(dt, camera.x, self.master.pool.release)
 
-        # PASS 1: lethal collisions first (simple + consistent)
-        for obs in alive_obs:
-            if getattr(obs, "lethal", True):
-                if self.master.engine.checkCollision(self.master.player, obs):
-                    self.master.sound.playSfx("playerDeath")
-                    self.master.lastScore = getattr(self.master, "score", 0)
-                    self.master.switchGameState("gameOver")
-                    return
-
-        # PASS 2: resolve walkable solids (FULL resolve => allows auto-climb)
-        player_center, player_radius = self.master.player.getHitbox()
-        for obs in alive_obs:
-            if getattr(obs, "lethal", True) is False:
-                if self.master.engine.checkCollision(self.master.player, obs):
-                    hb = obs.getHitbox()
+        # Tunnel surfaces follow the camera
+        field = self.master.section_manager.getTunnelField()
+        if field is not None:
+            field.scroll_to(camera.x)
+
+        # Spike-section floor lava: one band, one check
+        lava = self.master.section_manager.getLavaBand()
+        if lava is not None:
+            lava.scroll_to(camera.x)
 
-                    # Full resolve (original tunnel feel: automatic climbing)
-                    self.master.engine.resolveSolidCircleRect(self.master.player, hb)
+        # Broad phase: only entities overlapping the player's x-band
+        player_center, player_radius = self.master.player.getHitbox()
+        band_x0 = player_center.x - player_radius
+        band_x1 = player_center.x + player_radius
+        if self.master.engine.sweptCollision:
+            # Also cover where the player was at the start of the step
+            band_x0 = min(band_x0, self.master.player.prevPos.x - player_radius)
+        world = self.master.world
+        lethal_hits, solid_hits, coin_hits = self._narrowPhase(
+            world.queryLethal(band_x0, band_x1),
+            world.querySolid(band_x0, band_x1),
+            world.queryCoins(band_x0, band_x1),
+            world.queryLethalCircles(band_x0, band_x1),
+        )
 
-                    # Standing on top => on_surface
-                    if abs((self.master.player.currPos.y + player_radius) - hb.top) <= 2:
-                        self.master.player.on_surface = True
+        # PASS 1: lethal collisions first (simple + consistent)
+        # Edge-restricted obstacles only kill on their lethal edges
+        if lethal_hits:
+            lethal_hits = RectObstacle.filterLethal(lethal_hits, player_center, player_radius)
+        if lethal_hits or (lava is not None and lava.hits(player_center, player_radius)):
+            self.master.sound.playSfx("playerDeath")
+            self.master.lastScore = getattr(self.master, "score", 0)
+            self.master.switchGameState("gameOver")
+            return False
+
+        # PASS 2: tunnel floor / ceiling + any other walkable solids,
+        # solved together as one correction (FULL resolve => allows auto-climb)
+        if self.master.engine.solveContacts(
+            self.master.player, [obs.getHitbox() for obs in solid_hits], field
+        ):
+            self.master.player.on_surface = True
 
         # Final X lock
         self.master.player.currPos.x = fixed_x
 
-        self.master.pipes = alive_obs
-
         # --------------------------
-        # Coins
+        # Coins (collected ones stay hidden until they scroll out)
         # --------------------------
-        playerCenter, playerRadius = self.master.player.getHitbox()
-        alive_coins = []
-        for coin in self.master.coins:
-            coin.update(dt)
-            if coin.shouldKill():
-                continue
-
-            coinCenter, coinRadius = coin.getHitbox()
-            if self._circle_circle_col(playerCenter, playerRadius, coinCenter, coinRadius):
-                coin.collected = True
-                self.master.score += coin.value
-                self.master.progression.addCoins(coin.value)
-                continue
+        for coin in coin_hits:
+            coin.collected = True
+            self.master.score += coin.value
+            self.master.progression.addCoins(coin.value)
 
-            alive_coins.append(coin)
-
-        self.master.coins = alive_coins
+        return True
 
     def _resetState(self) -> None:
         self.master.player.currPos = pygame.Vector2(
             self.master.screen.get_width() / 2, self.master.screen.get_height() / 2
         )
+        self.master.player.prevPos = pygame.Vector2(self.master.player.currPos)
         self.master.player.velocity.y = 0
 
-        self.master.pipes.clear()
-        self.master.coins.clear()
+        self.master.world.clear(self.master.pool.release)
+        self.master.camera.reset()
 
         self.master.score = 0
-        self.master.section_manager.reset()
         self.master.progression.reset()
+        self.master.section_manager.reset()
 
         self.master.engine.resetClock()
 
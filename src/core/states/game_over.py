@@ -14,6 +14,9 @@ class GameOverState(absState):
         # Placeholder score value (until you implement scoring)
         self._final_score = getattr(self.master, "lastScore", 0)
 
+        # Seed of the run that just ended (replay it with --seed)
+        self._seed = self.master.rng.seed
+
     def onExit(self) -> None:
         pass
 
@@ -82,6 +85,10 @@ class GameOverState(absState):
         score_text = text_font.render(f"Score: {self._final_score}", True, (210, 210, 210))
         self.master.screen.blit(score_text, ((w - score_text.get_width()) // 2, 220))
 
+        seed_font = pygame.font.Font(None, 30)
+        seed_text = seed_font.render(f"Seed: {self._seed}", True, (140, 140, 140))
+        self.master.screen.blit(seed_text, ((w - seed_text.get_width()) // 2, 272))
+
         # Buttons
         btn_w, btn_h = 340, 72
         x = (w - btn_w) // 2
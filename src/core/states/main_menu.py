@@ -33,12 +33,13 @@ class MainMenuState(absState):
         self.master.player.currPos = pygame.Vector2(
             self.master.screen.get_width() / 2, self.master.screen.get_height() / 2
         )
+        self.master.player.prevPos = pygame.Vector2(self.master.player.currPos)
         self.master.player.jumpPressed = False
         self.master.player.state = "IDLE"
         self.master.player.velocity = pygame.Vector2(0, 0)
 
-        self.master.pipes.clear()
-        self.master.coins.clear()
+        self.master.world.clear(self.master.pool.release)
+        self.master.camera.reset()
 
         self.master.engine.resetClock()
         self.master.isPaused = False
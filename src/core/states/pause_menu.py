@@ -78,9 +78,12 @@ class PauseMenuState(absState):
         # Draw the last gameplay frame as background
         # (We can re-render the scene using current objects without updating them.)
         self.master.screen.fill("white")
-        self.master.player.draw()
-        for pipe in self.master.pipes:
-            pipe.draw()
+        cam_x = self.master.camera.x
+        self.master.player.draw(cam_x)
+        lava = self.master.section_manager.getLavaBand()
+        if lava is not None:
+            lava.draw(cam_x)
+        self.master.world.draw(cam_x)
 
         # Dim overlay
         overlay = pygame.Surface(self.master.screen.get_size(), pygame.SRCALPHA)
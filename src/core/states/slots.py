@@ -1,5 +1,4 @@
 import pygame
-import random
 from ._abs_state import absState
 
 
@@ -9,6 +8,9 @@ class SlotsState(absState):
     P_IRON = 0.55
     P_BOMB = 0.20
 
+    # Reels animate while spinning
+    TARGET_FPS = 60
+
     def onEnter(self) -> None:
         # Ensure you have a bank to work with (score from game over)
         if not hasattr(self.master, "bank"):
@@ -38,7 +40,7 @@ class SlotsState(absState):
         pass
 
     def _weighted_symbol(self) -> str:
-        r = random.random()
+        r = self.master.rng.stream("slots").random()
         if r < self.P_DIAMOND:
             return "diamond"
         if r < self.P_DIAMOND + self.P_IRON:
@@ -146,9 +148,8 @@ class SlotsState(absState):
                     return
 
     def update(self) -> None:
-        # Use engine dt if you want; simplest is a local clock tick
-        # But your project already has engine dt; here we’ll use pygame time.
-        dt = pygame.time.Clock().tick(60) / 1000.0
+        # Frame time as measured by the pacer (it also caps the rate)
+        dt = self.master.pacer.getFrameDt()
 
         if self.spinning:
             self.spin_time += dt
@@ -11,11 +11,16 @@ def green(text):
 
 class Debugger:
     HITBOXES = False
+    PACING = False
     STATE = None
 
     _isRunning = False
 
-    _debugOptions = {"1": "Show hitboxes", "2": "Custom game state"}
+    _debugOptions = {
+        "1": "Show hitboxes",
+        "2": "Custom game state",
+        "3": "Show frame pacing",
+    }
 
     @classmethod
     def _hitbox(cls):
@@ -32,6 +37,14 @@ class Debugger:
             )
             cls.HITBOXES = True
 
+    @classmethod
+    def _pacing(cls):
+        cls.PACING = not cls.PACING
+        if cls.PACING:
+            print(f"\nFrame pacing overlay is now {green('enabled')}\n")
+        else:
+            print(f"\nFrame pacing overlay is now {red('disabled')}\n")
+
     @classmethod
     def _states(cls):
         possibleStates = {"1": "mainMenu", "2": "gameInProgress"}
@@ -81,6 +94,9 @@ class Debugger:
                 case "2":
                     cls._states()
                     Debugger._prompt()
+                case "3":
+                    cls._pacing()
+                    Debugger._prompt()
                 case "q":
                     cls._toggle()
                 case _:
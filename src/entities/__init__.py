@@ -1,4 +1,6 @@
 from .player import Player
+from .archetype import Archetype
+from ._screen_bound import ScreenBound
 
 from .enemies._pipe import Pipe
 from .enemies.factory import PipeFactory
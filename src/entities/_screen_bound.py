@@ -0,0 +1,17 @@
+import pygame
+
+
+class ScreenBound:
+    """
+    Base of the spawned entity classes: they all draw on the same (virtual)
+    screen, so it's one class-level reference, set once at setup with
+    bind() (GameMaster does it) - never by a constructor.
+    """
+
+    __slots__ = ()
+
+    screen: pygame.Surface | None = None
+
+    @classmethod
+    def bind(cls, screen: pygame.Surface) -> None:
+        cls.screen = screen
@@ -0,0 +1,58 @@
+import pygame
+
+
+# (id(source), size, flipped) -> (source, scaled copy)
+# The source is kept alive with its copy, so an id can't be reused while cached
+_SCALED: dict[tuple[int, tuple[int, int], bool], tuple[pygame.Surface, pygame.Surface]] = {}
+
+
+def scaledSprite(
+    sprite: pygame.Surface,
+    size: tuple[int, int],
+    flip_y: bool = False,
+) -> pygame.Surface:
+    """
+    Smooth-scaled (optionally vertically flipped) copy of 'sprite', shared by
+    every entity of that size (entities only blit it - never draw onto it).
+    """
+    size = (int(size[0]), int(size[1]))
+    key = (id(sprite), size, bool(flip_y))
+
+    hit = _SCALED.get(key)
+    if hit is None or hit[0] is not sprite:
+        scaled = pygame.transform.smoothscale(sprite, size)
+        if flip_y:
+            scaled = pygame.transform.flip(scaled, False, True)
+        hit = (sprite, scaled)
+        _SCALED[key] = hit
+
+    return hit[1]
+
+
+# (id(source), size, flipped) -> (source, mask)
+_MASKS: dict[tuple[int, tuple[int, int], bool], tuple[pygame.Surface, pygame.mask.Mask]] = {}
+
+
+def spriteMask(
+    sprite: pygame.Surface,
+    size: tuple[int, int] | None = None,
+    flip_y: bool = False,
+) -> pygame.mask.Mask:
+    """
+    Collision mask of 'sprite' scaled to 'size' (default: as is) and
+    optionally flipped vertically - built once per (sprite, size, flip).
+    """
+    size = sprite.get_size() if size is None else (int(size[0]), int(size[1]))
+    key = (id(sprite), size, bool(flip_y))
+
+    hit = _MASKS.get(key)
+    if hit is None or hit[0] is not sprite:
+        surface = sprite
+        if size != sprite.get_size():
+            surface = pygame.transform.smoothscale(sprite, size)
+        if flip_y:
+            surface = pygame.transform.flip(surface, False, True)
+        hit = (sprite, pygame.mask.from_surface(surface))
+        _MASKS[key] = hit
+
+    return hit[1]
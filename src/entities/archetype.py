@@ -0,0 +1,18 @@
+class Archetype:
+    """
+    Entity groups of the EntityWorld - each one is stored and updated by
+    its own system, so the game loop never has to sort entities by type.
+    """
+
+    # Static, touching kills (pipes, spikes, lava)
+    LETHAL = "lethal"
+    # Static, walkable (resolved by the contact solver)
+    SOLID = "solid"
+    # Static, drawn only (collides through the TunnelField)
+    WALL = "wall"
+    # Rides the tunnel floor (mine carts)
+    FLOOR_FOLLOWER = "floor_follower"
+    # Fixed world x, animated height (fireballs)
+    OSCILLATOR = "oscillator"
+    # Coins
+    COLLECTIBLE = "collectible"
@@ -1,48 +1,72 @@
 import pygame
 from debugger import Debugger
+from .archetype import Archetype
+from ._screen_bound import ScreenBound
+from ._sprite_cache import scaledSprite, spriteMask
 
 
-class Coin:
-    def __init__(
+class Coin(ScreenBound):
+    # Static in world space => never updated per step
+    MOVES = False
+
+    __slots__ = ("pos", "radius", "value", "collected", "sprite")
+
+    def __init__(self, *args, **kwargs):
+        # Owned position - updated in place when the instance is recycled
+        self.pos = pygame.Vector2()
+        self.reinit(*args, **kwargs)
+
+    def reinit(
         self,
-        screen: pygame.Surface,
-        pos: pygame.Vector2,
+        pos: pygame.Vector2 | tuple[float, float],
         radius: int = 14,
         value: int = 1,
-        velocity: float = 500.0,
         sprite: pygame.Surface | None = None,
     ):
-        self.screen = screen
-        self.pos = pygame.Vector2(pos)
+        self.pos.update(pos)
         self.radius = radius
         self.value = value
-        self.velocity = velocity
         self.collected = False
 
+        # Scaled copy shared by every coin of this size
         self.sprite = sprite
         if self.sprite is not None:
-            self.sprite = pygame.transform.smoothscale(
-                self.sprite, (2 * self.radius, 2 * self.radius)
-            )
+            self.sprite = scaledSprite(self.sprite, (2 * self.radius, 2 * self.radius))
 
-    def update(self, dt: float) -> None:
-        self.pos.x -= self.velocity * dt
-
-    def shouldKill(self) -> bool:
-        return self.pos.x + self.radius <= 0 or self.collected
+    def shouldKill(self, scroll_x: float = 0.0) -> bool:
+        return self.pos.x + self.radius <= scroll_x
 
     def getHitbox(self):
         return self.pos, float(self.radius)
 
-    def draw(self) -> None:
+    # Pixel-exact collision (PhysicsEngine.maskCollision) - None without a sprite
+    def getSpriteRect(self) -> pygame.Rect | None:
+        if self.sprite is None:
+            return None
+        return self.sprite.get_rect(center=self.pos)
+
+    def getMask(self) -> pygame.mask.Mask | None:
+        if self.sprite is None:
+            return None
+        return spriteMask(self.sprite)
+
+    def getSpanX(self) -> tuple[float, float]:
+        return self.pos.x - self.radius, self.pos.x + self.radius
+
+    def getArchetype(self) -> str:
+        return Archetype.COLLECTIBLE
+
+    def draw(self, cam_x: float = 0.0, alpha: float = 1.0) -> None:
         if self.collected:
             return
 
+        pos = (self.pos.x - cam_x, self.pos.y)
+
         if self.sprite is not None:
-            rect = self.sprite.get_rect(center=self.pos)
+            rect = self.sprite.get_rect(center=pos)
             self.screen.blit(self.sprite, rect)
         else:
-            pygame.draw.circle(self.screen, "gold", self.pos, self.radius)
+            pygame.draw.circle(self.screen, "gold", pos, self.radius)
 
         if Debugger.HITBOXES:
-            pygame.draw.circle(self.screen, "orange", self.pos, self.radius, 2)
\ No newline at end of file
+            pygame.draw.circle(self.screen, "orange", pos, self.radius, 2)
\ No newline at end of file
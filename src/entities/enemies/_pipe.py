@@ -2,9 +2,36 @@ import pygame
 from enum import Enum
 
 from debugger import Debugger
+from ..archetype import Archetype
+from .._screen_bound import ScreenBound
+from .._sprite_cache import scaledSprite, spriteMask
+
+
+class Pipe(ScreenBound):
+    # Static in world space => never updated per step
+    MOVES = False
+
+    __slots__ = (
+        "curr_pos",
+        "orientation",
+        "width",
+        "height",
+        "passed",
+        "sprite",
+        "_source",
+        "_canvas",
+        "hitbox_scale",
+        "_hitbox",
+        "_hitbox_offset",
+    )
+
+    # Collision box as (width, height) fractions of the sprite, centred
+    DEFAULT_HITBOX_SCALE = (0.55, 0.90)
+
+    # Sprites are scaled to this height once per variant / orientation,
+    # every pipe height is then scaled from that copy
+    SPRITE_REF_HEIGHT = 512
 
-
-class Pipe:
     class Proportions(Enum):
         WIDTH = 110
         BASE_HEIGHT = 125
@@ -13,69 +40,129 @@ class Pipe:
         TOP = "top"
         BOTTOM = "bottom"
 
-    def __init__(
+    def __init__(self, *args, **kwargs):
+        # Owned position / hitbox - updated in place when the instance is recycled
+        self.curr_pos = pygame.Vector2()
+        self._hitbox = pygame.Rect(0, 0, 0, 0)
+
+        # Pixels this pipe's sprite is scaled into - kept across recycling
+        self._canvas: pygame.Surface | None = None
+        self.reinit(*args, **kwargs)
+
+    def reinit(
         self,
-        screen: pygame.Surface,
-        velocity: float,
         orientation: str,
         sprite: pygame.Surface,
-        curr_pos: pygame.Vector2 | None = None,
-        currPos: pygame.Vector2 | None = None,
+        curr_pos: pygame.Vector2 | tuple[float, float] | None = None,
+        currPos: pygame.Vector2 | tuple[float, float] | None = None,
         height: int | None = None,
         width: int | None = None,
+        hitbox_scale: tuple[float, float] | None = None,
     ):
-        self.screen = screen
-        self.velocity = float(velocity)
-
         pos = curr_pos if curr_pos is not None else currPos
         if pos is None:
             raise TypeError(
                 "Pipe requires a position: pass curr_pos=... (or legacy currPos=...)"
             )
-        self.curr_pos = pygame.Vector2(pos)
 
         if isinstance(orientation, Pipe.Orientation):
             self.orientation = orientation.value
         else:
             self.orientation = str(orientation).lower()
 
-        self.width = int(width) if width is not None else Pipe.Proportions.WIDTH.value
-        self.height = (
-            int(height) if height is not None else Pipe.Proportions.BASE_HEIGHT.value
+        self.passed = False
+
+        # Hitbox size / offset are fixed for the pipe's lifetime
+        self.width, self.height, self.hitbox_scale, size, self._hitbox_offset = Pipe._layout(
+            width, height, hitbox_scale
         )
+        self._hitbox.size = size
 
-        self.passed = False
+        self.setPosition(pos)
 
-        self.sprite = pygame.transform.smoothscale(sprite, (self.width, self.height))
-        if self.orientation == Pipe.Orientation.TOP.value:
-            self.sprite = pygame.transform.flip(self.sprite, False, True)
+        # Per-variant copy at the reference height, already flipped for
+        # top pipes (shared) - drawn sprite and collision mask both come from it
+        self._source = scaledSprite(
+            sprite,
+            (self.width, Pipe.SPRITE_REF_HEIGHT),
+            self.orientation == Pipe.Orientation.TOP.value,
+        )
+
+        # Scaled into this pipe's own canvas => recycling allocates no pixels
+        self.sprite = self._canvasView()
+        pygame.transform.smoothscale(self._source, (self.width, self.height), self.sprite)
+
+    @staticmethod
+    def _layout(width, height, hitbox_scale) -> tuple:
+        # (width, height, hitbox_scale, hitbox size, hitbox offset), defaults filled in
+        width = int(width) if width is not None else Pipe.Proportions.WIDTH.value
+        height = int(height) if height is not None else Pipe.Proportions.BASE_HEIGHT.value
+        if hitbox_scale is None:
+            hitbox_scale = Pipe.DEFAULT_HITBOX_SCALE
+        hb_w = int(width * hitbox_scale[0])
+        hb_h = int(height * hitbox_scale[1])
+        return width, height, hitbox_scale, (hb_w, hb_h), ((width - hb_w) // 2, (height - hb_h) // 2)
+
+    @classmethod
+    def hitboxFor(
+        cls,
+        curr_pos=None,
+        currPos=None,
+        height: int | None = None,
+        width: int | None = None,
+        hitbox_scale: tuple[float, float] | None = None,
+        **_,
+    ) -> pygame.Rect:
+        """
+        Hitbox a Pipe built with these arguments would have - without
+        building it (no sprite gets scaled). For offline checks.
+        """
+        x, y = curr_pos if curr_pos is not None else currPos
+        _, _, _, size, offset = cls._layout(width, height, hitbox_scale)
+        return pygame.Rect((int(x + offset[0]), int(y + offset[1])), size)
+
+    def _canvasView(self) -> pygame.Surface:
+        # (width, height) view of the canvas, grown only if it's too small
+        canvas = self._canvas
+        if canvas is None or canvas.get_width() < self.width or canvas.get_height() < self.height:
+            size = (self.width, self.height)
+            if canvas is not None:
+                size = (max(self.width, canvas.get_width()), max(self.height, canvas.get_height()))
+            canvas = pygame.Surface(size, pygame.SRCALPHA, self._source)
+            self._canvas = canvas
+        return canvas.subsurface((0, 0, self.width, self.height))
+
+    # Move the pipe (the hitbox follows, no new Rect)
+    def setPosition(self, pos: pygame.Vector2 | tuple[float, float]) -> None:
+        self.curr_pos.update(pos)
+        # (truncated like pygame.Rect(x, y, ...) - attribute assignment rounds)
+        self._hitbox.topleft = (
+            int(self.curr_pos.x + self._hitbox_offset[0]),
+            int(self.curr_pos.y + self._hitbox_offset[1]),
+        )
 
+    # Shared rect - read it, don't modify it
     def getHitbox(self) -> pygame.Rect:
-        hitbox_scale_x = 0.55   # 75% of sprite width
-        hitbox_scale_y = 0.90   # 90% of sprite heigh5
+        return self._hitbox
 
-        hb_w = int(self.width * hitbox_scale_x)
-        hb_h = int(self.height * hitbox_scale_y)
+    # Pixel-exact collision (PhysicsEngine.maskCollision): the whole sprite
+    def getSpriteRect(self) -> pygame.Rect:
+        return pygame.Rect(int(self.curr_pos.x), int(self.curr_pos.y), self.width, self.height)
 
-        offset_x = (self.width - hb_w) // 2
-        offset_y = (self.height - hb_h) // 2
+    def getMask(self) -> pygame.mask.Mask:
+        return spriteMask(self._source, (self.width, self.height))
 
-        return pygame.Rect(
-            self.curr_pos.x + offset_x,
-            self.curr_pos.y + offset_y,
-            hb_w,
-            hb_h,
-        )
+    def getSpanX(self) -> tuple[float, float]:
+        return self.curr_pos.x, self.curr_pos.x + self.width
 
-    def update(self, dt: float) -> None:
-        self.curr_pos.x -= self.velocity * dt
+    def getArchetype(self) -> str:
+        return Archetype.LETHAL
 
-    def shouldKill(self) -> bool:
-        return self.curr_pos.x + self.width <= 0
+    def shouldKill(self, scroll_x: float = 0.0) -> bool:
+        return self.curr_pos.x + self.width <= scroll_x
 
-    def draw(self) -> None:
+    def draw(self, cam_x: float = 0.0, alpha: float = 1.0) -> None:
         if Debugger.HITBOXES:
-            pygame.draw.rect(self.screen, "green", self.getHitbox(), 2)
+            pygame.draw.rect(self.screen, "green", self.getHitbox().move(-round(cam_x), 0), 2)
 
-        rect = self.sprite.get_rect(topleft=self.curr_pos)
-        self.screen.blit(self.sprite, rect)
+        self.screen.blit(self.sprite, (self.curr_pos.x - cam_x, self.curr_pos.y))
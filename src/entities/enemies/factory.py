@@ -41,8 +41,6 @@ class PipeFactory:
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
 
-        self.dftVelocity = 500.0
-
         self.dftSpawnRate = 0.8
         # First spawn is always faster - game start
         self.dtSpawn = 0.5
@@ -104,9 +102,7 @@ class PipeFactory:
 
         # Return the new pipe
         return Pipe(
-            screen=self.screen,
             currPos=pygame.Vector2(newX, newY),
-            velocity=self.dftVelocity,
             orientation=orientation,
             sprite=chooseSprite(self.sprites),
             height=pipe_height
@@ -1,35 +1,47 @@
 import pygame
 from debugger import Debugger
+from .archetype import Archetype
+from ._screen_bound import ScreenBound
 
 
-class HazardPatch:
+class HazardPatch(ScreenBound):
     """
-    A moving rectangular kill-zone (e.g. lava patch on the floor).
-    Treated like an obstacle: moves left, collides via rect hitbox.
+    A rectangular kill-zone (e.g. lava patch on the floor).
+    Treated like an obstacle: scrolls with the world, collides via rect hitbox.
     """
 
-    def __init__(
+    # Static in world space => never updated per step
+    MOVES = False
+
+    __slots__ = ("rect", "color")
+
+    def __init__(self, *args, **kwargs):
+        # Owned rect - updated in place when the instance is recycled
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reinit(*args, **kwargs)
+
+    def reinit(
         self,
-        screen: pygame.Surface,
-        rect: pygame.Rect,
-        velocity: float,
+        rect: pygame.Rect | tuple[int, int, int, int],
         color: str = "orangered3",
     ):
-        self.screen = screen
-        self.rect = rect
-        self.velocity = float(velocity)
+        self.rect.update(rect)
         self.color = color
 
-    def update(self, dt: float) -> None:
-        self.rect.x -= int(self.velocity * dt)
-
-    def shouldKill(self) -> bool:
-        return self.rect.right <= 0
+    def shouldKill(self, scroll_x: float = 0.0) -> bool:
+        return self.rect.right <= scroll_x
 
     def getHitbox(self) -> pygame.Rect:
         return self.rect
 
-    def draw(self) -> None:
-        pygame.draw.rect(self.screen, self.color, self.rect)
+    def getSpanX(self) -> tuple[float, float]:
+        return self.rect.left, self.rect.right
+
+    def getArchetype(self) -> str:
+        return Archetype.LETHAL
+
+    def draw(self, cam_x: float = 0.0, alpha: float = 1.0) -> None:
+        r = self.rect.move(-round(cam_x), 0)
+        pygame.draw.rect(self.screen, self.color, r)
         if Debugger.HITBOXES:
-            pygame.draw.rect(self.screen, "yellow", self.rect, 2)
+            pygame.draw.rect(self.screen, "yellow", r, 2)
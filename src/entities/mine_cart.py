@@ -1,25 +1,57 @@
 import pygame
 from debugger import Debugger
+from .archetype import Archetype
+from ._screen_bound import ScreenBound
+from ._sprite_cache import scaledSprite
 
 
-class MineCart:
+class MineCart(ScreenBound):
     """
     Lethal obstacle that rides the tunnel floor using gravity + floor constraint.
     Additionally, detects step-ups ahead and "crashes" (despawns) instead of phasing.
+
+    Positions are world-space: the camera already scrolls the cart with the
+    tunnel, so 'velocity' is only the extra speed on top of the world's.
+
+    Every live cart is stepped together (updateAll): one floor_y_at call
+    per field for all centre + front points. The gain is the batching -
+    on the game's field that call walks a list (see TunnelField). y is kept sub-pixel; small steps up are
+    climbed at CLIMB_SPEED instead of snapping onto them.
     """
 
+    # Has its own motion => updated every step
+    MOVES = True
+
+    # Rise speed while riding up onto a higher floor (px/s)
+    CLIMB_SPEED = 240.0
+
+    __slots__ = (
+        "rect",
+        "vx",
+        "vy",
+        "gravity",
+        "lethal",
+        "floor_field",
+        "dead",
+        "on_floor",
+        "step_threshold",
+        "sprite",
+        "x",
+        "y",
+        "prev_x",
+        "prev_y",
+    )
+
     def __init__(
         self,
-        screen: pygame.Surface,
-        rect: pygame.Rect,
+        rect: pygame.Rect | tuple[int, int, int, int],
         velocity: float,
         sprite: pygame.Surface | None = None,
         gravity: float = 2200.0,  # px/s^2
     ):
-        self.screen = screen
-        self.rect = rect
+        self.rect = pygame.Rect(rect)
 
-        # Horizontal speed (px/s). May be > tunnel speed.
+        # Horizontal speed relative to the world (px/s, leftwards)
         self.vx = float(velocity)
 
         # Vertical physics
@@ -34,13 +66,21 @@ class MineCart:
 
         # If ground in front rises too sharply, cart cannot climb => despawn/crash
         self.dead = False
+        self.on_floor = False
         self.step_threshold = 10  # pixels of rise between center and front considered a "wall"
 
+        # Scaled copy shared by every cart of this size
         self.sprite = sprite
         if self.sprite is not None:
-            self.sprite = pygame.transform.smoothscale(
-                self.sprite, (self.rect.width, self.rect.height)
-            )
+            self.sprite = scaledSprite(self.sprite, self.rect.size)
+
+        # Float position accumulates sub-pixel motion; rect is synced from it
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
+
+        # Position at the previous simulation step (render interpolation)
+        self.prev_x = self.x
+        self.prev_y = self.y
 
     def attach_floor_field(self, field) -> None:
         self.floor_field = field
@@ -48,51 +88,107 @@ class MineCart:
     def _floor_y(self) -> float | None:
         if self.floor_field is None:
             return None
-        return float(self.floor_field.floor_y_at(self.rect.centerx))
+        return float(self.floor_field.floor_y_at(self.x + self.rect.width * 0.5))
 
     def update(self, dt: float) -> None:
-        if self.dead:
-            return
-
-        # Move left
-        self.rect.x -= int(self.vx * dt)
-
-        # Apply vertical physics
-        self.vy += self.gravity * dt
-        self.rect.y += int(self.vy * dt)
-
-        if self.floor_field is None:
-            return
-
+        MineCart.updateAll([self], dt)
+
+    @staticmethod
+    def updateAll(carts: list, dt: float) -> None:
+        """
+        One simulation step for every cart: motion first, then a single
+        floor_y_at call (per field) for all centre and front points, then
+        the floor constraint + step-ahead crash check. The call is only
+        vectorized on a NumPy ring-buffer field, which the game's is not.
+        """
+        riding: dict = {}
+        for cart in carts:
+            if cart.dead:
+                continue
+
+            cart.prev_x = cart.x
+            cart.prev_y = cart.y
+
+            # Move left
+            cart.x -= cart.vx * dt
+
+            # Apply vertical physics
+            cart.vy += cart.gravity * dt
+            cart.y += cart.vy * dt
+
+            if cart.floor_field is not None:
+                riding.setdefault(cart.floor_field, []).append(cart)
+            else:
+                cart._syncRect()
+
+        for field, group in riding.items():
+            # Centres first, then fronts - one lookup call
+            xs = [c.x + c.rect.width * 0.5 for c in group]
+            xs.extend(c.x + c.rect.width for c in group)
+
+            floors = field.floor_y_at(xs)
+            if hasattr(floors, "tolist"):
+                floors = floors.tolist()
+
+            n = len(group)
+            for i, cart in enumerate(group):
+                cart._rideFloor(floors[i], floors[n + i], dt)
+
+    def _rideFloor(self, fy_center: float, fy_front: float, dt: float) -> None:
         # Constrain to floor (ride it)
-        fy = float(self.floor_field.floor_y_at(self.rect.centerx))
-        if self.rect.bottom > fy:
-            self.rect.bottom = int(fy)
+        ground = fy_center - self.rect.height
+        if self.y >= ground:
+            rise = self.y - ground
+            climb = self.CLIMB_SPEED * dt
+            if self.on_floor and climb < rise <= self.step_threshold:
+                # Small step under a riding cart => ease up onto it
+                # (bigger jumps are a freshly painted floor => snap)
+                self.y -= climb
+            else:
+                self.y = ground
             self.vy = 0.0
+            self.on_floor = True
+        else:
+            self.on_floor = False
 
-        # Step-ahead detection: if the floor in front is higher than current by threshold, crash/despawn
-        fy_center = float(self.floor_field.floor_y_at(self.rect.centerx))
-        fy_front = float(self.floor_field.floor_y_at(self.rect.right))
+        self._syncRect()
 
-        # floor_y smaller => higher ground
+        # Step-ahead detection: if the floor in front is higher than current by threshold, crash/despawn
+        # (floor_y smaller => higher ground)
         if (fy_center - fy_front) > self.step_threshold:
             self.dead = True
 
-    def shouldKill(self) -> bool:
-        return self.dead or (self.rect.right <= 0)
+    def _syncRect(self) -> None:
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
+
+    def shouldKill(self, scroll_x: float = 0.0) -> bool:
+        return self.dead or (self.rect.right <= scroll_x)
 
     def getHitbox(self) -> pygame.Rect:
         return self.rect
 
-    def draw(self) -> None:
+    def getSpanX(self) -> tuple[float, float]:
+        # Whole span swept during the last step (lets swept collision find it)
+        return min(self.prev_x, self.x), max(self.prev_x, self.x) + self.rect.width
+
+    def getArchetype(self) -> str:
+        return Archetype.FLOOR_FOLLOWER
+
+    def draw(self, cam_x: float = 0.0, alpha: float = 1.0) -> None:
+        r = self.rect.move(
+            round(self.prev_x + (self.x - self.prev_x) * alpha - cam_x) - self.rect.x,
+            round(self.prev_y + (self.y - self.prev_y) * alpha) - self.rect.y,
+        )
+
         if self.sprite is not None:
-            self.screen.blit(self.sprite, self.rect)
+            self.screen.blit(self.sprite, r)
         else:
-            pygame.draw.rect(self.screen, "gray20", self.rect, border_radius=6)
-            highlight = self.rect.inflate(
-                -self.rect.width * 0.25, -self.rect.height * 0.45
+            pygame.draw.rect(self.screen, "gray20", r, border_radius=6)
+            highlight = r.inflate(
+                -r.width * 0.25, -r.height * 0.45
             )
             pygame.draw.rect(self.screen, "gray35", highlight, border_radius=5)
 
         if Debugger.HITBOXES:
-            pygame.draw.rect(self.screen, "red", self.rect, 2)
+            pygame.draw.rect(self.screen, "red", r, 2)
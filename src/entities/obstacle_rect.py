@@ -1,54 +1,141 @@
 import pygame
 from debugger import Debugger
+from .archetype import Archetype
+from ._screen_bound import ScreenBound
 
 
-class RectObstacle:
+# Edge sets are immutable and shared - only a handful of combinations exist
+ALL_EDGES = frozenset({"left", "right", "top", "bottom"})
+NO_EDGES = frozenset()
+_EDGE_SETS: dict[frozenset, frozenset] = {ALL_EDGES: ALL_EDGES, NO_EDGES: NO_EDGES}
+
+
+def _sharedEdges(edges) -> frozenset:
+    edges = frozenset(edges)
+    return _EDGE_SETS.setdefault(edges, edges)
+
+
+class RectObstacle(ScreenBound):
     """
-    Generic rectangular obstacle.
+    Generic rectangular obstacle (world-space rect - the camera scrolls it).
 
     lethal=False  -> solid/walkable tunnel surface (resolved by engine)
     lethal=True   -> touching kills, but can be edge-restricted with lethal_edges.
 
     lethal_edges can include: {"left", "right", "top", "bottom"}
     For your game: use {"left"} for the step-face so ONLY the leading edge kills.
+
+    in_field=True  -> the surface is painted into the TunnelField, which is
+                      what the player collides with; the rect is only drawn.
     """
 
-    def __init__(
+    # Static in world space => never updated per step
+    MOVES = False
+
+    # Hundreds are spawned per minute => no per-instance __dict__
+    __slots__ = (
+        "rect",
+        "color",
+        "lethal",
+        "in_field",
+        "lethal_edges",
+        "edge_margin",
+        "all_edges_lethal",
+        "edge_zones",
+        "grows",
+    )
+
+    def __init__(self, *args, **kwargs):
+        # Owned rect - updated in place when the instance is recycled
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reinit(*args, **kwargs)
+
+    def reinit(
         self,
-        screen: pygame.Surface,
-        rect: pygame.Rect,
-        velocity: float,
+        rect: pygame.Rect | tuple[int, int, int, int],
         color="slategray4",
         lethal: bool = True,
         lethal_edges: set[str] | None = None,
         edge_margin: int = 10,
+        in_field: bool = False,
+        grows: bool = False,
     ):
-        self.screen = screen
-        self.rect = rect
-        self.velocity = float(velocity)
+        self.rect.update(rect)
         self.color = color
         self.lethal = bool(lethal)
+        self.in_field = bool(in_field)
+
+        # May widen after it's spawned (see extendTo)
+        self.grows = bool(grows)
 
         # If None: default behavior
         # - lethal True -> all edges lethal
         # - lethal False -> no edges lethal
         if lethal_edges is None:
-            self.lethal_edges = {"left", "right", "top", "bottom"} if self.lethal else set()
+            self.lethal_edges = ALL_EDGES if self.lethal else NO_EDGES
         else:
-            self.lethal_edges = set(lethal_edges)
+            self.lethal_edges = _sharedEdges(lethal_edges)
 
         # Thickness of edge zones in pixels for edge-based lethal checks
         self.edge_margin = int(edge_margin)
 
-    def update(self, dt: float) -> None:
-        self.rect.x -= int(self.velocity * dt)
+        # Decided once here instead of on every collision test
+        self.all_edges_lethal = self.lethal and self.lethal_edges == ALL_EDGES
+        self._buildEdgeZones()
+
+    def _buildEdgeZones(self) -> None:
+        """
+        Lethal edge zones as world-space (left, top, right, bottom) tuples.
+        Obstacles don't move in world space (the camera scrolls), so the
+        zones only change when the instance is recycled.
+        """
+        if not self.lethal or self.all_edges_lethal:
+            self.edge_zones = ()
+            return
+
+        m = self.edge_margin
+        left, top, right, bottom = self.rect.left, self.rect.top, self.rect.right, self.rect.bottom
+
+        zones = []
+        if "left" in self.lethal_edges:
+            zones.append((left, top, left + m, bottom))
+        if "right" in self.lethal_edges:
+            zones.append((right - m, top, right, bottom))
+        if "top" in self.lethal_edges:
+            zones.append((left, top, right, top + m))
+        if "bottom" in self.lethal_edges:
+            zones.append((left, bottom - m, right, bottom))
+        self.edge_zones = tuple(zones)
+
+    def extendTo(self, rect: tuple[int, int, int, int]) -> bool:
+        """
+        Grow right to also cover 'rect' if it continues this obstacle at the
+        same height (same top / height, starts no further right than this
+        one ends). Returns False - and changes nothing - otherwise.
+        """
+        x, y, w, h = rect
+        r = self.rect
+        if not self.grows or y != r.y or h != r.height or not r.left <= x <= r.right:
+            return False
+
+        r.width = max(r.width, x + w - r.left)
+        self._buildEdgeZones()
+        return True
 
-    def shouldKill(self) -> bool:
-        return self.rect.right <= 0
+    def shouldKill(self, scroll_x: float = 0.0) -> bool:
+        return self.rect.right <= scroll_x
 
     def getHitbox(self) -> pygame.Rect:
         return self.rect
 
+    def getSpanX(self) -> tuple[float, float]:
+        return self.rect.left, self.rect.right
+
+    def getArchetype(self) -> str:
+        if self.in_field:
+            return Archetype.WALL
+        return Archetype.LETHAL if self.lethal else Archetype.SOLID
+
     def is_lethal_collision(self, player) -> bool:
         """
         Return True ONLY if the collision happens on a lethal edge zone.
@@ -58,61 +145,47 @@ class RectObstacle:
             return False
 
         # If all edges are lethal, you can just treat any overlap as lethal
-        if self.lethal_edges == {"left", "right", "top", "bottom"}:
+        if self.all_edges_lethal:
             return True
 
-        center, radius = player.getHitbox()
-
         # Overlap already confirmed by caller; now decide whether it's on a lethal edge.
-        m = self.edge_margin
-
-        # Define thin edge zones
-        if "left" in self.lethal_edges:
-            left_zone = pygame.Rect(self.rect.left, self.rect.top, m, self.rect.height)
-            if self._circle_rect_overlap(center, radius, left_zone):
-                return True
-
-        if "right" in self.lethal_edges:
-            right_zone = pygame.Rect(self.rect.right - m, self.rect.top, m, self.rect.height)
-            if self._circle_rect_overlap(center, radius, right_zone):
-                return True
-
-        if "top" in self.lethal_edges:
-            top_zone = pygame.Rect(self.rect.left, self.rect.top, self.rect.width, m)
-            if self._circle_rect_overlap(center, radius, top_zone):
-                return True
+        center, radius = player.getHitbox()
+        return self._touchesEdgeZone(center.x, center.y, radius * radius)
 
-        if "bottom" in self.lethal_edges:
-            bottom_zone = pygame.Rect(self.rect.left, self.rect.bottom - m, self.rect.width, m)
-            if self._circle_rect_overlap(center, radius, bottom_zone):
+    def _touchesEdgeZone(self, cx: float, cy: float, r2: float) -> bool:
+        for left, top, right, bottom in self.edge_zones:
+            dx = cx - max(left, min(cx, right))
+            dy = cy - max(top, min(cy, bottom))
+            if dx * dx + dy * dy < r2:
                 return True
-
         return False
 
     @staticmethod
-    def _circle_rect_overlap(center: pygame.Vector2, radius: float, rect: pygame.Rect) -> bool:
+    def filterLethal(obstacles: list, center: pygame.Vector2, radius: float) -> list:
+        """
+        Batch version of is_lethal_collision for one circle vs many overlapping
+        obstacles: keeps those that really kill. Anything that isn't
+        edge-restricted (other hazards included) is kept as is.
+        """
         cx, cy = center.x, center.y
-        closest_x = max(rect.left, min(cx, rect.right))
-        closest_y = max(rect.top, min(cy, rect.bottom))
-        dx = cx - closest_x
-        dy = cy - closest_y
-        return (dx * dx + dy * dy) < (radius * radius)
+        r2 = radius * radius
+
+        kept = []
+        for obs in obstacles:
+            if getattr(obs, "all_edges_lethal", True) or obs._touchesEdgeZone(cx, cy, r2):
+                kept.append(obs)
+        return kept
+
+    def draw(self, cam_x: float = 0.0, alpha: float = 1.0) -> None:
+        r = self.rect.move(-round(cam_x), 0)
 
-    def draw(self) -> None:
-        pygame.draw.rect(self.screen, self.color, self.rect)
+        pygame.draw.rect(self.screen, self.color, r)
 
         if Debugger.HITBOXES:
             outline = "green" if not self.lethal else "red"
-            pygame.draw.rect(self.screen, outline, self.rect, 2)
+            pygame.draw.rect(self.screen, outline, r, 2)
 
             # If edge-based lethal, visualize edge zones (optional but helpful)
-            if self.lethal and self.lethal_edges != {"left", "right", "top", "bottom"}:
-                m = self.edge_margin
-                if "left" in self.lethal_edges:
-                    pygame.draw.rect(self.screen, "red", (self.rect.left, self.rect.top, m, self.rect.height), 1)
-                if "right" in self.lethal_edges:
-                    pygame.draw.rect(self.screen, "red", (self.rect.right - m, self.rect.top, m, self.rect.height), 1)
-                if "top" in self.lethal_edges:
-                    pygame.draw.rect(self.screen, "red", (self.rect.left, self.rect.top, self.rect.width, m), 1)
-                if "bottom" in self.lethal_edges:
-                    pygame.draw.rect(self.screen, "red", (self.rect.left, self.rect.bottom - m, self.rect.width, m), 1)
+            dx = r.left - self.rect.left
+            for left, top, right, bottom in self.edge_zones:
+                pygame.draw.rect(self.screen, "red", (left + dx, top, right - left, bottom - top), 1)
@@ -1,6 +1,7 @@
 import pygame
 
 from debugger import Debugger
+from ._sprite_cache import spriteMask
 
 # ======================= #
 ########## TO DO ##########
@@ -82,6 +83,9 @@ class Player:
         else:
             self.currPos = currPos
 
+        # Position at the previous simulation step (render interpolation)
+        self.prevPos = pygame.Vector2(self.currPos)
+
     # NEW - hitbox integration
     @property
     def _hitbox(self):
@@ -90,6 +94,13 @@ class Player:
     def getHitbox(self):
         return self._hitbox
 
+    # Pixel-exact collision - the current sprite, centred on the player
+    def getSpriteRect(self) -> pygame.Rect:
+        return self._currentSprite.get_rect(center=self.currPos)
+
+    def getMask(self) -> pygame.mask.Mask:
+        return spriteMask(self._currentSprite)
+
     # Change sprites
     def changeSprite(self, name: str) -> None:
         self._currentSprite = self.sprites[name]
@@ -124,12 +135,16 @@ class Player:
             case "FALLING":
                 self.changeSprite("dropSprite")
 
-    # Display method
-    def draw(self) -> None:
+    # Display method - 'alpha' blends between previous and current step,
+    # 'camX' converts the world position to the screen
+    def draw(self, camX: float = 0.0, alpha: float = 1.0) -> None:
+        renderPos = self.prevPos.lerp(self.currPos, alpha)
+        renderPos.x -= camX
+
         # Draw only the player - no hitbox
-        rect = self._currentSprite.get_rect(center=self.currPos)
+        rect = self._currentSprite.get_rect(center=renderPos)
         self.screen.blit(self._currentSprite, rect)
 
         # Player hitbox
         if Debugger.HITBOXES:
-            pygame.draw.circle(self.screen, "red", self.currPos, self._radius, 2)
+            pygame.draw.circle(self.screen, "red", renderPos, self._radius, 2)
@@ -0,0 +1,24 @@
+class Camera:
+    """
+    Horizontal scroll offset of the world.
+
+    Entities keep fixed world-space x coordinates; moving the world is a
+    single addition here instead of one per entity.
+      screen_x = world_x - camera.x
+    """
+
+    def __init__(self):
+        self.x = 0.0
+        self.prev_x = 0.0
+
+    def reset(self) -> None:
+        self.x = 0.0
+        self.prev_x = 0.0
+
+    def update(self, dt: float, speed: float) -> None:
+        self.prev_x = self.x
+        self.x += speed * dt
+
+    def getRenderX(self, alpha: float) -> float:
+        # Interpolated between the previous and the current simulation step
+        return self.prev_x + (self.x - self.prev_x) * alpha
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from types import MappingProxyType
+
+
+class DifficultyTable:
+    """
+    A spawner's tier-dependent parameters, compiled once for tiers
+    0..max_tier instead of being recomputed on every spawn.
+
+    Each record is a read-only mapping (parameter name -> value). Tiers past
+    'max_tier' reuse the last record - it must be a tier from which every
+    parameter has hit its cap.
+
+    Dump every spawner's table for tuning review from the /src/ directory:
+        python -m benchmarks.difficulty_tables
+    """
+
+    def __init__(self, name: str, compile_tier, max_tier: int):
+        self.name = name
+        self.records = tuple(
+            MappingProxyType(dict(compile_tier(tier))) for tier in range(max_tier + 1)
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def lookup(self, tier: int) -> MappingProxyType:
+        tier = min(max(0, int(tier)), len(self.records) - 1)
+        return self.records[tier]
+
+    def apply(self, target, tier: int) -> MappingProxyType:
+        """
+        Copy the tier's parameters onto 'target' (as attributes).
+        """
+        record = self.lookup(tier)
+        for name, value in record.items():
+            setattr(target, name, value)
+        return record
+
+    def dump(self) -> str:
+        """
+        Plain-text table, one row per tier.
+        """
+        names = list(self.records[0])
+        widths = [max(len(n), 6) for n in names]
+
+        def fmt(value) -> str:
+            return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+        lines = [
+            f"{self.name} (tiers 0..{len(self.records) - 1}, capped after)",
+            f"{'tier':>4} | " + " | ".join(f"{n:>{w}}" for n, w in zip(names, widths)),
+        ]
+        lines.append("-" * len(lines[-1]))
+        for tier, record in enumerate(self.records):
+            lines.append(
+                f"{tier:>4} | "
+                + " | ".join(f"{fmt(record[n]):>{w}}" for n, w in zip(names, widths))
+            )
+        return "\n".join(lines)
+
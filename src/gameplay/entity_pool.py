@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+
+class EntityPool:
+    """
+    Per-type free lists of dead entities.
+
+    Spawners acquire() instead of constructing; an entity that scrolled out
+    is release()d and its next acquire() runs reinit() on it instead of
+    allocating a new object (and its rect / position). Only types with a
+    reinit() method are pooled - anything else is left to the GC.
+
+    hits / misses count acquire() calls served from / missing the pool;
+    in steady-state gameplay nearly every call should be a hit.
+    """
+
+    # Free instances kept per type (more than ever live at once)
+    MAX_FREE = 256
+
+    def __init__(self):
+        self._free: dict[type, list] = {}
+        self.hits: dict[type, int] = {}
+        self.misses: dict[type, int] = {}
+
+    def acquire(self, cls, *args, **kwargs):
+        free = self._free.get(cls)
+        if free:
+            entity = free.pop()
+            entity.reinit(*args, **kwargs)
+            self.hits[cls] = self.hits.get(cls, 0) + 1
+            return entity
+
+        self.misses[cls] = self.misses.get(cls, 0) + 1
+        return cls(*args, **kwargs)
+
+    def release(self, entity) -> None:
+        cls = type(entity)
+        if not hasattr(cls, "reinit"):
+            return
+
+        free = self._free.setdefault(cls, [])
+        if len(free) < self.MAX_FREE:
+            free.append(entity)
+
+    def clear(self) -> None:
+        self._free.clear()
+
+    def resetStats(self) -> None:
+        self.hits.clear()
+        self.misses.clear()
+
+    def getHitRate(self) -> float:
+        hits = sum(self.hits.values())
+        total = hits + sum(self.misses.values())
+        return hits / total if total else 1.0
+
+    def stats(self) -> dict[str, tuple[int, int, int]]:
+        """
+        Type name -> (hits, misses, free instances).
+        """
+        types = set(self.hits) | set(self.misses) | set(self._free)
+        return {
+            cls.__name__: (
+                self.hits.get(cls, 0),
+                self.misses.get(cls, 0),
+                len(self._free.get(cls, ())),
+            )
+            for cls in types
+        }
+
+
+# Shared by every spawner and the game loop
+ENTITY_POOL = EntityPool()
@@ -0,0 +1,138 @@
+from bisect import bisect_left, bisect_right
+
+
+class EntityTimeline:
+    """
+    World-space entities kept ordered by their left edge (world x).
+
+    The camera scrolls the world, so static entities never move: the x order
+    never changes, they only need dropping once they leave on the left, and
+    collision only needs the entities whose x-span overlaps the player's band:
+      - bisect to the first entity that could reach the band
+      - walk right until entities start past the band
+
+    Very wide entities (lava strips) would blow up the search window, so
+    they live in a small side list that is always checked - so do entities
+    that may still widen after they're added ('grows', e.g. tunnel walls). Entities with
+    their own motion (MOVES = True: carts, fireballs) are few; they are kept
+    unordered, updated every step and always checked too.
+
+    Entities must provide: shouldKill(scroll_x), getSpanX() -> (left, right)
+    and, if they move, update(dt).
+
+    Dropped entities are handed to 'on_drop' (e.g. EntityPool.release) so
+    they can be recycled.
+    """
+
+    # Anything wider than this is not indexed
+    WIDE_PX = 400
+
+    def __init__(self):
+        self._items = []
+        self._lefts: list[float] = []
+        self._wide = []
+        self._movers = []
+
+        # Widest indexed entity - how far left of the band we must look
+        self._max_width = 0.0
+
+    def __iter__(self):
+        # Wide entities (floors, lava) first so they draw underneath
+        yield from self._wide
+        yield from self._items
+        yield from self._movers
+
+    def __len__(self) -> int:
+        return len(self._items) + len(self._wide) + len(self._movers)
+
+    def clear(self, on_drop=None) -> None:
+        if on_drop is not None:
+            for e in self:
+                on_drop(e)
+
+        self._items.clear()
+        self._lefts.clear()
+        self._wide.clear()
+        self._movers.clear()
+        self._max_width = 0.0
+
+    def add(self, entity) -> None:
+        if getattr(entity, "MOVES", False):
+            self._movers.append(entity)
+            return
+
+        left, right = entity.getSpanX()
+        if right - left > self.WIDE_PX or getattr(entity, "grows", False):
+            self._wide.append(entity)
+            return
+
+        # New spawns are at the right edge => this is an append in practice
+        i = bisect_right(self._lefts, left)
+        self._items.insert(i, entity)
+        self._lefts.insert(i, left)
+        self._max_width = max(self._max_width, right - left)
+
+    def extend(self, entities) -> None:
+        for e in entities:
+            self.add(e)
+
+    def update(self, dt: float, scroll_x: float, on_drop=None) -> None:
+        """
+        Advance moving entities and drop everything that scrolled out.
+        """
+        # Static entities leave in x order => only look at the front
+        items = self._items
+        k = 0
+        while k < len(items) and items[k].shouldKill(scroll_x):
+            if on_drop is not None:
+                on_drop(items[k])
+            k += 1
+        if k:
+            del items[:k]
+            del self._lefts[:k]
+
+        if self._wide:
+            wide = []
+            for e in self._wide:
+                if not e.shouldKill(scroll_x):
+                    wide.append(e)
+                elif on_drop is not None:
+                    on_drop(e)
+            self._wide = wide
+
+        if self._movers:
+            movers = []
+            for e in self._movers:
+                e.update(dt)
+                if not e.shouldKill(scroll_x):
+                    movers.append(e)
+                elif on_drop is not None:
+                    on_drop(e)
+            self._movers = movers
+
+    def query(self, x0: float, x1: float) -> list:
+        """
+        Entities whose x-span overlaps [x0, x1].
+        """
+        hits = []
+        for e in self._wide:
+            left, right = e.getSpanX()
+            if left <= x1 and right >= x0:
+                hits.append(e)
+
+        items = self._items
+        lefts = self._lefts
+        n = len(lefts)
+
+        i = bisect_left(lefts, x0 - self._max_width)
+        while i < n and lefts[i] <= x1:
+            if items[i].getSpanX()[1] >= x0:
+                hits.append(items[i])
+            i += 1
+
+        for e in self._movers:
+            left, right = e.getSpanX()
+            if left <= x1 and right >= x0:
+                hits.append(e)
+
+        return hits
@@ -0,0 +1,170 @@
+from entities import Archetype, MineCart
+from gameplay.entity_timeline import EntityTimeline
+
+
+class EntityWorld:
+    """
+    Every spawned entity, grouped by archetype (see entities.Archetype).
+
+    Static archetypes live in their own x-ordered EntityTimeline, moving
+    ones in plain lists with a dedicated update system. Because the groups
+    are separate, collision asks for exactly what it needs (lethal, solid,
+    coins) instead of sorting a mixed list every step, and a new hazard
+    type only costs work in its own group.
+
+    Systems run in a fixed order: floor followers, oscillators, then the
+    static groups drop whatever scrolled out.
+
+    'time' is the sim time of the current run. Oscillators are stamped with
+    it when added and positioned from it (closed form) - only the ones
+    inside the view ('view_width' px from the scroll offset) are evaluated.
+    """
+
+    def __init__(self, view_width: float = 1280.0):
+        self.view_width = float(view_width)
+        self.time = 0.0
+
+        self.lethal = EntityTimeline()
+        self.solid = EntityTimeline()
+        self.walls = EntityTimeline()
+        self.coins = EntityTimeline()
+        self.carts: list = []
+        self.fireballs: list = []
+
+        self._timelines = {
+            Archetype.LETHAL: self.lethal,
+            Archetype.SOLID: self.solid,
+            Archetype.WALL: self.walls,
+            Archetype.COLLECTIBLE: self.coins,
+        }
+
+    def __iter__(self):
+        # Draw order: walls at the back, coins on top
+        yield from self.walls
+        yield from self.lethal
+        yield from self.solid
+        yield from self.carts
+        yield from self.fireballs
+        yield from self.coins
+
+    def __len__(self) -> int:
+        return (
+            len(self.walls)
+            + len(self.lethal)
+            + len(self.solid)
+            + len(self.carts)
+            + len(self.fireballs)
+            + len(self.coins)
+        )
+
+    def add(self, entity) -> None:
+        archetype = entity.getArchetype()
+
+        if archetype == Archetype.FLOOR_FOLLOWER:
+            self.carts.append(entity)
+        elif archetype == Archetype.OSCILLATOR:
+            entity.setSpawnTime(self.time)
+            self.fireballs.append(entity)
+        else:
+            self._timelines[archetype].add(entity)
+
+    def extend(self, entities) -> None:
+        for e in entities:
+            self.add(e)
+
+    def clear(self, on_drop=None) -> None:
+        for timeline in self._timelines.values():
+            timeline.clear(on_drop)
+
+        if on_drop is not None:
+            for e in self.carts:
+                on_drop(e)
+            for e in self.fireballs:
+                on_drop(e)
+
+        self.carts.clear()
+        self.fireballs.clear()
+
+        self.time = 0.0
+
+    # --------------------------
+    # Systems
+    # --------------------------
+    def _updateFloorFollowers(self, dt: float, scroll_x: float, on_drop) -> None:
+        # Every cart in one batch (one floor lookup for all of them)
+        MineCart.updateAll(self.carts, dt)
+
+        carts = []
+        for cart in self.carts:
+            if not cart.shouldKill(scroll_x):
+                carts.append(cart)
+            elif on_drop is not None:
+                on_drop(cart)
+        self.carts = carts
+
+    def _updateOscillators(self, dt: float, scroll_x: float, on_drop) -> None:
+        view_x1 = scroll_x + self.view_width
+        t = self.time
+
+        fireballs = []
+        for fireball in self.fireballs:
+            if fireball.shouldKill(scroll_x):
+                if on_drop is not None:
+                    on_drop(fireball)
+                continue
+
+            # Still past the right edge => nothing to draw or hit yet
+            if fireball.x - fireball.radius <= view_x1:
+                fireball.moveTo(t)
+            fireballs.append(fireball)
+        self.fireballs = fireballs
+
+    def update(self, dt: float, scroll_x: float, on_drop=None) -> None:
+        """
+        Run every system once, dropping (and handing to 'on_drop') what
+        scrolled out.
+        """
+        self.time += dt
+
+        if self.carts:
+            self._updateFloorFollowers(dt, scroll_x, on_drop)
+        if self.fireballs:
+            self._updateOscillators(dt, scroll_x, on_drop)
+
+        for timeline in self._timelines.values():
+            timeline.update(dt, scroll_x, on_drop)
+
+    # --------------------------
+    # Queries (entities whose x-span overlaps [x0, x1])
+    # --------------------------
+    @staticmethod
+    def _overlapping(entities: list, x0: float, x1: float) -> list:
+        hits = []
+        for e in entities:
+            left, right = e.getSpanX()
+            if left <= x1 and right >= x0:
+                hits.append(e)
+        return hits
+
+    def queryLethal(self, x0: float, x1: float) -> list:
+        hits = self.lethal.query(x0, x1)
+        if self.carts:
+            hits.extend(self._overlapping(self.carts, x0, x1))
+        return hits
+
+    def queryLethalCircles(self, x0: float, x1: float) -> list:
+        # Lethal entities with a (center, radius) hitbox
+        if not self.fireballs:
+            return []
+        return self._overlapping(self.fireballs, x0, x1)
+
+    def querySolid(self, x0: float, x1: float) -> list:
+        return self.solid.query(x0, x1)
+
+    def queryCoins(self, x0: float, x1: float) -> list:
+        # Collected coins stay (hidden) until they scroll out
+        return [coin for coin in self.coins.query(x0, x1) if not coin.collected]
+
+    def draw(self, cam_x: float = 0.0, alpha: float = 1.0) -> None:
+        for e in self:
+            e.draw(cam_x, alpha)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+import pygame
+from debugger import Debugger
+
+
+class LavaBand:
+    """
+    Floor lava of the spike sections, as one band instead of a strip entity
+    per spike.
+
+    Every spike spawn extends the band (world x spans, like the old strips
+    covered); spans that overlap are merged, so a whole section is a single
+    rect. Past the lethal span the band fades out over FADE_PX on both ends -
+    that's where the section starts / ends on screen.
+
+    One collision check (hits) and one draw per frame.
+    """
+
+    # Length of the fade at each end of a span (not lethal)
+    FADE_PX = 160
+
+    def __init__(self, screen: pygame.Surface, height: int, color: str = "orangered3"):
+        self.screen = screen
+        self.height = int(height)
+        self.color = pygame.Color(color)
+
+        # Lethal spans (world space), ordered by x
+        self.spans: list[pygame.Rect] = []
+
+        self._fade_in, self._fade_out = self._buildFades()
+
+    def _buildFades(self) -> tuple[pygame.Surface, pygame.Surface]:
+        # Alpha ramp 0 -> 255 (left end) and its mirror (right end)
+        fade_in = pygame.Surface((self.FADE_PX, self.height), pygame.SRCALPHA)
+        for i in range(self.FADE_PX):
+            a = int(255 * (i + 1) / self.FADE_PX)
+            fade_in.fill((self.color.r, self.color.g, self.color.b, a), (i, 0, 1, self.height))
+        return fade_in, pygame.transform.flip(fade_in, True, False)
+
+    def reset(self) -> None:
+        self.spans.clear()
+
+    def getTopY(self) -> int:
+        return self.screen.get_height() - self.height
+
+    def extend(self, x0: float, x1: float) -> None:
+        """
+        Make [x0, x1] (world x) lava, merging into the last span if they touch.
+        """
+        x0, x1 = int(x0), int(x1)
+        if self.spans and x0 <= self.spans[-1].right:
+            last = self.spans[-1]
+            if x1 > last.right:
+                last.width = x1 - last.left
+            return
+
+        self.spans.append(pygame.Rect(x0, self.getTopY(), x1 - x0, self.height))
+
+    def scroll_to(self, scroll_x: float) -> None:
+        # Drop spans whose fade left the screen
+        while self.spans and self.spans[0].right + self.FADE_PX <= scroll_x:
+            self.spans.pop(0)
+
+    def hits(self, center: pygame.Vector2, radius: float) -> bool:
+        for span in self.spans:
+            if span.left > center.x + radius:
+                break
+            dx = center.x - max(span.left, min(center.x, span.right))
+            dy = center.y - max(span.top, min(center.y, span.bottom))
+            if dx * dx + dy * dy < radius * radius:
+                return True
+        return False
+
+    def draw(self, cam_x: float = 0.0) -> None:
+        view_w = self.screen.get_width()
+        ox = -round(cam_x)
+
+        for span in self.spans:
+            r = span.move(ox, 0)
+            if r.right + self.FADE_PX <= 0 or r.left - self.FADE_PX >= view_w:
+                continue
+
+            self.screen.fill(self.color, r)
+            if Debugger.HITBOXES:
+                pygame.draw.rect(self.screen, "yellow", r, 2)
+            self.screen.blit(self._fade_in, (r.left - self.FADE_PX, r.top))
+            self.screen.blit(self._fade_out, (r.right, r.top))
@@ -1,8 +1,10 @@
 import pygame
 
 from entities import Player
+from entities import RectObstacle, HazardPatch, Coin, MineCart, Pipe
 
 from core import PhysicsEngine
+from core import FramePacer
 from core import MainMenuState
 from core import GameInProgressState
 from core import PauseMenuState
@@ -16,6 +18,13 @@ from config.high_score import HighScoreManager
 
 from gameplay.section_manager import SectionManager
 from gameplay.progression import Progression
+from gameplay.entity_world import EntityWorld
+from gameplay.entity_pool import ENTITY_POOL
+from gameplay.camera import Camera
+from gameplay.run_random import RUN_RANDOM
+from gameplay.spawners.spikes_spawner import Fireball
+
+from debugger import Debugger
 
 
 class GameMaster:
@@ -27,27 +36,45 @@ class GameMaster:
         sound: SoundManager = None,
         running: bool = False,
         highestScore = 0,
+        seed: int | None = None,
     ):
         self.screen = screen
         self.engine = engine
 
+        # Every spawned entity draws on this screen
+        for cls in (RectObstacle, HazardPatch, Coin, MineCart, Pipe, Fireball):
+            cls.bind(screen)
+
         self.player = player
         self.sound = sound
         self.highestScore = HighScoreManager.load()
 
-        # Obstacles & collectibles
-        self.pipes = []   # now: obstacles list (Pipe + RectObstacle)
-        self.coins = []
+        # Obstacles & collectibles, grouped by archetype
+        self.world = EntityWorld(self.screen.get_width())
+
+        # Dead entities waiting to be recycled by the spawners
+        self.pool = ENTITY_POOL
+
+        # World scroll (entities live in world space)
+        self.camera = Camera()
 
         # Score is coin-based now
         self.score = 0
 
+        # Seeded random streams of the run (seed => same run every time)
+        self.rng = RUN_RANDOM
+        self.rng.fixSeed(seed)
+
         # New systems
         self.section_manager = SectionManager(self.screen)
         self.progression = Progression(self.screen)
 
         self.running = running
 
+        # Per-state frame pacing (menus don't need a full core)
+        self.pacer = FramePacer()
+        self.hasFocus = True
+
         self.states = {
             "mainMenu": MainMenuState(self),
             "gameInProgress": GameInProgressState(self),
@@ -75,20 +102,19 @@ class GameMaster:
         self.player.currPos = pygame.Vector2(
             self.screen.get_width() / 2, self.screen.get_height() / 2
         )
+        self.player.prevPos = pygame.Vector2(self.player.currPos)
         self.player.jumpPressed = False
         self.player.state = "IDLE"
         self.player.velocity = pygame.Vector2(0, 0)
 
-        # Reset score + collectibles
+        # Reset score + obstacles & collectibles
         self.score = 0
-        self.coins.clear()
-
-        # Reset obstacles
-        self.pipes.clear()
+        self.world.clear(self.pool.release)
+        self.camera.reset()
 
         # Reset run systems (THIS is the "t = 0" equivalent now)
-        self.section_manager.reset()
         self.progression.reset()
+        self.section_manager.reset()
 
         # Reset time so dt doesn't spike
         self.engine.resetClock()
@@ -105,9 +131,16 @@ class GameMaster:
         self._currState.update()
         self._currState.draw()
 
+        if Debugger.PACING:
+            self._drawPacing()
+
         for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
+            if event.type == pygame.WINDOWFOCUSLOST:
+                self.hasFocus = False
+            if event.type == pygame.WINDOWFOCUSGAINED:
+                self.hasFocus = True
             if event.type == pygame.KEYDOWN:
                 match event.key:
                     case pygame.K_e:
@@ -122,3 +155,30 @@ class GameMaster:
                     case pygame.K_a:
                         self.sound.changeMusicVolume(-0.2)
                         SettingsManager.setUserPreferences({"music": self.sound.musicVolume})
+
+    # Wait for the next frame - call once per frame, after the flip
+    def pace(self) -> None:
+        if self.hasFocus or not self._currState.THROTTLE_UNFOCUSED:
+            self.pacer.wait(self._currState.TARGET_FPS)
+        else:
+            self.pacer.wait(FramePacer.UNFOCUSED_FPS)
+
+    # Stop background work (section generation) - call once, on exit
+    def close(self) -> None:
+        self.section_manager.close()
+
+    # Achieved frame rate + jitter overlay (debugger option)
+    def _drawPacing(self) -> None:
+        font = pygame.font.Font(None, 30)
+        text = font.render(
+            f"{self.pacer.getFps():.1f} fps | jitter {self.pacer.getJitter():.2f} ms",
+            True,
+            "red",
+        )
+        self.screen.blit(text, (self.screen.get_width() - text.get_width() - 20, 18))
+
+        # Recycled entities - should stay close to 100% once a run warms up
+        text = font.render(
+            f"pool hits {self.pool.getHitRate() * 100:.1f}%", True, "red"
+        )
+        self.screen.blit(text, (self.screen.get_width() - text.get_width() - 20, 44))
@@ -0,0 +1,460 @@
+from __future__ import annotations
+import math
+import time
+
+import pygame
+
+from core import PhysicsEngine
+from entities import Archetype, MineCart, Pipe
+from gameplay.lava_band import LavaBand
+from gameplay.tunnel_field import TunnelField
+import gameplay.section_blueprint as blueprint
+
+
+# Player radius the game runs with (see main.py)
+PLAYER_RADIUS = 35
+
+
+class _LethalBox:
+    """
+    Stands in for a static lethal entity whose hitbox is all the replay
+    needs (a Pipe would scale its sprite just to be built).
+    """
+
+    __slots__ = ("rect",)
+
+    all_edges_lethal = True
+
+    def __init__(self, rect: pygame.Rect):
+        self.rect = rect
+
+    def getHitbox(self) -> pygame.Rect:
+        return self.rect
+
+    def getArchetype(self) -> str:
+        return Archetype.LETHAL
+
+
+def _construct(cls, **kwargs):
+    # Fresh instances - the shared pool belongs to the main thread
+    if cls is Pipe:
+        return _LethalBox(Pipe.hitboxFor(**kwargs))
+    return cls(**kwargs)
+
+
+def _zones(e) -> list[tuple]:
+    # Lethal (left, top, right, bottom) areas of a static obstacle
+    if getattr(e, "all_edges_lethal", True):
+        box = e.getHitbox()
+        return [(box.left, box.top, box.right, box.bottom)]
+    return list(e.edge_zones)
+
+
+def _below(y: int) -> int:
+    # Bits 0 .. y-1
+    return (1 << y) - 1 if y > 0 else 0
+
+
+class PassabilityResult:
+    """
+    Outcome of PassabilityVerifier.verify(). Truthy if the section can be
+    survived.
+    """
+
+    __slots__ = ("passable", "steps", "fail_step", "fail_x", "exit_ys", "peak_states", "seconds")
+
+    def __init__(
+        self,
+        passable: bool,
+        steps: int,
+        fail_step: int | None,
+        fail_x: float | None,
+        exit_ys: list[int],
+        peak_states: int,
+        seconds: float,
+    ):
+        self.passable = passable
+        # Sim steps checked, and where every state died (section-relative x)
+        self.steps = steps
+        self.fail_step = fail_step
+        self.fail_x = fail_x
+        # Heights the player can leave the section at (feed the next verify())
+        self.exit_ys = exit_ys
+        # Most vy groups alive at once
+        self.peak_states = peak_states
+        self.seconds = seconds
+
+    def __bool__(self) -> bool:
+        return self.passable
+
+    def __repr__(self) -> str:
+        if self.passable:
+            verdict = f"passable, {len(self.exit_ys)} exit heights"
+        else:
+            verdict = f"blocked at step {self.fail_step} (x {self.fail_x:.0f})"
+        return f"<PassabilityResult {verdict}, {self.steps} steps, {self.seconds * 1000:.1f} ms>"
+
+
+class PassabilityVerifier:
+    """
+    Decides whether any input sequence survives a generated section
+    (SectionBlueprint), under the real PhysicsEngine flight constants.
+
+    The section is first replayed the way the game plays it: spawns come
+    due at their scroll distance, carts ride a private TunnelField and
+    fireballs follow their closed form. Every sim step then gives one
+    column at the player's x: the heights that kill, and the floor /
+    ceiling the tunnel pushes the player back to.
+
+    The reachable set is searched over (step, y, vy). A jump sets vy to
+    JUMP_VELOCITY whatever it was, so every vy the player can have is
+    JUMP_VELOCITY + i * GRAVITY * dt: states are grouped by that index i,
+    and a group keeps its heights (1 px bins) as the bits of one int. A
+    step is a shift and a few masks per group, and everything that can
+    jump collapses into a single group. Groups that die are pruned; being
+    stopped (vy = 0) is folded into the nearest index a jump group is at,
+    which keeps the groups to one per input frame since the last jump.
+
+    Jumps can only come on input frames ('input_hz' - the game reads the
+    keyboard once per rendered frame). Approximations: heights are kept to
+    the pixel (a few px over a long fall). Fireball phases / peaks come
+    from the seed in their op, so they replay exactly as the game plays them.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        player_radius: int = PLAYER_RADIUS,
+        lava_height: int = 34,
+        sim_hz: int = PhysicsEngine.SIM_HZ,
+        input_hz: int = 60,
+    ):
+        self.screen = screen
+        self.radius = int(player_radius)
+        self.lava_height = int(lava_height)
+        self.dt = 1.0 / sim_hz
+
+        # Jumps are read once per rendered frame => every this many steps
+        self._jump_every = max(1, round(sim_hz / input_hz))
+
+        # vy gained per step, px moved per step per px/s of vy
+        self._accel = PhysicsEngine.GRAVITY * self.dt
+        self._move = PhysicsEngine.VELOCITY_SCALE * self.dt
+
+        # vy index of standing still
+        still = -PhysicsEngine.JUMP_VELOCITY / self._accel
+
+        # Jump groups only ever sit at every '_jump_every'th index (which
+        # ones depends on the step). Per step phase: the index closest to
+        # standing still among those, so stopping starts no group of its own
+        every = self._jump_every
+        self._stopped_at = []
+        for phase in range(every):
+            base = (phase + 1) % every
+            first = base + every * int((still - base) // every)
+            self._stopped_at.append(min((first, first + every), key=lambda j: abs(j - still)))
+
+        # Per vy index: px moved by the step into it, and the sign of its vy.
+        # Positions are rounded once, on the distance since the jump, so
+        # the per-step moves don't drift. Past '_last' everything has
+        # fallen further than the screen is high => index kept there.
+        H = self.screen.get_height()
+        self._moves = [0]
+        self._falling = [False]
+        travel = 0.0
+        lowest = 0.0
+        index = 0
+        while travel - lowest <= 2 * H:
+            index += 1
+            v = self._velocity(index)
+            prev = round(travel)
+            travel += v * self._move
+            lowest = min(lowest, travel)
+            self._moves.append(round(travel) - prev)
+            self._falling.append(v > 0)
+        self._last = index
+
+    def _velocity(self, index: int) -> float:
+        return PhysicsEngine.JUMP_VELOCITY + index * self._accel
+
+    # --------------------------
+    # Section replay
+    # --------------------------
+    def _forbidden(self, px: float, boxes: list, fireballs: list) -> int:
+        """
+        Heights (bits) at which the player, centred at x 'px', touches one
+        of 'boxes' ((left, top, right, bottom)) or 'fireballs' ((fireball, y)).
+        """
+        r = self.radius
+        rr = r * r
+        H = self.screen.get_height()
+        mask = 0
+
+        for left, top, right, bottom in boxes:
+            if px < left:
+                dx = left - px
+            elif px > right:
+                dx = px - right
+            else:
+                dx = 0.0
+            if dx >= r:
+                continue
+            half = math.sqrt(rr - dx * dx)
+            lo = max(0, math.floor(top - half) + 1)
+            hi = min(H, math.ceil(bottom + half) - 1)
+            if hi >= lo:
+                mask |= _below(hi - lo + 1) << lo
+
+        for fb, fy in fireballs:
+            reach = r + fb.radius
+            dx = px - fb.x
+            if abs(dx) >= reach:
+                continue
+            half = math.sqrt(reach * reach - dx * dx)
+            lo = max(0, math.floor(fy - half) + 1)
+            hi = min(H, math.ceil(fy + half) - 1)
+            if hi >= lo:
+                mask |= _below(hi - lo + 1) << lo
+
+        return mask
+
+    def _surfaces(self, px: float, field) -> tuple[int | None, int | None]:
+        """
+        Lowest / highest centre y the tunnel lets the player keep at x 'px'
+        (like PhysicsEngine._heightfieldPush) - None where there's nothing.
+        """
+        if field is None:
+            return None, None
+
+        r = self.radius
+        rr = r * r
+        samples = list(field.samples_under(px - r, px + r))
+
+        # The sample under px first: its full-radius bound then rules out
+        # most of the others without a sqrt
+        left, right, fy, cy = samples[len(samples) // 2]
+        floor_y = fy - r if left <= px <= right else math.inf
+        ceil_y = cy + r if left <= px <= right else -math.inf
+        for left, right, fy, cy in samples:
+            if fy - r >= floor_y and cy + r <= ceil_y:
+                continue
+            if px < left:
+                dx = left - px
+            elif px > right:
+                dx = px - right
+            else:
+                dx = 0.0
+            if dx >= r:
+                continue
+            half = math.sqrt(rr - dx * dx)
+            if fy - half < floor_y:
+                floor_y = fy - half
+            if cy + half > ceil_y:
+                ceil_y = cy + half
+
+        floor_max = math.floor(floor_y) if floor_y < self.screen.get_height() else None
+        ceil_min = math.ceil(ceil_y) if ceil_y > 0 else None
+        return floor_max, ceil_min
+
+    def columns(self, bp: blueprint.SectionBlueprint, world_speed: float = 520.0) -> list[tuple]:
+        """
+        Replay 'bp' and return, per sim step, (player x, lethal height
+        bits, floor limit, ceiling limit) - x relative to the section start.
+        """
+        W, H = self.screen.get_size()
+        r = self.radius
+        dt = self.dt
+        spawn_dx = W + 20
+
+        painted = any(op[0] == blueprint.PAINT for ops in bp.spawns for op in ops)
+        field = TunnelField(screen_width=W, default_floor_y=H, sample_step=4) if painted else None
+        lava = LavaBand(self.screen, self.lava_height)
+
+        # Scroll x every spawn comes due at (chained like SectionManager does)
+        dues = []
+        due_x = prev = 0.0
+        for offset in bp.offsets:
+            due_x += max(1.0, (offset - prev) * world_speed)
+            prev = offset
+            dues.append(due_x)
+
+        # Lethal (left, top, right, bottom) areas of the static obstacles
+        statics: list = []
+        carts: list = []
+        fireballs: list = []
+
+        columns = []
+        camera = 0.0
+        sim_t = 0.0
+        nxt = 0
+        max_steps = int((bp.duration + 10.0) / dt)
+
+        for _ in range(max_steps):
+            camera += world_speed * dt
+
+            while nxt < len(dues) and dues[nxt] <= camera:
+                ops = [op for op in bp.spawns[nxt] if op[0] != blueprint.COIN]
+                obstacles, _ = blueprint.instantiate(
+                    ops, int(dues[nxt]) + spawn_dx, lava, field, _construct
+                )
+                for e in obstacles:
+                    archetype = e.getArchetype()
+                    if archetype == Archetype.FLOOR_FOLLOWER:
+                        carts.append(e)
+                    elif archetype == Archetype.OSCILLATOR:
+                        e.setSpawnTime(sim_t)
+                        fireballs.append(e)
+                    elif archetype == Archetype.LETHAL:
+                        statics.extend(_zones(e))
+                nxt += 1
+
+            sim_t += dt
+
+            if carts:
+                MineCart.updateAll(carts, dt)
+                carts = [c for c in carts if not c.shouldKill(camera)]
+            if field is not None:
+                field.scroll_to(camera)
+            lava.scroll_to(camera)
+
+            px = camera + W / 2
+
+            # Whatever the player has passed can't hit it any more
+            statics = [z for z in statics if z[2] + r > px]
+            fireballs = [f for f in fireballs if f.x + f.radius + r > px]
+            near = [z for z in statics if z[0] - r < px]
+            for cart in carts:
+                box = cart.getHitbox()
+                near.append((box.left, box.top, box.right, box.bottom))
+            for span in lava.spans:
+                near.append((span.left, span.top, span.right, span.bottom))
+            near_fb = [(f, f.yAt(sim_t)) for f in fireballs if f.x - f.radius - r < px]
+
+            floor_max, ceil_min = self._surfaces(px, field)
+            columns.append((px, self._forbidden(px, near, near_fb), floor_max, ceil_min))
+
+            if nxt >= len(dues) and not statics and not fireballs and not carts:
+                passed = not lava.spans or lava.spans[-1].right + r <= px
+                if passed:
+                    break
+
+        return columns
+
+    # --------------------------
+    # Reachable set
+    # --------------------------
+    def verify(
+        self,
+        bp: blueprint.SectionBlueprint,
+        world_speed: float = 520.0,
+        start_ys=None,
+    ) -> PassabilityResult:
+        """
+        True (in the result) if some input sequence gets the player through
+        'bp' alive. 'start_ys' are the heights the section may be entered
+        at, standing still - every height on screen by default.
+        """
+        t0 = time.perf_counter()
+
+        H = self.screen.get_height()
+        r = self.radius
+        bottom = H - r
+        last = self._last
+        moves = self._moves
+        falling = self._falling
+
+        if start_ys is None:
+            start = _below(bottom + 1) & ~_below(r)
+        else:
+            start = 0
+            for y in start_ys:
+                start |= 1 << min(max(int(round(y)), r), bottom)
+
+        columns = self.columns(bp, world_speed)
+
+        # Groups keyed by the step their vy index counts from (index at
+        # step k: k + 1 - key), so a step moves no group to another key
+        every = self._jump_every
+        stopped_at = self._stopped_at
+        states = {1 - stopped_at[-1]: start}
+        reach = start
+        peak = 1
+        fail_step = fail_x = None
+
+        for k, (px, forbid, floor_max, ceil_min) in enumerate(columns):
+            # Jumping (on input frames): every height so far, vy reset
+            if k % every == 0:
+                states[k] = states.get(k, 0) | reach
+
+            # Heights nothing clamps or pushes back this step: [lo, hi]
+            lo = r if ceil_min is None else max(r, ceil_min)
+            hi = bottom if floor_max is None else max(0, min(bottom, floor_max))
+            lo = min(lo, hi)  # squeezed => the floor wins
+            open_bits = _below(hi + 1) & ~_below(lo)
+            closed = ~open_bits
+            safe = ~forbid
+            touch = closed | forbid
+            above_hi = ~_below(hi + 1)
+            below_lo = _below(lo)
+            # Lethal check happens at the screen-clamped height, before the
+            # tunnel pushes back
+            below_hi = above_hi & _below(bottom + 1) & safe
+            above_lo = below_lo & ~_below(r) & safe
+            bottom_safe = not (forbid >> bottom) & 1
+            top_safe = not (forbid >> r) & 1
+
+            rest = k + 1 - stopped_at[k % every]
+            stopped: dict[int, int] = {}
+            dead = []
+            reach = 0
+            for key, mask in states.items():
+                i = k + 1 - key
+                if i > last:
+                    i = last
+                delta = moves[i]
+                ym = mask << delta if delta >= 0 else mask >> -delta
+
+                # Most groups touch nothing: no clamps, nothing lethal
+                if ym & touch:
+                    if ym & closed:
+                        # Stopped by the floor / screen bottom (vy zeroed if falling)
+                        if ym & above_hi and (ym & below_hi or (ym >> (bottom + 1) and bottom_safe)):
+                            j = rest if falling[i] else key
+                            stopped[j] = stopped.get(j, 0) | (1 << hi)
+                        # ... by the ceiling / screen top (vy zeroed if rising)
+                        if ym & below_lo and (ym & above_lo or (ym & _below(r) and top_safe)):
+                            j = key if falling[i] else rest
+                            stopped[j] = stopped.get(j, 0) | (1 << lo)
+                        ym &= open_bits
+                    ym &= safe
+                    if not ym:
+                        dead.append(key)
+                        continue
+
+                states[key] = ym
+                reach |= ym
+
+            for key in dead:
+                del states[key]
+            for key, ym in stopped.items():
+                states[key] = states.get(key, 0) | ym
+                reach |= ym
+
+            if not states:
+                fail_step, fail_x = k, px
+                break
+            peak = max(peak, len(states))
+
+        exit_ys = []
+        if fail_step is None:
+            exit_ys = [y for y in range(H + 1) if (reach >> y) & 1]
+
+        return PassabilityResult(
+            passable=fail_step is None,
+            steps=len(columns),
+            fail_step=fail_step,
+            fail_x=fail_x,
+            exit_ys=exit_ys,
+            peak_states=peak,
+            seconds=time.perf_counter() - t0,
+        )
@@ -0,0 +1,54 @@
+from __future__ import annotations
+import random
+
+
+class RunRandom:
+    """
+    Random number streams of one run, all derived from a single run seed.
+
+    Every subsystem draws from its own named stream (stream("spikes"),
+    stream("sections"), ...) instead of the global 'random' module, so a
+    run is fully reproduced by its seed and what one subsystem draws never
+    shifts another's numbers.
+
+    newRun() starts every stream over from a new seed - a random one, or
+    the fixed seed (--seed on the command line) for every run. Streams are
+    reseeded in place: holding on to one across runs is fine.
+    """
+
+    def __init__(self):
+        # Set => every run uses this seed
+        self.fixed_seed: int | None = None
+
+        self.seed = 0
+        self._streams: dict[str, random.Random] = {}
+
+    def fixSeed(self, seed: int | None) -> None:
+        self.fixed_seed = None if seed is None else int(seed)
+
+    def newRun(self) -> int:
+        seed = self.fixed_seed
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.setSeed(seed)
+        return seed
+
+    def setSeed(self, seed: int) -> None:
+        self.seed = int(seed)
+        for name, rng in self._streams.items():
+            rng.seed(self._streamSeed(name))
+
+    def _streamSeed(self, name: str) -> str:
+        # String seeds are hashed with SHA-512 => stable across processes
+        return f"{self.seed}:{name}"
+
+    def stream(self, name: str) -> random.Random:
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = random.Random(self._streamSeed(name))
+            self._streams[name] = rng
+        return rng
+
+
+# Shared by every subsystem (see GameMaster.rng)
+RUN_RANDOM = RunRandom()
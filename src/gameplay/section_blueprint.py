@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import gameplay.tunnel_field as tunnel_field
+from gameplay.entity_pool import ENTITY_POOL
+
+
+# Spawn op kinds - every op is a plain tuple, kind first
+ENTITY = "entity"   # (ENTITY, cls, kwargs)          obstacle / hazard
+COIN = "coin"       # (COIN, cls, kwargs)            collectible
+PAINT = "paint"     # (PAINT, x0, x1, floor_y, ceiling_y)   tunnel field span
+LAVA = "lava"       # (LAVA, x0, x1)                 spike-section lava band
+SPAN = "span"       # (SPAN, key, cls, kwargs)       entity grown while it lines up
+
+# Geometry kwargs holding a world x (first item of a tuple, or the value)
+_X_KWARGS = ("rect", "pos", "currPos", "curr_pos", "x")
+
+
+def entity(cls, **kwargs) -> tuple:
+    return (ENTITY, cls, kwargs)
+
+
+def coin(cls, **kwargs) -> tuple:
+    return (COIN, cls, kwargs)
+
+
+def span(key: str, cls, **kwargs) -> tuple:
+    return (SPAN, key, cls, kwargs)
+
+
+def paint(x0: float, x1: float, floor_y: float, ceiling_y: float) -> tuple:
+    return (PAINT, x0, x1, floor_y, ceiling_y)
+
+
+def lava(x0: float, x1: float) -> tuple:
+    return (LAVA, x0, x1)
+
+
+class SectionBlueprint:
+    """
+    A whole section generated ahead of time (see SectionManager): for every
+    spawn, its time offset from the section start and the ops it runs.
+
+    Ops are data only - no entity exists until instantiate() runs them.
+    Their x is relative to the spawn point (20 px past the right edge of
+    the screen when the spawn comes due), so a blueprint doesn't depend on
+    where in the world it gets played.
+    """
+
+    __slots__ = ("section_type", "tier", "duration", "offsets", "spawns")
+
+    def __init__(self, section_type: str, tier: int, duration: float):
+        self.section_type = section_type
+        self.tier = tier
+        self.duration = duration
+
+        # Seconds from the section start, ascending (one per spawn)
+        self.offsets: list[float] = []
+        self.spawns: list[list[tuple]] = []
+
+    def add(self, offset: float, ops: list[tuple]) -> None:
+        self.offsets.append(float(offset))
+        self.spawns.append(ops)
+
+    def __len__(self) -> int:
+        return len(self.spawns)
+
+    def counts(self) -> dict[str, int]:
+        """
+        Op count per kind (entities by class name) - for inspection.
+        """
+        counts: dict[str, int] = {}
+        for ops in self.spawns:
+            for op in ops:
+                if op[0] == SPAN:
+                    key = op[2].__name__
+                else:
+                    key = op[1].__name__ if op[0] in (ENTITY, COIN) else op[0]
+                counts[key] = counts.get(key, 0) + 1
+        return counts
+
+
+def _placed(kwargs: dict, dx: float) -> dict:
+    # Copy of 'kwargs' with its geometry moved 'dx' to the right
+    placed = dict(kwargs)
+    for key in _X_KWARGS:
+        value = placed.get(key)
+        if value is None:
+            continue
+        if key == "x":
+            placed[key] = value + dx
+        else:
+            placed[key] = (value[0] + dx, *value[1:])
+    return placed
+
+
+def instantiate(
+    ops: list[tuple], dx: float, lava_band=None, field=None, acquire=None, spans=None
+) -> tuple[list, list]:
+    """
+    Run one spawn's ops with the spawn point at world x 'dx':
+    entities come from the pool, field / lava spans are painted.
+    Returns (obstacles, coins) like the spawners used to.
+
+    'field' / 'acquire' default to the game's (TUNNEL_FIELD, ENTITY_POOL) -
+    pass others to build a section outside of the running game.
+
+    'spans' (key -> entity) holds the open SPAN entities: a SPAN op that
+    continues its key's entity (see extendTo) grows it instead of creating
+    a new one. Without it every SPAN op is a plain entity.
+    """
+    obstacles: list = []
+    coins: list = []
+    if field is None:
+        field = tunnel_field.TUNNEL_FIELD
+    if acquire is None:
+        acquire = ENTITY_POOL.acquire
+
+    for op in ops:
+        kind = op[0]
+
+        if kind == ENTITY or kind == COIN:
+            e = acquire(op[1], **_placed(op[2], dx))
+            if field is not None and hasattr(e, "attach_floor_field"):
+                e.attach_floor_field(field)
+            (coins if kind == COIN else obstacles).append(e)
+
+        elif kind == SPAN:
+            placed = _placed(op[3], dx)
+            if spans is not None:
+                e = spans.get(op[1])
+                if e is not None and e.extendTo(placed["rect"]):
+                    continue
+
+            e = acquire(op[2], grows=spans is not None, **placed)
+            if field is not None and hasattr(e, "attach_floor_field"):
+                e.attach_floor_field(field)
+            obstacles.append(e)
+            if spans is not None:
+                spans[op[1]] = e
+
+        elif kind == PAINT:
+            if field is not None:
+                field.paint_span(x0=op[1] + dx, x1=op[2] + dx, floor_y=op[3], ceiling_y=op[4])
+
+        elif kind == LAVA:
+            if lava_band is not None:
+                lava_band.extend(op[1] + dx, op[2] + dx)
+
+    return obstacles, coins
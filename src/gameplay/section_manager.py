@@ -1,6 +1,14 @@
-import random
+import heapq
+import itertools
 import pygame
-
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import gameplay.tunnel_field as tunnel_field
+import gameplay.section_blueprint as blueprint
+from gameplay.lava_band import LavaBand
+from gameplay.passability import PassabilityVerifier
+from gameplay.run_random import RUN_RANDOM
+from gameplay.section_blueprint import SectionBlueprint
 from gameplay.spawners.spikes_spawner import SpikesSpawner
 from gameplay.spawners.tunnel_spawner import TunnelSpawner
 from gameplay.spawners.beams_spawner import BeamsSpawner
@@ -13,16 +21,36 @@ class SectionManager:
 
     NOTE:
       We do NOT spawn lava objects here.
-      "Spikes floor is lava" should be implemented as a section-level rule:
-        if current section == "spikes" and player touches floor band -> die.
-      This makes lava start instantly and stop exactly when section changes.
+      "Spikes floor is lava" is a section-level rule: the spikes spawner
+      keeps one LavaBand (see getLavaBand) that the game state tests and
+      draws once per frame.
+
+    Sections are pre-generated: while one section plays, a worker thread
+    runs the spawners for the whole upcoming one and returns a
+    SectionBlueprint (spawn time offsets + ops, no entities). Switching
+    sections only swaps blueprints.
+
+    Spawning is event driven: every spawn schedules the blueprint's next
+    one at a scroll distance (its time offset at the current world speed)
+    in a priority queue. A frame with nothing due costs one comparison, and
+    every spawn lands at its exact world x whatever the frame timing.
+
+    One manager per game: the spawners draw from the shared RUN_RANDOM
+    streams, so two live managers would shift each other's numbers (and
+    every reset reseeds them all). close() stops the worker thread.
     """
 
     SECTION_TYPES = ["spikes", "tunnel", "beams"]
 
+    # Blueprints generated per section at most while the verifier rejects them
+    VERIFY_ATTEMPTS = 3
+
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
 
+        # Section order is part of the run seed too
+        self.rng = RUN_RANDOM.stream("sections")
+
         self.spawners = {
             "spikes": SpikesSpawner(screen),
             "tunnel": TunnelSpawner(screen),
@@ -41,6 +69,31 @@ class SectionManager:
         self.transition_timer = 0.0
         self.transition_duration = 0.6   # seconds, tweak
 
+        # Pending spawns: (scroll x it's due at, tie-break, blueprint index)
+        self._events: list[tuple[float, int, int]] = []
+        self._event_seq = itertools.count()
+
+        # Scroll x the playing section started at (None => not yet seen)
+        self._section_x: float | None = None
+
+        # Open span per key (tunnel walls) - the next matching panel grows it
+        self._spans: dict = {}
+
+        # World state last seen by maybe_spawn - blueprints are made with it
+        self._world_speed = 520.0
+        self._hazard_intensity = 0.0
+
+        # The playing section's blueprint, and the next one (in the works)
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="section-blueprint")
+        self._blueprint: SectionBlueprint | None = None
+        self._next: Future | None = None
+
+        # Optional: sections this verifier finds impassable are generated
+        # again (off by default - a check costs tens of milliseconds)
+        self.verifier: PassabilityVerifier | None = None
+
+        self._startRun()
+
     def reset(self) -> None:
         self.tier = {k: 0 for k in self.SECTION_TYPES}
         self.current_type = "spikes"
@@ -49,25 +102,60 @@ class SectionManager:
         self.section_duration = 10.0
         self.transition_timer = 0.0
 
+        self._startRun()
+
+    def close(self) -> None:
+        """
+        Wait for the section in the works and stop the worker thread.
+        """
+        if self._next is not None:
+            self._next.result()
+            self._next = None
+        self._worker.shutdown(wait=True)
+
+    def _startRun(self) -> None:
+        # The worker may still be busy with the last run's spawners
+        if self._next is not None:
+            self._next.result()
+            self._next = None
+
+        # New run seed => every stream starts over before anything is drawn
+        RUN_RANDOM.newRun()
+
+        # Progression starts over too (see Progression.reset): the first
+        # sections are made at the starting speed, not the last run's
+        self._world_speed = 520.0
+        self._hazard_intensity = 0.0
+
         for sp in self.spawners.values():
             sp.reset()
 
+        # Nothing to overlap with yet => the first section is made right here
+        self._blueprint = self._generate(
+            self.current_type,
+            self.current_tier,
+            self.section_duration,
+            self._world_speed,
+            self._hazard_intensity,
+        )
+        self._beginSection()
+        self._requestNext()
+
     def _choose_next_section(self) -> str:
         # Avoid repeating the same section back-to-back
         options = [t for t in self.SECTION_TYPES if t != self.current_type]
-        return random.choice(options)
+        return self.rng.choice(options)
 
-    def _compute_duration(self) -> float:
+    def _compute_duration(self, tier: int | None = None) -> float:
         # Later tiers: slightly longer sections, but not endless
-        return 9.0 + min(6.0, self.current_tier * 0.4)
+        if tier is None:
+            tier = self.current_tier
+        return 9.0 + min(6.0, tier * 0.4)
 
     def update(self, dt: float) -> None:
         self.section_time += dt
         self.transition_timer = self.transition_duration
 
-        spawner = self.spawners[self.current_type]
-        spawner.update(dt)
-
         if self.transition_timer > 0.0:
             self.transition_timer = max(0.0, self.transition_timer - dt)
 
@@ -75,26 +163,88 @@ class SectionManager:
             # Complete current section -> increase its tier for next time
             self.tier[self.current_type] += 1
 
-            # Switch section
-            self.current_type = self._choose_next_section()
-            self.current_tier = self.tier[self.current_type]
+            # Switch section - generated in the background meanwhile
+            # (its type never repeats the one that just ended, and its tier
+            # can't have changed since it was requested)
+            self._blueprint = self._next.result()
+            self._next = None
+
+            self.current_type = self._blueprint.section_type
+            self.current_tier = self._blueprint.tier
 
             self.section_time = 0.0
-            self.section_duration = self._compute_duration()
+            self.section_duration = self._blueprint.duration
+
+            self._beginSection()
+            self._requestNext()
 
-            # Reset the new spawner so timing feels clean
-            self.spawners[self.current_type].reset()
+    def _beginSection(self) -> None:
+        # The old section's pending spawns are dropped
+        self._events.clear()
+        self._section_x = None
+        self._spans.clear()
 
-    def maybe_spawn(self, hazard_intensity: float = 0.0, world_speed: float = 520.0):
         spawner = self.spawners[self.current_type]
+        if hasattr(spawner, "beginSection"):
+            spawner.beginSection()
+
+    def _requestNext(self) -> None:
+        next_type = self._choose_next_section()
+        tier = self.tier[next_type]
+        self._next = self._worker.submit(
+            self._generate,
+            next_type,
+            tier,
+            self._compute_duration(tier),
+            self._world_speed,
+            self._hazard_intensity,
+        )
+
+    def _generate(
+        self,
+        section_type: str,
+        tier: int,
+        duration: float,
+        world_speed: float,
+        hazard_intensity: float,
+    ) -> SectionBlueprint:
+        """
+        Blueprint of a whole section; with a verifier set, impassable ones
+        are rolled again (the last attempt is kept if none passes).
+        """
+        attempts = self.VERIFY_ATTEMPTS if self.verifier is not None else 1
+        for _ in range(attempts):
+            bp = self._runSpawner(section_type, tier, duration, world_speed, hazard_intensity)
+            if self.verifier is None or self.verifier.verify(bp, world_speed):
+                break
+        return bp
+
+    def _runSpawner(
+        self,
+        section_type: str,
+        tier: int,
+        duration: float,
+        world_speed: float,
+        hazard_intensity: float,
+    ) -> SectionBlueprint:
+        """
+        Run a spawner through a whole section (on the worker thread - it only
+        touches that spawner's own state, never the live world).
+        """
+        spawner = self.spawners[section_type]
+        spawner.reset()
 
         if hasattr(spawner, "setWorldSpeed"):
             spawner.setWorldSpeed(world_speed)
 
+        # Spawn point at x = 0 => every op is relative to it
+        if hasattr(spawner, "setScrollX"):
+            spawner.setScrollX(-(self.screen.get_width() + 20))
+
         if hasattr(spawner, "setHazardIntensity"):
             spawner.setHazardIntensity(hazard_intensity)
 
-        remaining = max(0.0, self.section_duration - self.section_time)
+        spawner.setDifficultyTier(tier)
 
         # A decent “passage center” definition:
         H = self.screen.get_height()
@@ -104,16 +254,68 @@ class SectionManager:
         # (If you want it smarter: set this when switching sections.)
         exit_center = entry_center
 
-        if hasattr(spawner, "setSectionContext"):
-            spawner.setSectionContext(entry_center, exit_center, remaining)
+        bp = SectionBlueprint(section_type, tier, duration)
 
-        if spawner.shouldSpawn():
-            return spawner.spawn(self.current_tier)
-        
-        if self.transition_timer > 0.0:
+        t = spawner.nextSpawnDelay()
+        while t < duration:
+            if hasattr(spawner, "setSectionContext"):
+                spawner.setSectionContext(entry_center, exit_center, duration - t)
+
+            bp.add(t, spawner.spawn(tier))
+            t += spawner.nextSpawnDelay()
+
+        return bp
+
+    def _schedule(self, index: int, from_x: float, from_offset: float, world_speed: float) -> None:
+        # Blueprint spawn 'index', its time offset turned into scroll distance
+        bp = self._blueprint
+        if index >= len(bp):
+            return
+
+        distance = max(1.0, (bp.offsets[index] - from_offset) * world_speed)
+        heapq.heappush(self._events, (from_x + distance, next(self._event_seq), index))
+
+    def maybe_spawn(
+        self,
+        hazard_intensity: float = 0.0,
+        world_speed: float = 520.0,
+        scroll_x: float = 0.0,
+    ):
+        self._world_speed = world_speed
+        self._hazard_intensity = hazard_intensity
+
+        if self._section_x is None:
+            # Section (or run) start: offsets count from here
+            self._section_x = scroll_x
+            self._schedule(0, scroll_x, 0.0, world_speed)
+
+        # Nothing due yet (nearly every frame)
+        if not self._events or self._events[0][0] > scroll_x:
             return [], []
 
-        return [], []
+        obstacles: list = []
+        coins: list = []
+
+        lava = self.getLavaBand()
+        spawn_dx = self.screen.get_width() + 20
+
+        # Several can be due after a long step - each lands at its own x
+        while self._events and self._events[0][0] <= scroll_x:
+            due_x, _, index = heapq.heappop(self._events)
+
+            new_obs, new_coins = blueprint.instantiate(
+                self._blueprint.spawns[index], int(due_x) + spawn_dx, lava, spans=self._spans
+            )
+            obstacles.extend(new_obs)
+            coins.extend(new_coins)
+
+            self._schedule(index + 1, due_x, self._blueprint.offsets[index], world_speed)
+
+        return obstacles, coins
+
+    def getBlueprint(self) -> SectionBlueprint | None:
+        # The playing section's blueprint (inspection / caching)
+        return self._blueprint
 
     # -----------------------
     # Section info / helpers
@@ -124,6 +326,13 @@ class SectionManager:
     def getTier(self) -> int:
         return self.current_tier
 
+    def getTunnelField(self) -> tunnel_field.TunnelField | None:
+        return tunnel_field.TUNNEL_FIELD
+
+    def getLavaBand(self) -> LavaBand | None:
+        sp = self.spawners.get("spikes")
+        return getattr(sp, "lava", None)
+
     def isSpikes(self) -> bool:
         return self.current_type == "spikes"
 
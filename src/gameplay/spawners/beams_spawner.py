@@ -1,6 +1,8 @@
-import random
 import pygame
 from entities import RectObstacle, Coin
+import gameplay.section_blueprint as blueprint
+from gameplay.difficulty_table import DifficultyTable
+from gameplay.run_random import RUN_RANDOM
 
 
 def _load_coin_sprite():
@@ -14,16 +16,43 @@ def _clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
 
+# Every parameter below is capped from this tier on
+BEAMS_MAX_TIER = 40
+
+
+def _beams_tier(tier: int) -> dict:
+    max_center_step = int(_clamp(65 + tier * 1.6, 55, 95))
+    return {
+        # Base time between beams (seconds) - scaled by spacing_scale
+        "spawn_base": _clamp(1.15 - tier * 0.03, 0.60, 1.20),
+        # Opening shrinks with tier, but stays playable: below 200 px the
+        # player can't hold a line through 0.6 s beams (passability_check)
+        "opening": max(200, 280 - tier * 8),
+        # Jitter grows a bit with tier, but stays civilized
+        # You can tweak the 55/95 or the growth rate to taste.
+        "max_center_step": max_center_step,
+        "min_center_step": int(_clamp(8 + tier * 0.2, 6, min(16, max_center_step))),
+    }
+
+
+def beamsDifficulty() -> DifficultyTable:
+    return DifficultyTable("beams", _beams_tier, BEAMS_MAX_TIER)
+
+
 class BeamsSpawner:
     """
     Mine support beams / frames:
     - Spacing is CONFIGURABLE via spacing_scale (and no longer "ignored")
-    - Opening center moves smoothly:
-        * never stays the same (no 0-step)
-        * never repeats the same step twice in a row
+    - Opening center moves smoothly - every step from one beam to the next:
+        * is min_center_step .. max_center_step long (never stays the same)
+        * never repeats the last step
+        * never goes down twice in a row (a jump per beam lifts the player,
+          so it can only sink so fast)
+        * keeps the whole opening on screen
         * prefers smaller changes over large ones (triangular distribution)
-    - First beam aligns to incoming passage center; last beam aligns to outgoing center
-      (provided by SectionManager through setSectionContext()).
+    - First beam aligns to the incoming passage center; the last one heads for
+      the outgoing center (provided by SectionManager through
+      setSectionContext()) with the allowed step closest to it.
     - Coin-light.
 
     Key knobs:
@@ -34,12 +63,11 @@ class BeamsSpawner:
 
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
+        self.rng = RUN_RANDOM.stream("beams")
         self.coin_sprite = _load_coin_sprite()
 
-        self.spawn_timer = 0.0
-
-        # World speed
-        self.base_velocity = 500.0
+        # Camera scroll offset - spawns are placed in world space
+        self.scroll_x = 0.0
 
         # ---- spacing knob ----
         self.spacing_scale = 1.0  # 0.8 => closer beams, 1.2 => farther beams
@@ -47,6 +75,9 @@ class BeamsSpawner:
         # Time between beams (seconds) - computed from tier * spacing_scale
         self.spawn_rate = 1.05
 
+        # Per-tier parameters, compiled once (applied per section)
+        self.difficulty = beamsDifficulty()
+
         # Opening size (updated by tier)
         self.opening = 280
 
@@ -69,8 +100,8 @@ class BeamsSpawner:
         self._has_spawned_any = False
         self._last_center_y: int | None = None
 
-    def setWorldSpeed(self, world_speed: float) -> None:
-        self.base_velocity = float(world_speed)
+    def setScrollX(self, scroll_x: float) -> None:
+        self.scroll_x = float(scroll_x)
 
     # ---- SectionManager hook ----
     def setSectionContext(
@@ -84,7 +115,6 @@ class BeamsSpawner:
         self._remaining_in_section = remaining_time
 
     def reset(self) -> None:
-        self.spawn_timer = 0.0
         self._has_spawned_any = False
         self._last_center_y = None
         self._last_step = None
@@ -98,33 +128,45 @@ class BeamsSpawner:
         spawn_rate is derived from tier * spacing_scale.
         If you want beams closer/farther, tweak spacing_scale, NOT spawn_rate directly.
         """
-        tier = max(0, int(tier))
+        self.difficulty.apply(self, tier)
+        self.spawn_rate = self.spawn_base * float(self.spacing_scale)
 
-        # Base time between beams (seconds)
-        base = 1.15 - tier * 0.03
-        base = _clamp(base, 0.60, 1.20)
-
-        self.spawn_rate = base * float(self.spacing_scale)
-
-        # Opening shrinks with tier, but stays playable
-        self.opening = max(170, 280 - tier * 8)
-
-        # Jitter grows a bit with tier, but stays civilized
-        # You can tweak the 55/95 or the growth rate to taste.
-        self.max_center_step = int(_clamp(65 + tier * 1.6, 55, 95))
-        self.min_center_step = int(_clamp(8 + tier * 0.2, 6, min(16, self.max_center_step)))
-
-    def update(self, dt: float) -> None:
-        self.spawn_timer += dt
-
-    def shouldSpawn(self) -> bool:
-        return self.spawn_timer >= self.spawn_rate
+    # Seconds from one spawn to the next (SectionManager schedules it)
+    def nextSpawnDelay(self) -> float:
+        return self.spawn_rate
 
     def _compute_center_bounds(self) -> tuple[int, int]:
         H = self.screen.get_height()
-        margin = 120
+        # Keep the whole opening clear of the top / bottom beam edge
+        margin = max(120, self.beam_thick + self.opening // 2)
         return margin, H - margin
 
+    def _allowed(self, step: int, lo: int, hi: int) -> bool:
+        # The step rules of the class docstring
+        last = self._last_step
+        if not self.min_center_step <= abs(step) <= self.max_center_step or step == last:
+            return False
+        if step > 0 and last is not None and last > 0:
+            return False
+        return lo <= self._last_center_y + step <= hi
+
+    def _closest_allowed(self, want: int, lo: int, hi: int) -> int:
+        # Allowed step nearest to 'want' (upwards on a tie). The bounds are
+        # more than 2 * max_center_step apart, so there always is one.
+        steps = range(-self.max_center_step, self.max_center_step + 1)
+        allowed = [s for s in steps if self._allowed(s, lo, hi)]
+        return min(allowed, key=lambda s: (abs(s - want), s))
+
+    def _step_towards(self, target: int, lo: int, hi: int) -> int:
+        """
+        Center after the allowed step that gets closest to 'target'.
+        """
+        if self._last_center_y is None:
+            return target
+        step = self._closest_allowed(target - self._last_center_y, lo, hi)
+        self._last_step = step
+        return self._last_center_y + step
+
     def _sample_step(self) -> int:
         """
         Returns a non-zero step with:
@@ -135,10 +177,10 @@ class BeamsSpawner:
         min_step = int(min(self.min_center_step, max_step))
 
         # Prefer small movement, occasionally larger
-        mag = int(random.triangular(min_step, max_step, min_step))
+        mag = int(self.rng.triangular(min_step, max_step, min_step))
         mag = max(min_step, min(max_step, mag))
 
-        sign = -1 if random.random() < 0.5 else 1
+        sign = -1 if self.rng.random() < 0.5 else 1
         step = sign * mag
 
         # Just in case: enforce non-zero
@@ -152,7 +194,7 @@ class BeamsSpawner:
 
         # FIRST beam anchor
         if not self._has_spawned_any and self._entry_center_y is not None:
-            c = int(_clamp(self._entry_center_y, lo, hi))
+            c = self._step_towards(int(_clamp(self._entry_center_y, lo, hi)), lo, hi)
             self._last_center_y = c
             return c
 
@@ -162,75 +204,71 @@ class BeamsSpawner:
             and self._remaining_in_section is not None
             and self._remaining_in_section <= self.spawn_rate * 1.15
         ):
-            c = int(_clamp(self._exit_center_y, lo, hi))
+            c = self._step_towards(int(_clamp(self._exit_center_y, lo, hi)), lo, hi)
             self._last_center_y = c
             return c
 
         if self._last_center_y is None:
             self._last_center_y = int((lo + hi) / 2)
 
-        # Pick a step that:
-        #  - is non-zero
-        #  - is not identical to last step (prevents same-delta streaks)
+        # Sampled until it follows the step rules (keeps the small-step bias)
         step = self._sample_step()
         tries = 0
-        while self._last_step is not None and step == self._last_step:
+        while not self._allowed(step, lo, hi):
             step = self._sample_step()
             tries += 1
             if tries > 10:
-                # fallback: flip sign to force a change
-                step = -self._last_step
+                # fallback: the allowed step closest to what was drawn
+                step = self._closest_allowed(step, lo, hi)
                 break
 
         self._last_step = step
 
-        c = int(_clamp(self._last_center_y + step, lo, hi))
+        c = self._last_center_y + step
         self._last_center_y = c
         return c
 
-    def spawn(self, tier: int):
-        self.setDifficultyTier(tier)
-
+    def spawn(self, tier: int) -> list[tuple]:
+        """
+        Ops for one beam frame (see gameplay.section_blueprint) - x relative
+        to 'scroll_x', nothing is created here.
+        """
         W = self.screen.get_width()
         H = self.screen.get_height()
 
-        x = W + 20
+        # Just off the right edge of the screen, in world space
+        x = int(self.scroll_x) + W + 20
         center = self._choose_center_y()
 
         opening_top = max(self.beam_thick, center - self.opening // 2)
         opening_bot = min(H - self.beam_thick, center + self.opening // 2)
 
-        top = RectObstacle(
-            self.screen,
-            pygame.Rect(x, 0, self.frame_w, opening_top),
-            velocity=self.base_velocity,
+        top = blueprint.entity(
+            RectObstacle,
+            rect=(x, 0, self.frame_w, opening_top),
             color="sienna4",
             lethal=True,
         )
-        bot = RectObstacle(
-            self.screen,
-            pygame.Rect(x, opening_bot, self.frame_w, H - opening_bot),
-            velocity=self.base_velocity,
+        bot = blueprint.entity(
+            RectObstacle,
+            rect=(x, opening_bot, self.frame_w, H - opening_bot),
             color="sienna4",
             lethal=True,
         )
 
-        obstacles = [top, bot]
+        ops = [top, bot]
 
-        coins: list[Coin] = []
-        if random.random() < 0.28:
+        if self.rng.random() < 0.28:
             mid_y = (opening_top + opening_bot) // 2
-            coins.append(
-                Coin(
-                    screen=self.screen,
-                    pos=pygame.Vector2(x + self.frame_w + 90, mid_y),
+            ops.append(
+                blueprint.coin(
+                    Coin,
+                    pos=(x + self.frame_w + 90, mid_y),
                     radius=13,
                     value=1,
-                    velocity=self.base_velocity,
                     sprite=self.coin_sprite,
                 )
             )
 
-        self.spawn_timer = 0.0
         self._has_spawned_any = True
-        return obstacles, coins
+        return ops
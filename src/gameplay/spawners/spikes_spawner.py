@@ -1,9 +1,15 @@
+import math
 import random
 import pygame
 
 from entities import Pipe
 from entities import Coin
-from entities import HazardPatch
+from entities import Archetype
+from entities import ScreenBound
+from gameplay.lava_band import LavaBand
+from gameplay.difficulty_table import DifficultyTable
+from gameplay.run_random import RUN_RANDOM
+import gameplay.section_blueprint as blueprint
 
 
 def _load_pipe_sprites() -> list[pygame.Surface]:
@@ -12,8 +18,12 @@ def _load_pipe_sprites() -> list[pygame.Surface]:
     return [v1, v2]
 
 
-def _choose(sprites: list[pygame.Surface]) -> pygame.Surface:
-    return random.choice(sprites)
+# Pipe collision box per sprite variant - (width, height) fractions of the sprite
+PIPE_HITBOX_PROFILES = [(0.55, 0.90), (0.55, 0.90)]
+
+
+def _choose_variant(sprites: list[pygame.Surface], rng=random) -> int:
+    return rng.randrange(len(sprites))
 
 
 def _load_coin_sprite() -> pygame.Surface | None:
@@ -27,11 +37,33 @@ def _clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
 
+# Every parameter below is capped from this tier on
+SPIKES_MAX_TIER = 10
+
+
+def _spikes_tier(tier: int) -> dict:
+    return {
+        "spawn_rate": max(0.55, 0.85 - tier * 0.03),
+        # Slightly more big spikes later (cap)
+        "big_spike_chance": float(_clamp(0.12 + 0.01 * min(tier, 6), 0.12, 0.18)),
+        # Fireballs: modest scaling, but already decent at tier 0
+        # - probability rises a bit with tier
+        "fireball_base_prob": float(_clamp(0.38 + 0.02 * min(tier, 5), 0.38, 0.50)),
+        # - minimum gap shrinks slightly with tier (but never spammy)
+        "fireball_min_gap_obstacles": max(2, 3 - tier // 7),
+    }
+
+
+def spikesDifficulty() -> DifficultyTable:
+    return DifficultyTable("spikes", _spikes_tier, SPIKES_MAX_TIER)
+
+
 def _sample_spike_height(
     min_h: int,
     max_h: int,
     p_small: float = 0.12,
     p_large: float = 0.12,
+    rng=random,
 ) -> int:
     """
     3-bucket distribution:
@@ -54,37 +86,85 @@ def _sample_spike_height(
         p_small /= s
         p_large /= s
 
-    r = random.random()
+    r = rng.random()
     mid = (min_h + max_h) / 2
 
     if r < p_small:
         # small: bias low
-        h = random.triangular(min_h, max_h, min_h)
+        h = rng.triangular(min_h, max_h, min_h)
     elif r > 1.0 - p_large:
         # large: bias high
-        h = random.triangular(min_h, max_h, max_h)
+        h = rng.triangular(min_h, max_h, max_h)
     else:
         # middle: strong bias to mid
-        h = random.triangular(min_h, max_h, mid)
+        h = rng.triangular(min_h, max_h, mid)
 
     return int(_clamp(h, min_h, max_h))
 
 
-class Fireball:
+_MASK64 = (1 << 64) - 1
+
+
+def _unit(seed: int, n: int) -> float:
+    """
+    Uniform [0, 1) from (seed, n) - a splitmix64 finalizer, so a fireball
+    can draw any of its numbers in any order without a Random object.
+    """
+    z = (seed * 0x9E3779B97F4A7C15 + (n + 1) * 0xD1B54A32D192ED03) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return ((z ^ (z >> 31)) >> 11) * (1.0 / (1 << 53))
+
+
+class Fireball(ScreenBound):
     """
     Lethal hazard for spike sections.
 
-    - Moves left at world speed.
+    - Scrolls with the world (fixed world x) - only the eruption is animated.
     - Erupts from UNDER the lava to a peak height (peak_y), then returns under lava.
     - peak_y is a FIELD, rolled at spawn and optionally rerolled each cycle.
     - Equiprobable heights by default (uniform).
+    - Height is a closed-form function of sim time (yAt), nothing is
+      integrated - the world evaluates it only while the fireball is in view.
+    - Collides as a circle (getHitbox -> (center, radius), like a Coin).
     """
 
-    def __init__(
+    # Erupts every cycle => moved every step
+    MOVES = True
+
+    __slots__ = (
+        "radius",
+        "color",
+        "lethal",
+        "lava_top_y",
+        "rest_y",
+        "x",
+        "y",
+        "prev_y",
+        "period",
+        "phase0",
+        "spawn_t",
+        "uniform_peak",
+        "reroll_each_cycle",
+        "peak_min_y",
+        "peak_max_y",
+        "peak_y",
+        "_seed",
+        "_cycle",
+        "_cycle_peak",
+        "_live",
+        "_center",
+    )
+
+    def __init__(self, *args, **kwargs):
+        # Owned once, moved in place afterwards (see getHitbox)
+        self._center = pygame.Vector2()
+        self.reinit(*args, **kwargs)
+
+    # Pooled instances are set up again from scratch
+    def reinit(
         self,
-        screen: pygame.Surface,
         x: float,
-        velocity: float,
         lava_top_y: float,
         radius: int = 16,
         period: float = 1.9,
@@ -98,9 +178,9 @@ class Fireball:
         # backwards-compat aliases:
         min_peak_y: float | None = None,
         max_peak_y: float | None = None,
+        # phase / peaks drawn from this seed => replays exactly
+        seed: int | None = None,
     ):
-        self.screen = screen
-        self.velocity = float(velocity)
         self.radius = int(radius)
         self.color = color
         self.lethal = True
@@ -110,8 +190,21 @@ class Fireball:
         self.x = float(x)
         self.y = self.rest_y
 
+        # Height at the previous simulation step (render interpolation)
+        self.prev_y = self.y
+        self._center.update(self.x, self.y)
+
+        # Not evaluated yet (see moveTo)
+        self._live = False
+
+        # Phase and every cycle's peak are hashed from the seed (_unit):
+        # n = 0 is the phase, n = cycle + 1 that cycle's peak
+        self._seed = int(seed) if seed is not None else random.getrandbits(32)
+
+        # Cycle position at 'spawn_t' - the world stamps the spawn time
         self.period = max(0.7, float(period))
-        self._phase = random.random()
+        self.phase0 = _unit(self._seed, 0)
+        self.spawn_t = 0.0
 
         self.uniform_peak = bool(uniform_peak)
         self.reroll_each_cycle = bool(reroll_each_cycle)
@@ -137,40 +230,70 @@ class Fireball:
         if self.peak_max_y > self.peak_min_y:
             self.peak_max_y, self.peak_min_y = self.peak_min_y, self.peak_max_y
 
-        self.peak_y = self._roll_peak_y()
+        self.peak_y = self._roll_peak_y(_unit(self._seed, 1))
+        self._cycle = 0
+        self._cycle_peak = self.peak_y
 
-    def _roll_peak_y(self) -> float:
+    def _roll_peak_y(self, u: float) -> float:
+        # 'u' uniform in [0, 1) -> peak (inverse CDF of the distribution)
         lo = self.peak_max_y  # higher (smaller y)
         hi = self.peak_min_y  # lower (larger y)
         if self.uniform_peak:
-            return float(random.uniform(lo, hi))
-        return float(random.triangular(lo, hi, (lo + hi) / 2))
-
-    def update(self, dt: float) -> None:
-        self.x -= self.velocity * dt
-
-        prev = self._phase
-        self._phase = (self._phase + dt / self.period) % 1.0
-        if self.reroll_each_cycle and self._phase < prev:
-            self.peak_y = self._roll_peak_y()
-
-        t = self._phase
-        jump = 4.0 * t * (1.0 - t)
-        self.y = self.rest_y + (self.peak_y - self.rest_y) * jump
-
-    def shouldKill(self) -> bool:
-        return self.x + self.radius <= 0
-
-    def getHitbox(self) -> pygame.Rect:
-        return pygame.Rect(
-            int(self.x - self.radius),
-            int(self.y - self.radius),
-            int(self.radius * 2),
-            int(self.radius * 2),
-        )
+            return lo + (hi - lo) * u
+        # Symmetric triangular, mode in the middle
+        if u < 0.5:
+            return lo + (hi - lo) * math.sqrt(u * 0.5)
+        return hi - (hi - lo) * math.sqrt((1.0 - u) * 0.5)
+
+    def setSpawnTime(self, t: float) -> None:
+        self.spawn_t = float(t)
+
+    def peakForCycle(self, cycle: int) -> float:
+        if not self.reroll_each_cycle or cycle == 0:
+            return self.peak_y
+
+        if cycle != self._cycle:
+            self._cycle = cycle
+            self._cycle_peak = self._roll_peak_y(_unit(self._seed, cycle + 1))
+        return self._cycle_peak
+
+    def yAt(self, t: float) -> float:
+        """
+        Height at sim time t. Pure: calling it doesn't move the fireball.
+        """
+        cycles = self.phase0 + (t - self.spawn_t) / self.period
+        cycle = math.floor(cycles)
+        u = cycles - cycle
+
+        jump = 4.0 * u * (1.0 - u)
+        return self.rest_y + (self.peakForCycle(cycle) - self.rest_y) * jump
+
+    def moveTo(self, t: float) -> None:
+        y = self.yAt(t)
+
+        # First evaluation => nothing to interpolate from
+        self.prev_y = self.y if self._live else y
+        self._live = True
+
+        self.y = y
+        self._center.update(self.x, y)
+
+    def shouldKill(self, scroll_x: float = 0.0) -> bool:
+        return self.x + self.radius <= scroll_x
+
+    def getHitbox(self) -> tuple[pygame.Vector2, int]:
+        return self._center, self.radius
 
-    def draw(self) -> None:
-        pygame.draw.circle(self.screen, self.color, (int(self.x), int(self.y)), self.radius)
+    def getSpanX(self) -> tuple[float, float]:
+        return self.x - self.radius, self.x + self.radius
+
+    def getArchetype(self) -> str:
+        return Archetype.OSCILLATOR
+
+    def draw(self, cam_x: float = 0.0, alpha: float = 1.0) -> None:
+        x = self.x - cam_x
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        pygame.draw.circle(self.screen, self.color, (int(x), int(y)), self.radius)
 
 
 class SpikesSpawner:
@@ -186,12 +309,17 @@ class SpikesSpawner:
 
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
+        self.rng = RUN_RANDOM.stream("spikes")
         self.sprites = _load_pipe_sprites()
         self.coin_sprite = _load_coin_sprite()
 
-        self.spawn_timer = 0.0
         self.spawn_rate = 0.85
-        self.base_velocity = 500.0
+
+        # Per-tier parameters, compiled once (applied per section)
+        self.difficulty = spikesDifficulty()
+
+        # Camera scroll offset - spawns are placed in world space
+        self.scroll_x = 0.0
         self.edge = int(self.screen.get_height() * 0.05)
 
         self.spawn_patterns = [
@@ -200,19 +328,20 @@ class SpikesSpawner:
             ["top", "bottom", "top"],
             ["bottom", "top"],
         ]
-        self.curr_pattern = random.choice(self.spawn_patterns)
+        self.curr_pattern = self.rng.choice(self.spawn_patterns)
         self.pattern_idx = 0
 
         # Coin throttling
         self.obstacles_since_coin = 0
-        self.next_coin_in = random.randint(3, 6)
+        self.next_coin_in = self.rng.randint(3, 6)
 
         # Spike randomness
         self.big_spike_chance = 0.14
         self.large_spike_threshold_ratio = 0.78
 
-        # Floor lava
+        # Floor lava - one band for the whole section
         self.lava_height = 34
+        self.lava = LavaBand(screen, self.lava_height)
 
         # Fireballs tuning
         # Make them more common even at lowest difficulty:
@@ -227,71 +356,52 @@ class SpikesSpawner:
         # hazard_intensity kept for compatibility (not used for lava anymore)
         self.hazard_intensity = 0.0
 
-    def setWorldSpeed(self, world_speed: float) -> None:
-        self.base_velocity = float(world_speed)
+    def setScrollX(self, scroll_x: float) -> None:
+        self.scroll_x = float(scroll_x)
 
     def reset(self) -> None:
-        self.spawn_timer = 0.0
-        self.curr_pattern = random.choice(self.spawn_patterns)
+        self.curr_pattern = self.rng.choice(self.spawn_patterns)
         self.pattern_idx = 0
 
         self.obstacles_since_coin = 0
-        self.next_coin_in = random.randint(3, 6)
+        self.next_coin_in = self.rng.randint(3, 6)
 
         self.obstacles_since_fireball = 999
         self.large_spike_exclusion = 0
 
-    def setDifficultyTier(self, tier: int) -> None:
-        tier = max(0, int(tier))
-        self.spawn_rate = max(0.55, 0.85 - tier * 0.03)
-
-        # Slightly more big spikes later (cap)
-        self.big_spike_chance = float(_clamp(0.12 + 0.01 * min(tier, 6), 0.12, 0.18))
+    # Main-thread hook when a spikes section starts playing (reset() may
+    # run on the blueprint worker, ahead of time)
+    def beginSection(self) -> None:
+        # The last spikes section's lava is long gone
+        self.lava.reset()
 
-        # Fireballs: modest scaling, but already decent at tier 0
-        # - probability rises a bit with tier
-        self.fireball_base_prob = float(_clamp(0.38 + 0.02 * min(tier, 5), 0.38, 0.50))
-        # - minimum gap shrinks slightly with tier (but never spammy)
-        self.fireball_min_gap_obstacles = max(2, 3 - tier // 7)
+    def setDifficultyTier(self, tier: int) -> None:
+        self.difficulty.apply(self, tier)
 
     def setHazardIntensity(self, hazard_intensity: float) -> None:
         self.hazard_intensity = float(_clamp(hazard_intensity, 0.0, 1.0))
 
-    def update(self, dt: float) -> None:
-        self.spawn_timer += dt
-
-    def shouldSpawn(self) -> bool:
-        return self.spawn_timer >= self.spawn_rate
+    # Seconds from one spawn to the next (SectionManager schedules it)
+    def nextSpawnDelay(self) -> float:
+        return self.spawn_rate
 
     def _next_orientation(self) -> str:
         orientation = self.curr_pattern[self.pattern_idx]
         self.pattern_idx += 1
         if self.pattern_idx >= len(self.curr_pattern):
-            self.curr_pattern = random.choice(self.spawn_patterns)
+            self.curr_pattern = self.rng.choice(self.spawn_patterns)
             self.pattern_idx = 0
         return orientation
 
-    def _spawn_floor_lava(self, spike_x: int) -> HazardPatch:
+    def _extend_floor_lava(self, spike_x: int) -> tuple:
         """
-        Always-on lava: spawn long overlapping strips so the bottom is continuously lethal.
+        Always-on lava: the band reaches from a bit before every spike to
+        well past it, so the bottom stays lethal for the whole section.
         """
         W = self.screen.get_width()
-        H = self.screen.get_height()
-
-        strip_w = int(W * 1.35)
-        strip_h = int(self.lava_height)
+        return blueprint.lava(spike_x - W * 0.15, spike_x + W * 1.2)
 
-        strip_x = int(spike_x - (W * 0.15))
-        strip_y = int(H - strip_h)
-
-        return HazardPatch(
-            screen=self.screen,
-            rect=pygame.Rect(strip_x, strip_y, strip_w, strip_h),
-            velocity=self.base_velocity,
-            color="orangered3",
-        )
-
-    def _maybe_spawn_fireball(self, spike_x: int, is_large_spike: bool) -> list[Fireball]:
+    def _maybe_spawn_fireball(self, spike_x: int, is_large_spike: bool) -> list[tuple]:
         """
         Fireballs:
           - more common even at tier 0
@@ -318,7 +428,7 @@ class SpikesSpawner:
             return []
 
         # Probability (higher even at lowest tier)
-        if random.random() > self.fireball_base_prob:
+        if self.rng.random() > self.fireball_base_prob:
             return []
 
         self.obstacles_since_fireball = 0
@@ -329,11 +439,11 @@ class SpikesSpawner:
         lava_top = H - self.lava_height
 
         # Spawn after the spike so it reads as a follow-up threat
-        fx = spike_x + Pipe.Proportions.WIDTH.value + random.randint(150, 320)
+        fx = spike_x + Pipe.Proportions.WIDTH.value + self.rng.randint(150, 320)
 
         # Configure peak range:
         # min peak is "a bit above lava"
-        peak_min_above_lava = random.uniform(18.0, 34.0)  # slightly varied minimum hop
+        peak_min_above_lava = self.rng.uniform(18.0, 34.0)  # slightly varied minimum hop
 
         # max peak is "a little over halfway screen" (above midpoint -> smaller y)
         # Example: 0.45H. Clamp so it's always above min peak.
@@ -342,18 +452,17 @@ class SpikesSpawner:
         peak_max_y = int(_clamp(peak_max_y, 70, peak_min_y_abs - 25))
 
         # Slower eruption cycle
-        period = random.uniform(1.6, 2.35)
+        period = self.rng.uniform(1.6, 2.35)
 
         # Slightly varied under-lava depth so timing feels organic
-        under_lava = random.uniform(55, 90)
+        under_lava = self.rng.uniform(55, 90)
 
-        radius = random.randint(14, 18)
+        radius = self.rng.randint(14, 18)
 
         return [
-            Fireball(
-                screen=self.screen,
+            blueprint.entity(
+                Fireball,
                 x=fx,
-                velocity=self.base_velocity,
                 lava_top_y=lava_top,
                 radius=radius,
                 period=period,
@@ -363,25 +472,29 @@ class SpikesSpawner:
                 uniform_peak=True,          # equiprobable height range
                 reroll_each_cycle=True,     # new peak each eruption
                 color="orange",
+                seed=self.rng.getrandbits(32),
             )
         ]
 
-    def spawn(self, tier: int) -> tuple[list, list[Coin]]:
-        self.setDifficultyTier(tier)
-
+    def spawn(self, tier: int) -> list[tuple]:
+        """
+        Ops for one spike (see gameplay.section_blueprint) - x relative to
+        'scroll_x', nothing is created here.
+        """
         orientation = self._next_orientation()
 
         W = self.screen.get_width()
         H = self.screen.get_height()
 
-        spike_x = W + 20
+        # Just off the right edge of the screen, in world space
+        spike_x = int(self.scroll_x) + W + 20
 
         # Spike height range: sane limits
         base_h = Pipe.Proportions.BASE_HEIGHT.value
         min_h = max(65, int(base_h * 0.68))
         max_h = min(int(H * 0.58), int(base_h * 2.35))
 
-        spike_h = _sample_spike_height(min_h, max_h, p_small=0.10, p_large=0.12)
+        spike_h = _sample_spike_height(min_h, max_h, p_small=0.10, p_large=0.12, rng=self.rng)
 
         # Large spike detection
         large_cut = int(min_h + self.large_spike_threshold_ratio * (max_h - min_h))
@@ -389,66 +502,61 @@ class SpikesSpawner:
 
         # Place spike
         if orientation == "top":
-            spike_y = random.randint(-self.edge, 0)
+            spike_y = self.rng.randint(-self.edge, 0)
         else:
-            spike_y = random.randint(H - spike_h, H - self.edge)
+            spike_y = self.rng.randint(H - spike_h, H - self.edge)
 
-        pipe = Pipe(
-            screen=self.screen,
-            currPos=pygame.Vector2(spike_x, spike_y),
-            velocity=self.base_velocity,
+        variant = _choose_variant(self.sprites, self.rng)
+        pipe = blueprint.entity(
+            Pipe,
+            currPos=(spike_x, spike_y),
             orientation=orientation,
-            sprite=_choose(self.sprites),
+            sprite=self.sprites[variant],
+            hitbox_scale=PIPE_HITBOX_PROFILES[variant],
             height=spike_h,
         )
 
-        obstacles: list = []
-
         # Always-on floor lava for spike sections
-        obstacles.append(self._spawn_floor_lava(spike_x))
+        ops = [self._extend_floor_lava(spike_x)]
 
         # The spike itself
-        obstacles.append(pipe)
+        ops.append(pipe)
 
         # Fireballs (more common, but excluded near large spikes)
-        obstacles.extend(self._maybe_spawn_fireball(spike_x, is_large_spike))
+        ops.extend(self._maybe_spawn_fireball(spike_x, is_large_spike))
 
         # Coins
-        coins: list[Coin] = []
         self.obstacles_since_coin += 1
         if self.obstacles_since_coin >= self.next_coin_in:
             self.obstacles_since_coin = 0
-            self.next_coin_in = random.randint(3, 6)
+            self.next_coin_in = self.rng.randint(3, 6)
 
-            coin_x = spike_x + Pipe.Proportions.WIDTH.value + random.randint(70, 140)
+            coin_x = spike_x + Pipe.Proportions.WIDTH.value + self.rng.randint(70, 140)
 
             if orientation == "top":
-                coin_y = random.randint(int(H * 0.45), int(H * 0.80))
+                coin_y = self.rng.randint(int(H * 0.45), int(H * 0.80))
             else:
-                coin_y = random.randint(int(H * 0.20), int(H * 0.55))
+                coin_y = self.rng.randint(int(H * 0.20), int(H * 0.55))
 
-            coins.append(
-                Coin(
-                    screen=self.screen,
-                    pos=pygame.Vector2(coin_x, coin_y),
+            ops.append(
+                blueprint.coin(
+                    Coin,
+                    pos=(coin_x, coin_y),
                     radius=13,
                     value=1,
-                    velocity=self.base_velocity,
                     sprite=self.coin_sprite,
                 )
             )
 
-            if random.random() < 0.12:
-                coins.append(
-                    Coin(
-                        screen=self.screen,
-                        pos=pygame.Vector2(coin_x + 60, coin_y - 25),
+            if self.rng.random() < 0.12:
+                ops.append(
+                    blueprint.coin(
+                        Coin,
+                        pos=(coin_x + 60, coin_y - 25),
                         radius=15,
                         value=5,
-                        velocity=self.base_velocity,
                         sprite=self.coin_sprite,
                     )
                 )
 
-        self.spawn_timer = 0.0
-        return obstacles, coins
+        return ops
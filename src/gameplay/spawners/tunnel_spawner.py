@@ -1,8 +1,10 @@
-import random
 import pygame
 
 from entities import RectObstacle, MineCart, Coin
 import gameplay.tunnel_field as tunnel_field
+import gameplay.section_blueprint as blueprint
+from gameplay.difficulty_table import DifficultyTable
+from gameplay.run_random import RUN_RANDOM
 
 
 def _load_cart_sprite():
@@ -23,6 +25,32 @@ def _clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
 
+# Every parameter below is capped from this tier on
+TUNNEL_MAX_TIER = 120
+
+
+def _tunnel_tier(tier: int, min_corridor: int) -> dict:
+    flat_run_min = max(5, 6 - tier // 10)
+    return {
+        "gap": max(min_corridor, 240 - tier * 6),
+        "panel_rate": max(0.16, 0.22 - tier * 0.003),
+        "slope_per_panel": int(_clamp(10 + tier * 0.3, 10, 14)),
+        "flat_run_min": flat_run_min,
+        "flat_run_max": max(flat_run_min, 10 - tier // 8),
+        "cart_cooldown_panels": max(5, 7 - tier // 8),
+        # Slightly tighter pattern later but still safe
+        "bundle_len_max": int(_clamp(4 + tier * 0.05, 4, 5)),
+        "gap_len_min": max(2, 2 - tier // 20),  # basically stays 2
+        "safe_passage_min": max(130, 140 - tier // 12),
+    }
+
+
+def tunnelDifficulty(min_corridor: int = 175) -> DifficultyTable:
+    return DifficultyTable(
+        "tunnel", lambda tier: _tunnel_tier(tier, min_corridor), TUNNEL_MAX_TIER
+    )
+
+
 class TunnelSpawner:
     """
     Walkable tunnel with gentle slopes.
@@ -34,21 +62,27 @@ class TunnelSpawner:
 
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
+        self.rng = RUN_RANDOM.stream("tunnel")
 
-        # World speed (panels)
+        # World speed (carts move relative to it)
         self.base_velocity = 520.0
 
+        # Camera scroll offset - spawns are placed in world space
+        self.scroll_x = 0.0
+
         # Panel geometry
         self.panel_width = 180
         self.overlap_px = 4
         self.panel_rate = 0.22
-        self.spawn_timer = 0.0
 
         # Tunnel shape
         H = self.screen.get_height()
         self.gap = 240
         self.min_corridor = 175
 
+        # Per-tier parameters, compiled once (applied per section)
+        self.difficulty = tunnelDifficulty(self.min_corridor)
+
         self.floor_y = int(H * 0.70)
         self.ceiling_y = int(H * 0.25)
 
@@ -63,7 +97,7 @@ class TunnelSpawner:
         self.force_flat_panels_left = 0
         self.flat_run_min = 6
         self.flat_run_max = 10
-        self.next_flat_in_panels = random.randint(10, 16)
+        self.next_flat_in_panels = self.rng.randint(10, 16)
         self.panels_since_flat = 0
 
         # Carts
@@ -75,15 +109,15 @@ class TunnelSpawner:
         # Coins
         self.coin_sprite = _load_coin_sprite()
         self.panels_since_coin = 0
-        self.next_coin_in = random.randint(4, 7)
+        self.next_coin_in = self.rng.randint(4, 7)
 
         # -------------------------
         # Slope spike pattern state
         # -------------------------
         self._spike_mode = "gap"             # "bundle" or "gap"
         self._bundle_left = 0                # panels remaining in current bundle
-        self._gap_left = random.randint(2, 4)
-        self._bundle_side = random.choice(["top", "bottom"])  # side for next bundle
+        self._gap_left = self.rng.randint(2, 4)
+        self._bundle_side = self.rng.choice(["top", "bottom"])  # side for next bundle
         self._bundle_target_h = 0            # base height used within bundle (keeps it readable)
         self._bundle_target_w = 0            # base width used within bundle
 
@@ -108,64 +142,55 @@ class TunnelSpawner:
     def setWorldSpeed(self, world_speed: float) -> None:
         self.base_velocity = float(world_speed)
 
+    def setScrollX(self, scroll_x: float) -> None:
+        self.scroll_x = float(scroll_x)
+
     def reset(self) -> None:
         H = self.screen.get_height()
         self.gap = 240
         self.floor_y = int(H * 0.70)
         self.ceiling_y = int(H * 0.25)
 
-        self.spawn_timer = 0.0
         self.target_timer = 0.0
 
         self.slope_dir = 0
         self.force_flat_panels_left = 0
-        self.next_flat_in_panels = random.randint(10, 16)
+        self.next_flat_in_panels = self.rng.randint(10, 16)
         self.panels_since_flat = 0
 
         self.cart_ready_in = 0
 
         self.panels_since_coin = 0
-        self.next_coin_in = random.randint(4, 7)
+        self.next_coin_in = self.rng.randint(4, 7)
 
         # spike pattern reset
         self._spike_mode = "gap"
         self._bundle_left = 0
-        self._gap_left = random.randint(self.gap_len_min, self.gap_len_max)
-        self._bundle_side = random.choice(["top", "bottom"])
+        self._gap_left = self.rng.randint(self.gap_len_min, self.gap_len_max)
+        self._bundle_side = self.rng.choice(["top", "bottom"])
         self._bundle_target_h = 0
         self._bundle_target_w = 0
 
+    # Main-thread hook when a tunnel section starts playing (reset() may
+    # run on the blueprint worker, ahead of time)
+    def beginSection(self) -> None:
         if tunnel_field.TUNNEL_FIELD is not None:
             tunnel_field.TUNNEL_FIELD.reset()
 
     def setDifficultyTier(self, tier: int) -> None:
-        tier = max(0, int(tier))
-
-        self.gap = max(self.min_corridor, 240 - tier * 6)
-
-        self.panel_rate = max(0.16, 0.22 - tier * 0.003)
-        self.slope_per_panel = int(_clamp(10 + tier * 0.3, 10, 14))
-
-        self.flat_run_min = max(5, 6 - tier // 10)
-        self.flat_run_max = max(self.flat_run_min, 10 - tier // 8)
-
-        self.cart_cooldown_panels = max(5, 7 - tier // 8)
+        self.difficulty.apply(self, tier)
 
-        # Slightly tighter pattern later but still safe
-        self.bundle_len_max = int(_clamp(4 + tier * 0.05, 4, 5))
-        self.gap_len_min = max(2, 2 - tier // 20)  # basically stays 2
-        self.safe_passage_min = max(130, 140 - tier // 12)
-
-    def update(self, dt: float) -> None:
-        self.spawn_timer += dt
-        self.target_timer += dt
+    # Seconds from one panel to the next (SectionManager schedules it)
+    def nextSpawnDelay(self) -> float:
+        return self.panel_rate
 
-        if tunnel_field.TUNNEL_FIELD is not None:
-            tunnel_field.TUNNEL_FIELD.update(dt, self.base_velocity)
+    def _advance_slope_target(self, elapsed: float) -> None:
+        # Time passes between panels only => the slope target is rolled here
+        self.target_timer += elapsed
 
         if self.force_flat_panels_left <= 0 and self.target_timer >= self.target_interval:
             self.target_timer = 0.0
-            r = random.random()
+            r = self.rng.random()
             if r < 0.35:
                 self.slope_dir = 0
             elif r < 0.675:
@@ -173,19 +198,16 @@ class TunnelSpawner:
             else:
                 self.slope_dir = +1
 
-    def shouldSpawn(self) -> bool:
-        return self.spawn_timer >= self.panel_rate
-
     def _maybe_schedule_flat_run(self) -> None:
         self.panels_since_flat += 1
         if self.force_flat_panels_left > 0:
             return
 
         if self.panels_since_flat >= self.next_flat_in_panels:
-            self.force_flat_panels_left = random.randint(self.flat_run_min, self.flat_run_max)
+            self.force_flat_panels_left = self.rng.randint(self.flat_run_min, self.flat_run_max)
             self.panels_since_flat = 0
-            self.next_flat_in_panels = random.randint(10, 16)
-            self.cart_ready_in = random.randint(2, 4)
+            self.next_flat_in_panels = self.rng.randint(10, 16)
+            self.cart_ready_in = self.rng.randint(2, 4)
 
     def _advance_profile_one_panel(self) -> int:
         H = self.screen.get_height()
@@ -212,30 +234,29 @@ class TunnelSpawner:
         self.ceiling_y = new_ceil
         return slope
 
-    def _maybe_spawn_tunnel_coin(self, x: int) -> list[Coin]:
+    def _maybe_spawn_tunnel_coin(self, x: int) -> list[tuple]:
         self.panels_since_coin += 1
         if self.panels_since_coin < self.next_coin_in:
             return []
 
         self.panels_since_coin = 0
-        self.next_coin_in = random.randint(4, 7)
+        self.next_coin_in = self.rng.randint(4, 7)
 
         center_y = (self.ceiling_y + self.floor_y) // 2
-        y = center_y + random.randint(-25, 25)
-        coin_x = x + self.panel_width + random.randint(110, 180)
+        y = center_y + self.rng.randint(-25, 25)
+        coin_x = x + self.panel_width + self.rng.randint(110, 180)
 
         return [
-            Coin(
-                screen=self.screen,
-                pos=pygame.Vector2(coin_x, y),
+            blueprint.coin(
+                Coin,
+                pos=(coin_x, y),
                 radius=13,
                 value=1,
-                velocity=self.base_velocity,
                 sprite=self.coin_sprite,
             )
         ]
 
-    def _maybe_spawn_cart(self, x: int, slope_used: int) -> list[MineCart]:
+    def _maybe_spawn_cart(self, x: int, slope_used: int) -> list[tuple]:
         if slope_used != 0:
             return []
         if self.force_flat_panels_left <= 0:
@@ -249,20 +270,20 @@ class TunnelSpawner:
 
         cart_w = 70
         cart_h = 36
-        cart_x = x + self.panel_width + random.randint(160, 280)
+        cart_x = x + self.panel_width + self.rng.randint(160, 280)
         cart_y = self.floor_y - cart_h
-        cart_vx = self.base_velocity * self.cart_speed_mult
-
-        cart = MineCart(
-            screen=self.screen,
-            rect=pygame.Rect(cart_x, cart_y, cart_w, cart_h),
+        # World-space: the camera already scrolls the cart at world speed,
+        # the cart itself only covers the extra part
+        cart_vx = self.base_velocity * (self.cart_speed_mult - 1.0)
+
+        # (rides the tunnel field - attached when it's instantiated)
+        cart = blueprint.entity(
+            MineCart,
+            rect=(cart_x, cart_y, cart_w, cart_h),
             velocity=cart_vx,
             sprite=self.cart_sprite,
         )
 
-        if tunnel_field.TUNNEL_FIELD is not None:
-            cart.attach_floor_field(tunnel_field.TUNNEL_FIELD)
-
         return [cart]
 
     # -------------------------
@@ -270,7 +291,7 @@ class TunnelSpawner:
     # -------------------------
     def _begin_new_bundle(self) -> None:
         self._spike_mode = "bundle"
-        self._bundle_left = random.randint(self.bundle_len_min, self.bundle_len_max)
+        self._bundle_left = self.rng.randint(self.bundle_len_min, self.bundle_len_max)
 
         # Alternate side every bundle
         self._bundle_side = "bottom" if self._bundle_side == "top" else "top"
@@ -282,11 +303,11 @@ class TunnelSpawner:
         if max_spike <= 20:
             # corridor too tight -> effectively skip by forcing a gap
             self._spike_mode = "gap"
-            self._gap_left = random.randint(self.gap_len_min, self.gap_len_max)
+            self._gap_left = self.rng.randint(self.gap_len_min, self.gap_len_max)
             self._bundle_left = 0
             return
 
-        self._bundle_target_w = random.randint(38, 56)
+        self._bundle_target_w = self.rng.randint(38, 56)
 
         # Mostly middle, few small, few large, but never near "impassable"
         lo = int(max_spike * 0.35)
@@ -294,17 +315,17 @@ class TunnelSpawner:
         lo = max(18, lo)
         hi = max(lo, hi)
 
-        r = random.random()
+        r = self.rng.random()
         if r < 0.12:
-            self._bundle_target_h = random.randint(18, max(18, int(lo * 0.9)))
+            self._bundle_target_h = self.rng.randint(18, max(18, int(lo * 0.9)))
         elif r > 0.88:
-            self._bundle_target_h = random.randint(max(lo, int(hi * 0.85)), hi)
+            self._bundle_target_h = self.rng.randint(max(lo, int(hi * 0.85)), hi)
         else:
-            self._bundle_target_h = random.randint(lo, hi)
+            self._bundle_target_h = self.rng.randint(lo, hi)
 
         self._bundle_target_h = int(_clamp(self._bundle_target_h, 18, max_spike))
 
-    def _spawn_slope_spikes(self, x: int, slope_used: int) -> list[RectObstacle]:
+    def _spawn_slope_spikes(self, x: int, slope_used: int) -> list[tuple]:
         """
         Only on slopes:
         - produce alternating TOP/BOTTOM spike bundles
@@ -316,7 +337,7 @@ class TunnelSpawner:
             # so we don't resume a bundle immediately after a cart-flat.
             self._spike_mode = "gap"
             self._bundle_left = 0
-            self._gap_left = random.randint(self.gap_len_min, self.gap_len_max)
+            self._gap_left = self.rng.randint(self.gap_len_min, self.gap_len_max)
             return []
 
         # If corridor is very tight, force gaps more often
@@ -336,7 +357,7 @@ class TunnelSpawner:
         # bundle mode
         if self._bundle_left <= 0:
             self._spike_mode = "gap"
-            self._gap_left = random.randint(self.gap_len_min, self.gap_len_max)
+            self._gap_left = self.rng.randint(self.gap_len_min, self.gap_len_max)
             return []
 
         # Corridor safety re-check
@@ -344,23 +365,22 @@ class TunnelSpawner:
         if max_spike <= 20:
             self._bundle_left = 0
             self._spike_mode = "gap"
-            self._gap_left = random.randint(self.gap_len_min, self.gap_len_max)
+            self._gap_left = self.rng.randint(self.gap_len_min, self.gap_len_max)
             return []
 
         spike_w = self._bundle_target_w
-        spike_h = int(_clamp(self._bundle_target_h + random.randint(-10, 10), 18, max_spike))
+        spike_h = int(_clamp(self._bundle_target_h + self.rng.randint(-10, 10), 18, max_spike))
 
         # Position within panel, but keep jitter limited so bundle is readable
-        sx = x + random.randint(48, max(49, self.panel_width - spike_w - 14))
+        sx = x + self.rng.randint(48, max(49, self.panel_width - spike_w - 14))
 
-        obstacles: list[RectObstacle] = []
+        obstacles: list[tuple] = []
         if self._bundle_side == "top":
             sy = self.ceiling_y
             obstacles.append(
-                RectObstacle(
-                    self.screen,
-                    pygame.Rect(sx, sy, spike_w, spike_h),
-                    velocity=self.base_velocity,
+                blueprint.entity(
+                    RectObstacle,
+                    rect=(sx, sy, spike_w, spike_h),
                     color="gray15",
                     lethal=True,
                 )
@@ -368,10 +388,9 @@ class TunnelSpawner:
         else:
             sy = self.floor_y - spike_h
             obstacles.append(
-                RectObstacle(
-                    self.screen,
-                    pygame.Rect(sx, sy, spike_w, spike_h),
-                    velocity=self.base_velocity,
+                blueprint.entity(
+                    RectObstacle,
+                    rect=(sx, sy, spike_w, spike_h),
                     color="gray15",
                     lethal=True,
                 )
@@ -380,51 +399,61 @@ class TunnelSpawner:
         self._bundle_left -= 1
         if self._bundle_left <= 0:
             self._spike_mode = "gap"
-            self._gap_left = random.randint(self.gap_len_min, self.gap_len_max)
+            self._gap_left = self.rng.randint(self.gap_len_min, self.gap_len_max)
 
         return obstacles
 
-    def spawn(self, tier: int):
-        self.setDifficultyTier(tier)
-
+    def spawn(self, tier: int) -> list[tuple]:
+        """
+        Ops for one panel (see gameplay.section_blueprint) - x relative to
+        'scroll_x', nothing is created or painted here.
+        """
         W = self.screen.get_width()
         H = self.screen.get_height()
 
-        x = W + 20 - self.overlap_px
+        # Just off the right edge of the screen, in world space
+        x = int(self.scroll_x) + W + 20 - self.overlap_px
         panel_w = self.panel_width + self.overlap_px
 
+        self._advance_slope_target(self.panel_rate)
+
         slope_used = self._advance_profile_one_panel()
 
         top_h = max(0, self.ceiling_y)
         bot_h = max(0, H - self.floor_y)
 
-        top_wall = RectObstacle(
-            self.screen,
-            pygame.Rect(x, 0, panel_w, top_h),
-            velocity=self.base_velocity,
+        # Walls are spans: while the profile stays level (flat runs) each
+        # panel only widens the walls already there (see blueprint.instantiate)
+        top_wall = blueprint.span(
+            "top",
+            RectObstacle,
+            rect=(x, 0, panel_w, top_h),
             color="slategray4",
             lethal=False,
+            in_field=True,
         )
-        bottom_wall = RectObstacle(
-            self.screen,
-            pygame.Rect(x, self.floor_y, panel_w, bot_h),
-            velocity=self.base_velocity,
+        bottom_wall = blueprint.span(
+            "bottom",
+            RectObstacle,
+            rect=(x, self.floor_y, panel_w, bot_h),
             color="slategray4",
             lethal=False,
+            in_field=True,
         )
 
-        if tunnel_field.TUNNEL_FIELD is not None:
-            tunnel_field.TUNNEL_FIELD.paint_span(x0=x, x1=x + panel_w, floor_y=self.floor_y)
-
-        obstacles = [top_wall, bottom_wall]
+        # The panel's floor / ceiling go into the tunnel field too
+        ops = [
+            top_wall,
+            bottom_wall,
+            blueprint.paint(x, x + panel_w, self.floor_y, self.ceiling_y),
+        ]
 
         # New: alternating spike bundles (only on slopes)
-        obstacles.extend(self._spawn_slope_spikes(x, slope_used))
+        ops.extend(self._spawn_slope_spikes(x, slope_used))
 
         # Carts on flat stretches
-        obstacles.extend(self._maybe_spawn_cart(x, slope_used))
+        ops.extend(self._maybe_spawn_cart(x, slope_used))
 
-        coins = self._maybe_spawn_tunnel_coin(x)
+        ops.extend(self._maybe_spawn_tunnel_coin(x))
 
-        self.spawn_timer = 0.0
-        return obstacles, coins
+        return ops
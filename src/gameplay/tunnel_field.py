@@ -1,49 +1,188 @@
 from __future__ import annotations
 import math
+import numbers
+
+# NumPy is optional - without it the buffers are plain lists
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TunnelField:
     """
-    Continuous 1D floor profile across screen X (sampled heightmap).
+    Continuous 1D floor + ceiling profile across the visible part of the world
+    (sampled heightmap). Sample 0 sits at world x '_origin_x'; the field is
+    scrolled along with the camera.
+
+    Tunnel panels are painted into the field as they spawn; the player and
+    the carts collide with the field instead of with the wall rects.
+    Overlapping panels combine like the rects do (highest floor, lowest
+    ceiling wins). Outside painted spans the tunnel is "open": floor at the
+    bottom of the screen, ceiling at the top (same as the screen clamp).
+
+    Large fields keep their samples in fixed-size ring buffers: scrolling
+    only moves '_head' and overwrites the slots that fell off the left,
+    nothing is shifted. With NumPy installed those buffers are arrays and
+    floor_y_at() also answers a whole array of x positions in one call.
+
+    Small fields are plain lists shifted on scroll instead ('_head' then
+    stays 0), and that includes the game's own field (420 samples at 4 px):
+    the game never takes the ring / NumPy path, on purpose. At that size a
+    scroll costs about 2 us either way, and the game's batched lookups are
+    2 points per mine cart with one or two carts on screen. Over a list
+    that is 1-3 us, against a fixed 7-11 us of NumPy call overhead - the
+    array lookup only pays off from about 16 points
+    (benchmarks/tunnel_field_bench.py). Finer fields (sample_step 1) get
+    the ring buffer.
     """
 
-    def __init__(self, screen_width: int, default_floor_y: int, sample_step: int = 4):
+    # Samples kept past the right edge of the screen (spawns happen there)
+    LOOKAHEAD_PX = 400
+
+    # Fields with fewer samples shift a list instead of using a ring buffer
+    # (between the game's 420 and the 1680 of a 1 px field - see above)
+    RING_MIN_SAMPLES = 1024
+
+    def __init__(
+        self,
+        screen_width: int,
+        default_floor_y: int,
+        sample_step: int = 4,
+        default_ceiling_y: int = 0,
+    ):
         self.screen_width = int(screen_width)
         self.default_floor_y = float(default_floor_y)
+        self.default_ceiling_y = float(default_ceiling_y)
 
         self.sample_step = max(1, int(sample_step))
-        self.sample_count = int(math.ceil(self.screen_width / self.sample_step)) + 16
+        self.sample_count = int(
+            math.ceil((self.screen_width + self.LOOKAHEAD_PX) / self.sample_step)
+        )
 
-        self._heights = [self.default_floor_y] * self.sample_count
-        self._last_height = self.default_floor_y
-        self._accum_shift_px = 0.0
+        # Ring buffer (NumPy arrays when available) vs shifted list
+        self.ring = self.sample_count >= self.RING_MIN_SAMPLES
+        self._arrays = self.ring and np is not None
+
+        self._origin_x = 0.0
+        self.reset()
 
     def reset(self) -> None:
-        self._heights = [self.default_floor_y] * self.sample_count
+        # Origin is kept: the next scroll_to() catches up with the camera
+        n = self.sample_count
+        if self._arrays:
+            self._heights = np.full(n, self.default_floor_y)
+            self._ceilings = np.full(n, self.default_ceiling_y)
+        else:
+            self._heights = [self.default_floor_y] * n
+            self._ceilings = [self.default_ceiling_y] * n
+
+        # Ring buffer slot of sample 0
+        self._head = 0
+
         self._last_height = self.default_floor_y
-        self._accum_shift_px = 0.0
+        self._last_ceiling = self.default_ceiling_y
+
+        # World x where the last painted span ends - samples scrolled in
+        # past it are open again (the tunnel section is over)
+        self._painted_to = -math.inf
+
+    def scroll_to(self, scroll_x: float) -> None:
+        """
+        Drop the samples that scrolled out on the left, extend on the right.
+        """
+        step = self.sample_step
+        shift = int((float(scroll_x) - self._origin_x) // step)
+
+        if shift < 0:
+            # Camera went back (new run) => start over at the new position
+            self._origin_x = (float(scroll_x) // step) * step
+            self.reset()
+            return
+
+        if shift == 0:
+            return
 
-    def update(self, dt: float, velocity: float) -> None:
-        dx = float(velocity) * float(dt)
-        if dx <= 0:
+        n = self.sample_count
+        if shift > n:
+            # Skipped more than the whole buffer => every slot is refilled
+            self._origin_x += (shift - n) * step
+            shift = n
+
+        self._origin_x += shift * step
+
+        # New samples before '_painted_to' continue the last panel
+        split = (self._painted_to - self._origin_x) / step
+        if split >= n:
+            split = n
+        elif split <= n - shift:
+            split = n - shift
+        else:
+            split = math.ceil(split)
+
+        if not self.ring:
+            # Short list: drop the front, append the new samples
+            heights = self._heights
+            ceilings = self._ceilings
+            del heights[:shift]
+            del ceilings[:shift]
+            if split > n - shift:
+                heights.extend([self._last_height] * (split - n + shift))
+                ceilings.extend([self._last_ceiling] * (split - n + shift))
+            if split < n:
+                heights.extend([self.default_floor_y] * (n - split))
+                ceilings.extend([self.default_ceiling_y] * (n - split))
             return
 
-        self._accum_shift_px += dx
+        # The slots of the dropped samples become the new right end
+        self._head = (self._head + shift) % n
+        self._fill(n - shift, split, self._last_height, self._last_ceiling)
+        self._fill(split, n, self.default_floor_y, self.default_ceiling_y)
+
+    def _ranges(self, i0: int, i1: int):
+        """
+        Ring buffer slices (start, stop) holding samples [i0, i1) - two of
+        them when the range wraps around.
+        """
+        n = self.sample_count
+        a = (self._head + i0) % n
+        count = i1 - i0
+        if a + count <= n:
+            return ((a, a + count),)
+        return ((a, n), (0, a + count - n))
 
-        while self._accum_shift_px >= self.sample_step:
-            self._accum_shift_px -= self.sample_step
-            self._heights.pop(0)
-            self._heights.append(self._last_height)
+    def _fill(self, i0: int, i1: int, floor_y: float, ceiling_y: float) -> None:
+        if i1 <= i0:
+            return
+        for a, b in self._ranges(i0, i1):
+            if self._arrays:
+                self._heights[a:b] = floor_y
+                self._ceilings[a:b] = ceiling_y
+            else:
+                self._heights[a:b] = [floor_y] * (b - a)
+                self._ceilings[a:b] = [ceiling_y] * (b - a)
 
-    def paint_span(self, x0: float, x1: float, floor_y: float) -> None:
+    def paint_span(
+        self,
+        x0: float,
+        x1: float,
+        floor_y: float,
+        ceiling_y: float | None = None,
+    ) -> None:
         floor_y = float(floor_y)
+        ceiling_y = self.default_ceiling_y if ceiling_y is None else float(ceiling_y)
+
         self._last_height = floor_y
+        self._last_ceiling = ceiling_y
 
         if x1 < x0:
             x0, x1 = x1, x0
 
-        x0 = max(0.0, x0)
-        x1 = min(float(self.screen_width + 400), x1)
+        self._painted_to = max(self._painted_to, x1)
+
+        # World -> field-local x
+        x0 = max(0.0, x0 - self._origin_x)
+        x1 = min(float(self.screen_width + self.LOOKAHEAD_PX), x1 - self._origin_x)
 
         if x1 <= 0:
             return
@@ -51,22 +190,82 @@ class TunnelField:
         i0 = int(x0 / self.sample_step)
         i1 = int(x1 / self.sample_step)
 
-        if i1 < 0 or i0 >= len(self._heights):
+        n = self.sample_count
+        if i1 < 0 or i0 >= n:
             return
 
         i0 = max(0, i0)
-        i1 = min(len(self._heights) - 1, i1)
+        i1 = min(n - 1, i1)
 
-        for i in range(i0, i1 + 1):
-            self._heights[i] = floor_y
+        for a, b in self._ranges(i0, i1 + 1):
+            if self._arrays:
+                np.minimum(self._heights[a:b], floor_y, out=self._heights[a:b])
+                np.maximum(self._ceilings[a:b], ceiling_y, out=self._ceilings[a:b])
+                continue
+            for slot in range(a, b):
+                if floor_y < self._heights[slot]:
+                    self._heights[slot] = floor_y
+                if ceiling_y > self._ceilings[slot]:
+                    self._ceilings[slot] = ceiling_y
 
-    def floor_y_at(self, x: float) -> float:
-        idx = int(float(x) / self.sample_step)
+    def _slot(self, x: float) -> int:
+        # World x -> ring buffer slot (clamped to the covered range)
+        idx = int((float(x) - self._origin_x) / self.sample_step)
         if idx < 0:
             idx = 0
-        if idx >= len(self._heights):
-            idx = len(self._heights) - 1
-        return self._heights[idx]
+        if idx >= self.sample_count:
+            idx = self.sample_count - 1
+        return (self._head + idx) % self.sample_count
+
+    def _slots(self, xs):
+        idx = ((np.asarray(xs) - self._origin_x) / self.sample_step).astype(np.intp)
+        np.maximum(idx, 0, out=idx)
+        np.minimum(idx, self.sample_count - 1, out=idx)
+        idx += self._head
+        idx %= self.sample_count
+        return idx
+
+    def floor_y_at(self, x):
+        """
+        Floor y at world x. Accepts a single x or a sequence / array of them
+        (one vectorized lookup on NumPy buffers, e.g. every cart at once).
+        """
+        if _is_scalar(x):
+            return float(self._heights[self._slot(x)])
+        if not self._arrays:
+            return [float(self._heights[self._slot(v)]) for v in x]
+        return self._heights[self._slots(x)]
+
+    def ceiling_y_at(self, x):
+        if _is_scalar(x):
+            return float(self._ceilings[self._slot(x)])
+        if not self._arrays:
+            return [float(self._ceilings[self._slot(v)]) for v in x]
+        return self._ceilings[self._slots(x)]
+
+    def samples_under(self, x0: float, x1: float):
+        """
+        (sample_left_x, sample_right_x, floor_y, ceiling_y) for every sample
+        overlapping [x0, x1] (world x).
+        """
+        step = self.sample_step
+        n = self.sample_count
+        i0 = int((float(x0) - self._origin_x) / step)
+        i1 = int((float(x1) - self._origin_x) / step)
+        i0 = min(max(i0, 0), n - 1)
+        i1 = min(max(i1, 0), n - 1)
+
+        heights = self._heights
+        ceilings = self._ceilings
+        for i in range(i0, i1 + 1):
+            slot = (self._head + i) % n
+            left = self._origin_x + i * step
+            yield left, left + step, float(heights[slot]), float(ceilings[slot])
+
+
+def _is_scalar(x) -> bool:
+    # NumPy scalars (np.float64, np.int32, ...) register as numbers.Real
+    return isinstance(x, (int, float)) or isinstance(x, numbers.Real)
 
 
 # 🔑 THIS IS WHAT YOU WERE MISSING
@@ -11,8 +11,20 @@ from ui import ScreenComputer
 from sound import SoundManager
 from debugger import Debugger
 
-if len(sys.argv) == 2:
-    if sys.argv[1] == "-d":
+# '--seed N' replays the same run (the seed is shown on game over)
+seed = None
+args = sys.argv[1:]
+if "--seed" in args:
+    i = args.index("--seed")
+    try:
+        seed = int(args[i + 1])
+    except (IndexError, ValueError):
+        print("Usage: --seed <integer>")
+        sys.exit()
+    del args[i:i + 2]
+
+if len(args) == 1:
+    if args[0] == "-d":
         Debugger.enable()
     else:
         print("To start the debugger, please use '-d' ")
@@ -33,7 +45,8 @@ gameMaster = GameMaster(
     engine=engine,
     player=player,
     sound=sound,
-    running=True
+    running=True,
+    seed=seed,
 )
 
 if Debugger.STATE:
@@ -43,5 +56,7 @@ while gameMaster.running:
     screen.blit(vScreen, (0, 0))
     gameMaster.update()
     pygame.display.flip()
+    gameMaster.pace()
 
+gameMaster.close()
 pygame.quit()
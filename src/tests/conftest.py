@@ -0,0 +1,23 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Run from anywhere: modules import from /src/, assets load from '../assets'
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SRC)
+os.chdir(SRC)
+
+import pygame
+
+
+@pytest.fixture(scope="session")
+def screen() -> pygame.Surface:
+    pygame.init()
+    # Sprites are loaded with convert_alpha() => needs a display
+    pygame.display.set_mode((1, 1))
+    return pygame.Surface((1280, 720))
@@ -0,0 +1,76 @@
+import pytest
+
+from gameplay.run_random import RUN_RANDOM
+from gameplay.spawners.beams_spawner import BEAMS_MAX_TIER, BeamsSpawner
+
+
+DURATION = 12.0
+
+
+def _section(spawner, tier: int, entry: int, exit: int) -> list[tuple[int, int]]:
+    # (opening top, opening bottom) per beam, spawned like SectionManager does
+    spawner.reset()
+    spawner.setDifficultyTier(tier)
+
+    openings = []
+    t = spawner.nextSpawnDelay()
+    while t < DURATION:
+        spawner.setSectionContext(entry, exit, DURATION - t)
+        top, bot = spawner.spawn(tier)[:2]
+        openings.append((top[2]["rect"][3], bot[2]["rect"][1]))
+        t += spawner.nextSpawnDelay()
+    return openings
+
+
+@pytest.fixture
+def spawner(screen):
+    RUN_RANDOM.setSeed(3)
+    return BeamsSpawner(screen)
+
+
+@pytest.mark.parametrize("tier", [0, 5, 10, 20, BEAMS_MAX_TIER])
+def test_every_step_follows_the_step_rules(spawner, tier):
+    for entry, exit in [(360, 360), (60, 660), (700, 100)]:
+        openings = _section(spawner, tier, entry, exit)
+        lo, hi = spawner._compute_center_bounds()
+
+        centers = [top + spawner.opening // 2 for top, _ in openings]
+        steps = [b - a for a, b in zip(centers, centers[1:])]
+        assert len(steps) > 5
+
+        # The whole opening is on screen, never clipped by the beam edges
+        assert all(bot - top == spawner.opening for top, bot in openings)
+        assert all(lo <= c <= hi for c in centers)
+        assert centers[0] == min(max(entry, lo), hi)
+
+        for last, step in zip([None] + steps, steps):
+            assert spawner.min_center_step <= abs(step) <= spawner.max_center_step
+            assert step != last
+            assert not (step > 0 and last is not None and last > 0)
+
+
+def test_anchor_takes_the_allowed_step_closest_to_its_target(spawner):
+    spawner.setDifficultyTier(10)
+    lo, hi = spawner._compute_center_bounds()
+    min_step, max_step = spawner.min_center_step, spawner.max_center_step
+
+    def towards(center: int, last_step: int | None, target: int) -> int:
+        spawner._last_center_y = center
+        spawner._last_step = last_step
+        return spawner._step_towards(target, lo, hi)
+
+    # Far away: a full step; close by: right onto it
+    assert towards(360, 20, 100) == 360 - max_step
+    assert towards(360, -20, 400) == 400
+    # Down twice is not allowed => the smallest step up instead
+    assert towards(360, 20, 500) == 360 - min_step
+    # Already there: it still moves, up on a tie
+    assert towards(360, None, 360) == 360 - min_step
+    # The same step as the last one is skipped
+    assert towards(360, -30, 330) == 330 - 1
+
+
+def test_opening_stays_passable_at_every_tier(spawner):
+    for tier in range(BEAMS_MAX_TIER + 5):
+        spawner.setDifficultyTier(tier)
+        assert spawner.opening >= 200
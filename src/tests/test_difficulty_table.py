@@ -0,0 +1,63 @@
+import pytest
+
+from gameplay.difficulty_table import DifficultyTable
+from gameplay.spawners.beams_spawner import BEAMS_MAX_TIER, _beams_tier, beamsDifficulty
+from gameplay.spawners.spikes_spawner import SPIKES_MAX_TIER, _spikes_tier, spikesDifficulty
+from gameplay.spawners.tunnel_spawner import TUNNEL_MAX_TIER, _tunnel_tier, tunnelDifficulty
+
+
+def _table() -> DifficultyTable:
+    return DifficultyTable("test", lambda tier: {"rate": 1.0 - tier * 0.1, "count": tier}, 3)
+
+
+def test_lookup_clamps_to_the_compiled_tiers():
+    table = _table()
+
+    assert len(table) == 4
+    assert table.lookup(2)["count"] == 2
+    assert table.lookup(-5) == table.lookup(0)
+    assert table.lookup(3) is table.lookup(40)
+
+
+def test_records_are_read_only():
+    record = _table().lookup(1)
+
+    with pytest.raises(TypeError):
+        record["count"] = 9
+
+
+def test_apply_copies_the_record_onto_the_target():
+    class Target:
+        pass
+
+    table = _table()
+    target = Target()
+    record = table.apply(target, 7)
+
+    assert record is table.lookup(3)
+    assert (target.rate, target.count) == (pytest.approx(0.7), 3)
+
+
+def test_dump_has_a_row_per_tier():
+    lines = _table().dump().splitlines()
+
+    assert lines[0] == "test (tiers 0..3, capped after)"
+    assert len(lines) == 3 + 4
+    assert lines[-1].split() == ["3", "|", "0.700", "|", "3"]
+
+
+@pytest.mark.parametrize(
+    "table, compile_tier, max_tier",
+    [
+        (spikesDifficulty(), _spikes_tier, SPIKES_MAX_TIER),
+        (tunnelDifficulty(), lambda tier: _tunnel_tier(tier, 175), TUNNEL_MAX_TIER),
+        (beamsDifficulty(), _beams_tier, BEAMS_MAX_TIER),
+    ],
+)
+def test_spawner_tables_match_their_formulas_and_are_capped(table, compile_tier, max_tier):
+    for tier in range(max_tier + 1):
+        assert dict(table.lookup(tier)) == dict(compile_tier(tier))
+
+    # Tiers past the table would not have changed anything
+    for tier in range(max_tier + 1, max_tier + 40):
+        assert dict(compile_tier(tier)) == dict(table.lookup(tier))
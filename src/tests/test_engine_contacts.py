@@ -0,0 +1,83 @@
+import itertools
+
+import pygame
+import pytest
+
+from core import PhysicsEngine
+from gameplay.tunnel_field import TunnelField
+
+
+class _Player:
+    def __init__(self, x, y, vy=0.0):
+        self.currPos = pygame.Vector2(x, y)
+        self.velocity = pygame.Vector2(0, vy)
+
+    def getHitbox(self):
+        return self.currPos, 35.0
+
+
+@pytest.fixture
+def engine():
+    return PhysicsEngine(screen=None)
+
+
+def _field(floor_y, ceiling_y=0):
+    field = TunnelField(screen_width=1280, default_floor_y=720, sample_step=4)
+    field.paint_span(0, 1600, floor_y, ceiling_y)
+    return field
+
+
+def test_result_does_not_depend_on_contact_order(engine):
+    field = _field(600)
+    rects = [
+        pygame.Rect(560, 590, 80, 130),  # deepest floor contact
+        pygame.Rect(620, 596, 80, 124),
+        pygame.Rect(580, 0, 60, 240),    # out of reach
+    ]
+
+    results = set()
+    for order in itertools.permutations(rects):
+        player = _Player(600, 580, vy=120)
+        standing = engine.solveContacts(player, list(order), field)
+        results.add((player.currPos.y, player.velocity.y, standing))
+
+    # Pushed up onto the highest surface (590), once - not by 15 + 25 px
+    assert results == {(590 - 35, 0, True)}
+
+
+def test_squeezed_between_floor_and_ceiling_the_floor_wins(engine):
+    player = _Player(600, 580, vy=-200)
+
+    assert engine.solveContacts(player, [], _field(600, ceiling_y=560))
+    assert player.currPos.y == 600 - 35
+    # Moving up into the ceiling keeps its velocity - only a floor stops a fall
+    assert player.velocity.y == -200
+
+
+def test_ceiling_pushes_down_and_is_not_standing(engine):
+    player = _Player(600, 150, vy=-200)
+
+    assert not engine.solveContacts(player, [pygame.Rect(560, 0, 80, 130)])
+    assert player.currPos.y == 130 + 35
+    assert player.velocity.y == 0
+
+
+@pytest.mark.parametrize("y, standing", [(565, True), (563, True), (560, False)])
+def test_standing_is_resting_within_2px_of_the_floor(engine, y, standing):
+    player = _Player(600, y)
+
+    assert engine.solveContacts(player, [], _field(600)) is standing
+    assert player.currPos.y == y
+
+
+def test_side_contacts_only_move_y(engine):
+    # Overlapping the left face of a tall block: nothing to resolve in y
+    player = _Player(600, 400)
+    wall = pygame.Rect(620, 100, 200, 600)
+
+    assert not engine.solveContacts(player, [wall])
+    assert player.currPos == pygame.Vector2(600, 400)
+
+    # The single-rect resolver still pushes sideways
+    engine.resolveSolidCircleRect(player, wall)
+    assert player.currPos == pygame.Vector2(620 - 35, 400)
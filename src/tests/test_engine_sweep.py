@@ -0,0 +1,126 @@
+import pygame
+import pytest
+
+from core import PhysicsEngine
+
+
+class _Player:
+    # 35 px circle that moved from 'prev' to 'curr' over the step
+    def __init__(self, prev, curr):
+        self.prevPos = pygame.Vector2(prev)
+        self.currPos = pygame.Vector2(curr)
+
+    def getHitbox(self):
+        return self.currPos, 35.0
+
+
+class _Box:
+    def __init__(self, rect, **motion):
+        self.rect = pygame.Rect(rect)
+        for name, value in motion.items():
+            setattr(self, name, value)
+
+    def getHitbox(self):
+        return self.rect
+
+
+class _Ball:
+    # Circle hazard; 'x' / 'y' and 'prev_x' / 'prev_y' like a Fireball
+    def __init__(self, center, radius, prev=None):
+        self.x, self.y = center
+        self.prev_x, self.prev_y = prev if prev is not None else center
+        self.radius = radius
+
+    def getHitbox(self):
+        return pygame.Vector2(self.x, self.y), self.radius
+
+
+@pytest.fixture
+def engine():
+    return PhysicsEngine(screen=None, sweptCollision=True)
+
+
+def test_fast_fall_through_a_thin_plank_is_caught(engine):
+    plank = _Box((0, 400, 200, 4))
+    player = _Player((100, 300), (100, 520))
+
+    # Both ends of the step are clear of the plank
+    assert not engine.checkCollision(player, plank)
+    assert not engine._circToRectCol(player.prevPos, 35, plank.rect)
+    assert engine.checkCollisionSwept(player, plank)
+
+
+def test_thin_wall_crossed_sideways_is_caught(engine):
+    wall = _Box((500, 0, 6, 720))
+
+    assert engine.checkCollisionSwept(_Player((400, 300), (600, 300)), wall)
+    assert not engine.checkCollisionSwept(_Player((400, 300), (460, 300)), wall)
+
+
+def test_grazing_past_a_corner(engine):
+    box = _Box((200, 200, 100, 100))
+
+    # Diagonal path passing the top-right corner (300, 200) at distance d
+    def path(d):
+        offset = pygame.Vector2(1, -1).normalize() * d
+        corner = pygame.Vector2(300, 200) + offset
+        along = pygame.Vector2(1, 1).normalize() * 150
+        return _Player(corner - along, corner + along)
+
+    assert not engine.checkCollisionSwept(path(36), box)
+    assert engine.checkCollisionSwept(path(34), box)
+
+
+def test_zero_length_step_is_the_plain_test(engine):
+    box = _Box((200, 200, 100, 100))
+
+    for center in [(250, 250), (320, 250), (360, 250), (336, 236)]:
+        player = _Player(center, center)
+        assert engine.checkCollisionSwept(player, box) == engine.checkCollision(player, box)
+
+    p = pygame.Vector2(250, 250)
+    assert engine._segToRectCol(p, p, box.rect)
+    q = pygame.Vector2(150, 250)
+    assert not engine._segToRectCol(q, q, box.rect)
+
+
+def test_segment_clip_needs_both_axes_to_overlap(engine):
+    rect = pygame.Rect(100, 100, 50, 50)
+    V = pygame.Vector2
+
+    assert engine._segToRectCol(V(0, 0), V(200, 200), rect)
+    assert engine._segToRectCol(V(125, 0), V(125, 300), rect)
+    # Crosses the y band before reaching the x band (passes the corner)
+    assert not engine._segToRectCol(V(0, 160), V(160, 0), rect)
+    assert not engine._segToRectCol(V(0, 0), V(90, 300), rect)
+
+
+def test_sweep_is_relative_to_a_moving_obstacle(engine):
+    # The player stays put while the box moves through it over the step
+    player = _Player((300, 300), (300, 300))
+    box = _Box((340, 290, 10, 20), x=340, y=290, prev_x=200, prev_y=290)
+
+    assert not engine.checkCollision(player, box)
+    assert engine.checkCollisionSwept(player, box)
+
+    # Same step length, but the box started past the player and moves away
+    away = _Box((480, 290, 10, 20), x=480, y=290, prev_x=340, prev_y=290)
+    assert not engine.checkCollisionSwept(player, away)
+
+
+def test_circle_sweep(engine):
+    # Player falls 200 px past a fireball sitting beside its path
+    player = _Player((100, 200), (100, 400))
+
+    near = _Ball((140, 300), 10)
+    assert not engine.checkCircleCollision(player, near)
+    assert engine.checkCircleCollisionSwept(player, near)
+
+    far = _Ball((146, 300), 10)
+    assert not engine.checkCircleCollisionSwept(player, far)
+
+    # Fireball rising through a resting player within one step
+    player = _Player((100, 300), (100, 300))
+    rising = _Ball((100, 200), 10, prev=(100, 400))
+    assert not engine.checkCircleCollision(player, rising)
+    assert engine.checkCircleCollisionSwept(player, rising)
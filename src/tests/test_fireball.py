@@ -0,0 +1,72 @@
+import pytest
+
+from gameplay.spawners.spikes_spawner import Fireball
+
+
+def _fireball(**kwargs):
+    kwargs.setdefault("seed", 1234)
+    return Fireball(x=900.0, lava_top_y=686.0, **kwargs)
+
+
+def test_y_at_is_pure():
+    fb = _fireball()
+    before = (fb.y, fb.prev_y, fb.peak_y, fb._cycle)
+
+    ts = [0.0, 3.7, 0.4, 12.25, 0.4]
+    ys = [fb.yAt(t) for t in ts]
+
+    assert (fb.y, fb.prev_y, fb.peak_y, fb._cycle) == before
+    assert ys[2] == ys[4]
+
+
+def test_y_at_repeats_every_period():
+    fb = _fireball(period=1.9)
+    fb.setSpawnTime(2.0)
+
+    for t in [2.0, 2.3, 3.1, 3.85]:
+        assert fb.yAt(t + 1.9) == pytest.approx(fb.yAt(t))
+        assert fb.yAt(t + 5 * 1.9) == pytest.approx(fb.yAt(t))
+
+
+def test_eruption_goes_from_rest_to_peak_and_back():
+    fb = _fireball(period=2.0)
+    # Spawn time that puts a cycle start at t = 0
+    fb.setSpawnTime(fb.phase0 * fb.period)
+
+    assert fb.yAt(0.0) == pytest.approx(fb.rest_y)
+    assert fb.yAt(1.0) == pytest.approx(fb.peak_y)
+    assert fb.yAt(2.0) == pytest.approx(fb.rest_y)
+    assert fb.peak_max_y <= fb.peak_y <= fb.peak_min_y
+
+
+def test_same_seed_replays_the_same_heights():
+    ts = [i * 0.37 for i in range(40)]
+    a = _fireball(seed=99, reroll_each_cycle=True)
+    b = _fireball(seed=99, reroll_each_cycle=True)
+
+    # Cycles evaluated in any order give the same peaks
+    assert [a.yAt(t) for t in ts] == [b.yAt(t) for t in reversed(ts)][::-1]
+
+    c = _fireball(seed=100, reroll_each_cycle=True)
+    assert [a.yAt(t) for t in ts] != [c.yAt(t) for t in ts]
+
+
+def test_rerolled_peaks_stay_in_range():
+    fb = _fireball(reroll_each_cycle=True, uniform_peak=False)
+    peaks = {fb.peakForCycle(c) for c in range(200)}
+
+    assert len(peaks) > 100
+    assert all(fb.peak_max_y <= p <= fb.peak_min_y for p in peaks)
+
+
+def test_hitbox_is_a_circle_following_the_eruption():
+    fb = _fireball(radius=16)
+    fb.moveTo(0.8)
+
+    center, radius = fb.getHitbox()
+    assert radius == 16
+    assert (center.x, center.y) == (900.0, pytest.approx(fb.yAt(0.8)))
+
+    fb.moveTo(1.1)
+    assert fb.getHitbox()[0].y == pytest.approx(fb.yAt(1.1))
+    assert fb.prev_y == pytest.approx(fb.yAt(0.8))
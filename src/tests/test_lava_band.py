@@ -0,0 +1,61 @@
+import pygame
+
+from gameplay.lava_band import LavaBand
+
+
+def _band(screen):
+    return LavaBand(screen, 34)
+
+
+def _spans(band):
+    return [(s.left, s.right) for s in band.spans]
+
+
+def test_touching_and_overlapping_spans_merge(screen):
+    band = _band(screen)
+    band.extend(100, 300)
+    band.extend(250, 500)  # overlaps
+    band.extend(500, 640)  # touches
+    band.extend(600, 620)  # inside
+
+    assert _spans(band) == [(100, 640)]
+    assert band.spans[0].top == screen.get_height() - 34
+    assert band.spans[0].height == 34
+
+
+def test_gaps_start_a_new_span(screen):
+    band = _band(screen)
+    band.extend(100, 300)
+    band.extend(301, 400)
+    band.extend(380, 450)
+
+    assert _spans(band) == [(100, 300), (301, 450)]
+
+
+def test_spans_leave_once_their_fade_is_off_screen(screen):
+    band = _band(screen)
+    band.extend(0, 200)
+    band.extend(1000, 1200)
+
+    band.scroll_to(200 + LavaBand.FADE_PX - 1)
+    assert _spans(band) == [(0, 200), (1000, 1200)]
+
+    band.scroll_to(200 + LavaBand.FADE_PX)
+    assert _spans(band) == [(1000, 1200)]
+
+    band.reset()
+    assert band.spans == []
+
+
+def test_hits_is_circle_vs_span(screen):
+    band = _band(screen)
+    band.extend(100, 300)
+    band.extend(600, 700)
+    top = band.getTopY()
+
+    assert band.hits(pygame.Vector2(200, top - 10), 35)
+    assert not band.hits(pygame.Vector2(200, top - 35), 35)
+    # Gap between the spans / past the corner
+    assert not band.hits(pygame.Vector2(450, top + 5), 35)
+    assert not band.hits(pygame.Vector2(300 + 30, top - 30), 35)
+    assert band.hits(pygame.Vector2(600 - 20, top + 5), 35)
@@ -0,0 +1,67 @@
+import pygame
+
+from core import PhysicsEngine
+from core.states.game_in_progress import GameInProgressState
+from entities import RectObstacle
+
+
+class _Player:
+    # 35 px circle with a fully opaque 70x70 sprite
+    def __init__(self, center):
+        self.center = pygame.Vector2(center)
+        self._mask = pygame.mask.Mask((70, 70), fill=True)
+
+    def getHitbox(self):
+        return self.center, 35.0
+
+    def getSpriteRect(self):
+        return pygame.Rect(0, 0, 70, 70).move(self.center.x - 35, self.center.y - 35)
+
+    def getMask(self):
+        return self._mask
+
+
+class _Sprited:
+    # Lethal hazard whose sprite is bigger than its hitbox
+    lethal = True
+    all_edges_lethal = True
+
+    def __init__(self, hitbox, sprite_rect, filled=True):
+        self.hitbox = pygame.Rect(hitbox)
+        self.sprite_rect = pygame.Rect(sprite_rect)
+        self.mask = pygame.mask.Mask(self.sprite_rect.size, fill=filled)
+
+    def getHitbox(self):
+        return self.hitbox
+
+    def getSpriteRect(self):
+        return self.sprite_rect
+
+    def getMask(self):
+        return self.mask
+
+
+class _Master:
+    def __init__(self, player, mask_collision=True):
+        self.player = player
+        self.engine = PhysicsEngine(screen=None, maskCollision=mask_collision)
+
+
+def _lethalHits(lethal, solid=()):
+    state = GameInProgressState(_Master(_Player((100, 100))))
+    hits, _, _ = state._narrowPhase(list(lethal), list(solid), [])
+    return hits
+
+
+def test_mask_runs_only_after_the_hitbox_hit():
+    # Sprite overlaps the player, hitbox doesn't => no death
+    outside = _Sprited(hitbox=(300, 300, 10, 10), sprite_rect=(90, 90, 400, 400))
+    assert _lethalHits([outside]) == []
+
+    # Hitbox overlaps, sprite pixels too => death
+    inside = _Sprited(hitbox=(110, 90, 20, 20), sprite_rect=(100, 80, 60, 60))
+    assert _lethalHits([inside]) == [inside]
+
+    # Hitbox overlaps but the sprite is transparent there => no death
+    hollow = _Sprited(hitbox=(110, 90, 20, 20), sprite_rect=(100, 80, 60, 60), filled=False)
+    assert _lethalHits([hollow]) == []
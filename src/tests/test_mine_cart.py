@@ -0,0 +1,91 @@
+import pytest
+
+from entities import MineCart
+from gameplay.tunnel_field import TunnelField, np
+
+
+DT = 1 / 120
+
+
+def _field(ring: bool) -> TunnelField:
+    field = TunnelField(screen_width=1280, default_floor_y=720, sample_step=4)
+    field.ring = ring
+    field._arrays = ring and np is not None
+    field.reset()
+    # Floor at 600, a 6 px step up left of x 900 and a 34 px one left of 400
+    field.paint_span(0, 400, 560, 0)
+    field.paint_span(400, 900, 594, 0)
+    field.paint_span(900, 1600, 600, 0)
+    return field
+
+
+def _carts(field) -> list[MineCart]:
+    carts = [
+        MineCart(rect=(1000 + 90 * i, 480 + 15 * i, 70, 36), velocity=150 + 20 * i)
+        for i in range(4)
+    ]
+    for cart in carts[:3]:
+        cart.attach_floor_field(field)
+    return carts
+
+
+def _state(carts):
+    return [(c.x, c.y, c.vy, c.on_floor, c.dead, tuple(c.rect)) for c in carts]
+
+
+@pytest.mark.parametrize("ring", [False, True])
+def test_batched_step_matches_one_cart_at_a_time(ring):
+    batched = _carts(_field(ring))
+    single = _carts(_field(ring))
+
+    for _ in range(600):
+        MineCart.updateAll(batched, DT)
+        for cart in single:
+            cart.update(DT)
+        assert _state(batched) == _state(single)
+
+
+def test_cart_falls_onto_the_floor_and_rides_it():
+    cart = _carts(_field(ring=False))[0]
+
+    for _ in range(60):
+        cart.update(DT)
+
+    assert cart.on_floor
+    assert cart.vy == 0.0
+    assert cart.rect.bottom == 600
+
+
+def test_small_steps_are_eased_up_at_climb_speed():
+    cart = _carts(_field(ring=False))[0]
+
+    climbed = []
+    while cart.x + 35 > 700:
+        prev_y = cart.y
+        cart.update(DT)
+        if cart.on_floor and prev_y > cart.y:
+            climbed.append(prev_y - cart.y)
+
+    assert cart.rect.bottom == 594
+    # 6 px taken at most CLIMB_SPEED * dt per step instead of one snap
+    assert len(climbed) > 1
+    assert sum(climbed) == pytest.approx(6)
+    assert max(climbed) <= MineCart.CLIMB_SPEED * DT
+    assert not cart.dead
+
+
+def test_wall_under_the_front_crashes_the_cart():
+    field = TunnelField(screen_width=1280, default_floor_y=720, sample_step=4)
+    field.paint_span(0, 1060, 600, 0)
+    field.paint_span(1060, 1600, 600 - 11, 0)
+    cart = MineCart(rect=(1000, 564, 70, 36), velocity=150)
+    cart.attach_floor_field(field)
+
+    cart.update(DT)
+
+    assert cart.dead
+    assert cart.shouldKill()
+    # Dead carts are skipped by the batched step
+    x = cart.x
+    MineCart.updateAll([cart], DT)
+    assert cart.x == x
@@ -0,0 +1,73 @@
+import pytest
+
+import gameplay.section_blueprint as blueprint
+from entities import RectObstacle
+from gameplay.passability import PLAYER_RADIUS, PassabilityVerifier
+from gameplay.run_random import RUN_RANDOM
+from gameplay.section_blueprint import SectionBlueprint
+from gameplay.section_manager import SectionManager
+
+
+WORLD_SPEED = 520.0
+
+
+@pytest.fixture(scope="module")
+def verifier(screen):
+    return PassabilityVerifier(screen)
+
+
+def _wall(gap_top: int | None = None, gap: int = 0) -> SectionBlueprint:
+    # One 60 px wide wall a second in, with an optional opening
+    H = 720
+    ops = []
+    if gap_top is None:
+        ops.append(blueprint.entity(RectObstacle, rect=(0, 0, 60, H)))
+    else:
+        ops.append(blueprint.entity(RectObstacle, rect=(0, 0, 60, gap_top)))
+        ops.append(blueprint.entity(RectObstacle, rect=(0, gap_top + gap, 60, H - gap_top - gap)))
+
+    bp = SectionBlueprint("beams", 0, 3.0)
+    bp.add(1.0, ops)
+    return bp
+
+
+def test_empty_section_passes_at_every_height(verifier):
+    result = verifier.verify(SectionBlueprint("beams", 0, 2.0), WORLD_SPEED)
+
+    assert result
+    assert result.fail_step is None
+    assert min(result.exit_ys) <= 100
+    assert max(result.exit_ys) >= 720 - 100
+
+
+def test_full_height_wall_blocks(verifier):
+    result = verifier.verify(_wall(), WORLD_SPEED)
+
+    assert not result
+    assert result.exit_ys == []
+    # Dies where the wall is: a second of scrolling in, past the spawn point
+    assert WORLD_SPEED < result.fail_x < WORLD_SPEED + 1280 + 20 + 60
+
+
+def test_gap_narrower_than_the_player_blocks(verifier):
+    assert not verifier.verify(_wall(gap_top=320, gap=2 * PLAYER_RADIUS - 10), WORLD_SPEED)
+
+
+def test_wide_gap_passes(verifier):
+    bp = _wall(gap_top=320, gap=220)
+
+    assert verifier.verify(bp, WORLD_SPEED)
+    # Entered just above the floor, the player still climbs to the gap
+    assert verifier.verify(bp, WORLD_SPEED, start_ys=[640])
+
+
+def test_generated_beams_sections_pass(screen, verifier):
+    RUN_RANDOM.fixSeed(1)
+    manager = SectionManager(screen)
+    try:
+        for tier in (0, 20):
+            bp = manager._runSpawner("beams", tier, 6.0, WORLD_SPEED, 0.0)
+            assert verifier.verify(bp, WORLD_SPEED), tier
+    finally:
+        manager.close()
+        RUN_RANDOM.fixSeed(None)
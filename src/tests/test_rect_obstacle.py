@@ -0,0 +1,53 @@
+import pytest
+
+from entities import RectObstacle
+
+
+def _wall(grows: bool = True, **kwargs) -> RectObstacle:
+    return RectObstacle(rect=(100, 0, 80, 200), grows=grows, **kwargs)
+
+
+@pytest.mark.parametrize("x", [100, 140, 180])
+def test_continuing_panel_grows_the_wall(x):
+    wall = _wall()
+
+    assert wall.extendTo((x, 0, 80, 200))
+    assert tuple(wall.rect) == (100, 0, x + 80 - 100, 200)
+
+
+def test_panel_inside_the_wall_changes_nothing_but_is_merged():
+    wall = _wall()
+
+    assert wall.extendTo((120, 0, 20, 200))
+    assert tuple(wall.rect) == (100, 0, 80, 200)
+
+
+@pytest.mark.parametrize(
+    "rect",
+    [
+        (181, 0, 80, 200),  # gap
+        (60, 0, 80, 200),   # starts before the wall
+        (140, 10, 80, 190),  # other top
+        (140, 0, 80, 210),  # other height
+    ],
+)
+def test_panel_that_does_not_line_up_is_refused(rect):
+    wall = _wall()
+
+    assert not wall.extendTo(rect)
+    assert tuple(wall.rect) == (100, 0, 80, 200)
+
+
+def test_only_growing_walls_extend():
+    wall = _wall(grows=False)
+
+    assert not wall.extendTo((180, 0, 80, 200))
+    assert wall.rect.width == 80
+
+
+def test_edge_zones_follow_the_grown_wall():
+    wall = _wall(lethal_edges={"right"}, edge_margin=10)
+
+    wall.extendTo((180, 0, 80, 200))
+
+    assert wall.edge_zones == ((250, 0, 260, 200),)
@@ -0,0 +1,44 @@
+import pytest
+
+from entities import RectObstacle, HazardPatch, MineCart
+from gameplay.camera import Camera
+from gameplay.entity_world import EntityWorld
+
+
+DURATION = 2.0
+WORLD_SPEED = 520.0
+CART_SPEED = 156.0
+
+DTS = [1 / 30, 1 / 60, 1 / 144, 1 / 240, 1 / 1000]
+
+
+def _screenXs(screen, dt: float) -> list[float]:
+    # Same scenario at every dt: where each entity is on screen after DURATION
+    world = EntityWorld(screen.get_width())
+    camera = Camera()
+
+    entities = [
+        RectObstacle(rect=(1300, 0, 184, 200)),
+        RectObstacle(rect=(1500, 400, 50, 80), lethal=True),
+        HazardPatch(rect=(1400, 680, 300, 40)),
+        MineCart(rect=(1600, 300, 70, 36), velocity=CART_SPEED),
+    ]
+    world.extend(entities)
+
+    for _ in range(round(DURATION / dt)):
+        camera.update(dt, WORLD_SPEED)
+        world.update(dt, camera.x)
+
+    return [e.rect.x - round(camera.x) for e in entities]
+
+
+def test_scroll_distance_matches_across_dt(screen):
+    reference = _screenXs(screen, 1 / 120)
+
+    # Everything covered the world's scroll (the cart its own speed on top)
+    expected = [1300, 1500, 1400, 1600 - CART_SPEED * DURATION]
+    expected = [x - WORLD_SPEED * DURATION for x in expected]
+    assert reference == pytest.approx(expected, abs=1.0)
+
+    for dt in DTS:
+        assert _screenXs(screen, dt) == pytest.approx(reference, abs=1.0), dt
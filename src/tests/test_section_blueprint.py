@@ -0,0 +1,100 @@
+import gameplay.section_blueprint as blueprint
+from entities import Coin, MineCart, RectObstacle
+from gameplay.lava_band import LavaBand
+from gameplay.section_blueprint import SectionBlueprint
+from gameplay.tunnel_field import TunnelField
+
+
+def _build(cls, **kwargs):
+    return cls(**kwargs)
+
+
+def _blueprint() -> SectionBlueprint:
+    bp = SectionBlueprint("tunnel", 2, 9.0)
+    bp.add(0.5, [
+        blueprint.paint(0, 200, 600, 80),
+        blueprint.entity(RectObstacle, rect=(10, 600, 190, 120)),
+        blueprint.coin(Coin, pos=(100, 300)),
+    ])
+    bp.add(1.2, [
+        blueprint.entity(MineCart, rect=(40, 500, 70, 36), velocity=150),
+        blueprint.lava(0, 120),
+    ])
+    return bp
+
+
+def test_blueprint_keeps_offsets_and_counts_ops():
+    bp = _blueprint()
+
+    assert len(bp) == 2
+    assert bp.offsets == [0.5, 1.2]
+    assert bp.counts() == {"paint": 1, "RectObstacle": 1, "Coin": 1, "MineCart": 1, "lava": 1}
+
+
+def test_instantiate_places_every_op_at_the_spawn_point(screen):
+    bp = _blueprint()
+    field = TunnelField(screen_width=1280, default_floor_y=720, sample_step=4)
+    lava = LavaBand(screen, 34)
+
+    obstacles, coins = blueprint.instantiate(bp.spawns[0], 1000, field=field, acquire=_build)
+    (wall,), (coin,) = obstacles, coins
+    assert tuple(wall.rect) == (1010, 600, 190, 120)
+    assert (coin.pos.x, coin.pos.y) == (1100, 300)
+    assert field.floor_y_at(1100) == 600
+    assert field.floor_y_at(900) == 720
+
+    obstacles, coins = blueprint.instantiate(bp.spawns[1], 1000, lava, field=field, acquire=_build)
+    (cart,) = obstacles
+    assert coins == []
+    assert cart.x == 1040
+    # Floor riders get the field the section was painted into
+    assert cart.floor_field is field
+    assert [(s.left, s.right) for s in lava.spans] == [(1000, 1120)]
+
+
+def test_ops_are_reusable_data(screen):
+    bp = _blueprint()
+    ops = bp.spawns[0]
+    before = [dict(op[2]) for op in ops if op[0] == blueprint.ENTITY]
+    field = TunnelField(screen_width=1280, default_floor_y=720, sample_step=4)
+
+    (a,), _ = blueprint.instantiate(ops, 0, field=field, acquire=_build)
+    (b,), _ = blueprint.instantiate(ops, 640, field=field, acquire=_build)
+
+    assert [dict(op[2]) for op in ops if op[0] == blueprint.ENTITY] == before
+    assert a is not b
+    assert b.rect.x - a.rect.x == 640
+    assert b.rect.size == a.rect.size
+
+
+def _panel(x: int, top: int = 0, height: int = 200) -> list:
+    return [blueprint.span("ceiling", RectObstacle, rect=(x, top, 60, height), lethal=False)]
+
+
+def test_span_ops_grow_one_wall_while_panels_line_up():
+    spans = {}
+
+    (wall,), _ = blueprint.instantiate(_panel(0), 1000, acquire=_build, spans=spans)
+    for x in (1060, 1120):
+        obstacles, _ = blueprint.instantiate(_panel(0), x, acquire=_build, spans=spans)
+        assert obstacles == []
+
+    assert spans == {"ceiling": wall}
+    assert tuple(wall.rect) == (1000, 0, 180, 200)
+
+    # Another height starts the next wall, which later panels grow instead
+    (step,), _ = blueprint.instantiate(_panel(0, height=240), 1180, acquire=_build, spans=spans)
+    blueprint.instantiate(_panel(0, height=240), 1240, acquire=_build, spans=spans)
+
+    assert spans["ceiling"] is step
+    assert tuple(step.rect) == (1180, 0, 120, 240)
+    assert wall.rect.width == 180
+
+
+def test_span_ops_without_spans_are_plain_entities():
+    (a,), _ = blueprint.instantiate(_panel(0), 1000, acquire=_build)
+    (b,), _ = blueprint.instantiate(_panel(0), 1060, acquire=_build)
+
+    assert not a.grows
+    assert (a.rect.x, b.rect.x) == (1000, 1060)
+    assert a.rect.width == b.rect.width == 60
@@ -0,0 +1,94 @@
+import pytest
+
+from gameplay.run_random import RUN_RANDOM
+from gameplay.section_manager import SectionManager
+
+
+WORLD_SPEED = 520.0
+
+
+@pytest.fixture
+def manager(screen):
+    RUN_RANDOM.fixSeed(7)
+    manager = SectionManager(screen)
+    yield manager
+    manager.close()
+    RUN_RANDOM.fixSeed(None)
+
+
+def _where(e):
+    return type(e).__name__, e.getSpanX()
+
+
+def _spawnedOver(manager, dt: float, seconds: float) -> list:
+    spawned = []
+    steps = round(seconds / dt)
+    for i in range(steps + 1):
+        obstacles, coins = manager.maybe_spawn(world_speed=WORLD_SPEED, scroll_x=i * dt * WORLD_SPEED)
+        spawned.extend(_where(e) for e in obstacles + coins)
+    return spawned
+
+
+def test_nothing_spawns_before_the_first_event_is_due(manager):
+    due = manager.getBlueprint().offsets[0] * WORLD_SPEED
+
+    assert manager.maybe_spawn(world_speed=WORLD_SPEED, scroll_x=0.0) == ([], [])
+    assert manager.maybe_spawn(world_speed=WORLD_SPEED, scroll_x=due - 1.0) == ([], [])
+
+    obstacles, coins = manager.maybe_spawn(world_speed=WORLD_SPEED, scroll_x=due)
+    assert obstacles or coins
+
+
+def test_one_long_step_fires_every_due_event(manager):
+    offsets = manager.getBlueprint().offsets
+    manager.maybe_spawn(world_speed=WORLD_SPEED, scroll_x=0.0)
+
+    # Every spawn due by 5 s, all at once
+    obstacles, _ = manager.maybe_spawn(world_speed=WORLD_SPEED, scroll_x=5.0 * WORLD_SPEED)
+    due = [t for t in offsets if t * WORLD_SPEED <= 5.0 * WORLD_SPEED]
+
+    assert len(due) > 1
+    assert len(obstacles) >= len(due)
+    assert manager.maybe_spawn(world_speed=WORLD_SPEED, scroll_x=5.0 * WORLD_SPEED) == ([], [])
+
+
+@pytest.mark.parametrize("dt", [1 / 20, 1 / 144, 1 / 500])
+def test_spawns_land_at_the_same_world_x_at_any_frame_rate(screen, dt):
+    RUN_RANDOM.fixSeed(7)
+    # One live manager at a time - they share the RUN_RANDOM streams
+    manager = SectionManager(screen)
+    try:
+        reference = _spawnedOver(manager, 1 / 120, 8.0)
+    finally:
+        manager.close()
+
+    manager = SectionManager(screen)
+    try:
+        spawned = _spawnedOver(manager, dt, 8.0)
+    finally:
+        manager.close()
+        RUN_RANDOM.fixSeed(None)
+
+    assert len(reference) > 5
+    assert spawned == reference
+
+
+def _ops(manager) -> list:
+    # The playing section's ops and the next one's (generated in the background)
+    return [manager.getBlueprint().spawns, manager._next.result().spawns]
+
+
+def test_reset_replays_the_run_whatever_the_last_one_ended_at(manager):
+    expected = _ops(manager)
+
+    # A run that got fast before it ended
+    for i in range(1, 1500):
+        manager.maybe_spawn(hazard_intensity=0.9, world_speed=800.0, scroll_x=i * 8.0)
+        manager.update(1 / 100)
+    assert manager.getSectionName() != "spikes"
+
+    manager.reset()
+    assert _ops(manager) == expected
+
+    manager.reset()
+    assert _ops(manager) == expected
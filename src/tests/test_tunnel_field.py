@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from gameplay.tunnel_field import TunnelField, np
+
+
+def _field(ring: bool) -> TunnelField:
+    field = TunnelField(screen_width=1280, default_floor_y=720, sample_step=4)
+    field.ring = ring
+    field._arrays = ring and np is not None
+    field.reset()
+    return field
+
+
+def test_shifted_and_ring_layouts_agree():
+    fields = [_field(ring=False), _field(ring=True)]
+    rng = random.Random(0)
+
+    scroll = 0.0
+    for _ in range(400):
+        scroll += rng.choice([0, 3, 4, 7, 40, 900, 5000])
+        x0 = scroll + 1300 + rng.uniform(-50, 50)
+        floor_y = rng.randint(400, 650)
+        ceiling_y = rng.randint(60, 250)
+        paint = rng.random() < 0.7
+
+        for field in fields:
+            field.scroll_to(scroll)
+            if paint:
+                field.paint_span(x0, x0 + 184, floor_y, ceiling_y)
+
+        xs = [scroll + x for x in range(0, 1680, 37)]
+        shifted, ring = fields
+        assert [shifted.floor_y_at(x) for x in xs] == [ring.floor_y_at(x) for x in xs]
+        assert [shifted.ceiling_y_at(x) for x in xs] == [ring.ceiling_y_at(x) for x in xs]
+
+
+def test_game_sized_field_shifts_a_list():
+    field = TunnelField(screen_width=1280, default_floor_y=720, sample_step=4)
+    assert not field.ring
+    assert TunnelField(screen_width=1280, default_floor_y=720, sample_step=1).ring
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+def test_numpy_scalars_take_the_scalar_path():
+    field = _field(ring=True)
+    field.paint_span(0, 2000, 500, 100)
+
+    for x in (np.float64(300.0), np.int64(300), np.float32(300.0)):
+        y = field.floor_y_at(x)
+        assert type(y) is float and y == 500.0
+
+    ys = field.floor_y_at(np.array([300.0, 600.0]))
+    assert list(ys) == [500.0, 500.0]